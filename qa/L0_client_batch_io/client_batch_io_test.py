@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import sys
+sys.path.append("../common")
+
+import timeit
+import unittest
+import numpy as np
+from functools import partial
+import queue
+from tensorrtserver.api import *
+import test_util as tu
+
+class ClientBatchIOTest(unittest.TestCase):
+    def setUp(self):
+        self.protocols_ = ((ProtocolType.HTTP, 'localhost:8000'),
+                           (ProtocolType.GRPC, 'localhost:8001'))
+
+    def _addsub_inputs(self, dtype, batch_size):
+        in0 = np.random.randint(low=0, high=100, size=(batch_size, 16)).astype(dtype)
+        in1 = np.random.randint(low=0, high=100, size=(batch_size, 16)).astype(dtype)
+        return in0, in1
+
+    def _check_raw_batch(self, dtype, batch_size):
+        model_name = tu.get_model_name("graphdef", dtype, dtype, dtype)
+        in0, in1 = self._addsub_inputs(dtype, batch_size)
+        if dtype == np.object:
+            in0 = np.array([str(x) for x in in0.flatten()], dtype=object).reshape(in0.shape)
+            in1 = np.array([str(x) for x in in1.flatten()], dtype=object).reshape(in1.shape)
+        inputs = { 'INPUT0' : [in0[b] for b in range(batch_size)],
+                   'INPUT1' : [in1[b] for b in range(batch_size)] }
+
+        for protocol, url in self.protocols_:
+            ctx = InferContext(url, protocol, model_name, None, True)
+            expected = ctx.run(inputs,
+                               { 'OUTPUT0' : InferContext.ResultFormat.RAW,
+                                 'OUTPUT1' : InferContext.ResultFormat.RAW },
+                               batch_size)
+            results = ctx.run(inputs,
+                              { 'OUTPUT0' : InferContext.ResultFormat.RAW_BATCH,
+                                'OUTPUT1' : InferContext.ResultFormat.RAW },
+                              batch_size)
+
+            output0 = results['OUTPUT0']
+            self.assertTrue(isinstance(output0, np.ndarray))
+            self.assertEqual(output0.shape, (batch_size, 16))
+            self.assertEqual(output0.dtype, expected['OUTPUT0'][0].dtype)
+            self.assertTrue(output0.flags['C_CONTIGUOUS'])
+            for b in range(batch_size):
+                self.assertTrue(np.array_equal(output0[b], expected['OUTPUT0'][b]))
+                self.assertTrue(np.array_equal(results['OUTPUT1'][b], expected['OUTPUT1'][b]))
+
+    def test_raw_batch_int32(self):
+        for batch_size in (1, 8):
+            self._check_raw_batch(np.int32, batch_size)
+
+    def test_raw_batch_fp32(self):
+        for batch_size in (1, 8):
+            self._check_raw_batch(np.float32, batch_size)
+
+    def test_raw_batch_object(self):
+        for batch_size in (1, 8):
+            self._check_raw_batch(np.object, batch_size)
+
+    def _check_batched_input(self, dtype, batch_size):
+        model_name = tu.get_model_name("graphdef", dtype, dtype, dtype)
+        in0, in1 = self._addsub_inputs(dtype, batch_size)
+        if dtype == np.object:
+            in0 = np.array([str(x) for x in in0.flatten()], dtype=object).reshape(in0.shape)
+            in1 = np.array([str(x) for x in in1.flatten()], dtype=object).reshape(in1.shape)
+        outputs = { 'OUTPUT0' : InferContext.ResultFormat.RAW,
+                    'OUTPUT1' : InferContext.ResultFormat.RAW }
+
+        for protocol, url in self.protocols_:
+            ctx = InferContext(url, protocol, model_name, None, True)
+            expected = ctx.run({ 'INPUT0' : [in0[b] for b in range(batch_size)],
+                                 'INPUT1' : [in1[b] for b in range(batch_size)] },
+                               outputs, batch_size)
+            results = ctx.run({ 'INPUT0' : in0, 'INPUT1' : in1 }, outputs, batch_size)
+            for b in range(batch_size):
+                self.assertTrue(np.array_equal(results['OUTPUT0'][b], expected['OUTPUT0'][b]))
+                self.assertTrue(np.array_equal(results['OUTPUT1'][b], expected['OUTPUT1'][b]))
+
+            # The batched input may be any strided view.
+            strided0 = np.stack([in0, in0], axis=1)[:, 1]
+            self.assertFalse(strided0.flags['C_CONTIGUOUS'])
+            results = ctx.run({ 'INPUT0' : strided0, 'INPUT1' : in1 }, outputs, batch_size)
+            for b in range(batch_size):
+                self.assertTrue(np.array_equal(results['OUTPUT0'][b], expected['OUTPUT0'][b]))
+
+    def test_batched_input_int32(self):
+        for batch_size in (1, 8):
+            self._check_batched_input(np.int32, batch_size)
+
+    def test_batched_input_fp32(self):
+        for batch_size in (1, 8):
+            self._check_batched_input(np.float32, batch_size)
+
+    def test_batched_input_object(self):
+        for batch_size in (1, 8):
+            self._check_batched_input(np.object, batch_size)
+
+    def test_batched_input_wrong_batch_size(self):
+        model_name = tu.get_model_name("graphdef", np.int32, np.int32, np.int32)
+        in0, in1 = self._addsub_inputs(np.int32, 4)
+        for protocol, url in self.protocols_:
+            ctx = InferContext(url, protocol, model_name, None, True)
+            with self.assertRaises(InferenceServerException) as cm:
+                ctx.run({ 'INPUT0' : in0, 'INPUT1' : in1 },
+                        { 'OUTPUT0' : InferContext.ResultFormat.RAW }, 2)
+            self.assertTrue("first dimension" in cm.exception.message())
+
+    def test_batched_input_perf(self):
+        model_name = tu.get_model_name("graphdef", np.float32, np.float32, np.float32)
+        outputs = { 'OUTPUT0' : InferContext.ResultFormat.RAW_BATCH,
+                    'OUTPUT1' : InferContext.ResultFormat.RAW_BATCH }
+        for protocol, url in self.protocols_:
+            ctx = InferContext(url, protocol, model_name)
+            for batch_size in (1, 2, 4, 8, 16, 32, 64, 128, 256):
+                in0, in1 = self._addsub_inputs(np.float32, batch_size)
+                list_inputs = { 'INPUT0' : [in0[b] for b in range(batch_size)],
+                                'INPUT1' : [in1[b] for b in range(batch_size)] }
+                batched_inputs = { 'INPUT0' : in0, 'INPUT1' : in1 }
+
+                number = 50
+                list_s = timeit.timeit(
+                    lambda: ctx.run(list_inputs, outputs, batch_size), number=number) / number
+                batched_s = timeit.timeit(
+                    lambda: ctx.run(batched_inputs, outputs, batch_size), number=number) / number
+                print("{} batch {:>3}: list {:10.6f}s vs batched {:10.6f}s ({:.2f}x)".format(
+                    protocol.name, batch_size, list_s, batched_s, list_s / batched_s))
+
+    def test_prepared_request(self):
+        batch_size = 4
+        model_name = tu.get_model_name("graphdef", np.int32, np.int32, np.int32)
+        outputs = { 'OUTPUT0' : InferContext.ResultFormat.RAW_BATCH,
+                    'OUTPUT1' : InferContext.ResultFormat.RAW_BATCH }
+        for protocol, url in self.protocols_:
+            ctx = InferContext(url, protocol, model_name, None, True)
+            prepared = ctx.prepare({ 'INPUT0' : [16], 'INPUT1' : [16] }, outputs, batch_size)
+            prepared_one = ctx.prepare({ 'INPUT0' : [16], 'INPUT1' : [16] },
+                                       { 'OUTPUT0' : InferContext.ResultFormat.RAW }, 1)
+
+            for _ in range(3):
+                in0, in1 = self._addsub_inputs(np.int32, batch_size)
+                results = prepared.run({ 'INPUT0' : in0, 'INPUT1' : in1 })
+                self.assertTrue(np.array_equal(results['OUTPUT0'], in0 + in1))
+                self.assertTrue(np.array_equal(results['OUTPUT1'], in0 - in1))
+
+                # Runs of other requests on the same context in between
+                # must not affect the prepared request.
+                results = ctx.run({ 'INPUT0' : in0[:1], 'INPUT1' : in1[:1] },
+                                  { 'OUTPUT1' : InferContext.ResultFormat.RAW }, 1)
+                self.assertTrue(np.array_equal(results['OUTPUT1'][0], in0[0] - in1[0]))
+                results = prepared_one.run({ 'INPUT0' : [in0[1]], 'INPUT1' : [in1[1]] })
+                self.assertTrue(np.array_equal(results['OUTPUT0'][0], in0[1] + in1[1]))
+
+                results = prepared.run({ 'INPUT0' : [in0[b] for b in range(batch_size)],
+                                         'INPUT1' : [in1[b] for b in range(batch_size)] })
+                self.assertTrue(np.array_equal(results['OUTPUT0'], in0 + in1))
+
+            completed = queue.Queue()
+            expected = dict()
+            for idx in range(4):
+                in0, in1 = self._addsub_inputs(np.int32, batch_size)
+                expected[idx] = in0 + in1
+                prepared.async_run(
+                    partial(lambda idx, ctx, request_id: completed.put((idx, request_id)), idx),
+                    { 'INPUT0' : in0, 'INPUT1' : in1 })
+            for _ in range(4):
+                idx, request_id = completed.get()
+                results = ctx.get_async_run_results(request_id)
+                self.assertTrue(np.array_equal(results['OUTPUT0'], expected[idx]))
+
+            prepared.close()
+            prepared_one.close()
+
+    def test_prepared_request_invalid(self):
+        model_name = tu.get_model_name("graphdef", np.int32, np.int32, np.int32)
+        outputs = { 'OUTPUT0' : InferContext.ResultFormat.RAW }
+        in0, in1 = self._addsub_inputs(np.int32, 2)
+        for protocol, url in self.protocols_:
+            ctx = InferContext(url, protocol, model_name, None, True)
+            with self.assertRaises(InferenceServerException):
+                ctx.prepare({ 'INPUT0' : [16], 'DUMMY' : [16] }, outputs, 2)
+
+            prepared = ctx.prepare({ 'INPUT0' : [16], 'INPUT1' : [16] }, outputs, 2)
+            with self.assertRaises(InferenceServerException) as cm:
+                prepared.run({ 'INPUT0' : in0[:1], 'INPUT1' : in1[:1] })
+            self.assertTrue("prepared for" in cm.exception.message())
+            with self.assertRaises(InferenceServerException) as cm:
+                prepared.run({ 'INPUT0' : in0 })
+            self.assertTrue("prepared inputs" in cm.exception.message())
+
+            prepared.close()
+            with self.assertRaises(InferenceServerException) as cm:
+                prepared.run({ 'INPUT0' : in0, 'INPUT1' : in1 })
+            self.assertTrue("closed" in cm.exception.message())
+
+    def test_prepared_request_perf(self):
+        model_name = tu.get_model_name("graphdef", np.float32, np.float32, np.float32)
+        outputs = { 'OUTPUT0' : InferContext.ResultFormat.RAW_BATCH,
+                    'OUTPUT1' : InferContext.ResultFormat.RAW_BATCH }
+        for protocol, url in self.protocols_:
+            ctx = InferContext(url, protocol, model_name)
+            for batch_size in (1, 8, 64):
+                in0, in1 = self._addsub_inputs(np.float32, batch_size)
+                inputs = { 'INPUT0' : in0, 'INPUT1' : in1 }
+                prepared = ctx.prepare({ 'INPUT0' : [16], 'INPUT1' : [16] }, outputs, batch_size)
+
+                number = 200
+                run_s = timeit.timeit(
+                    lambda: ctx.run(inputs, outputs, batch_size), number=number) / number
+                prepared_s = timeit.timeit(
+                    lambda: prepared.run(inputs), number=number) / number
+                print("{} batch {:>3}: run {:10.6f}s vs prepared {:10.6f}s ({:.2f}x)".format(
+                    protocol.name, batch_size, run_s, prepared_s, run_s / prepared_s))
+                prepared.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import sys
+sys.path.append("../common")
+
+import asyncio
+import threading
+import unittest
+import numpy as np
+from tensorrtserver.api import *
+import test_util as tu
+
+class BatchingClientTest(unittest.TestCase):
+    def setUp(self):
+        self.protocols_ = ((ProtocolType.HTTP, 'localhost:8000'),
+                           (ProtocolType.GRPC, 'localhost:8001'))
+        self.model_name_ = tu.get_model_name("graphdef", np.int32, np.int32, np.int32)
+        self.outputs_ = { 'OUTPUT0' : InferContext.ResultFormat.RAW,
+                          'OUTPUT1' : InferContext.ResultFormat.RAW_BATCH }
+
+    def _inputs(self, idx):
+        in0 = np.full((16,), idx, dtype=np.int32)
+        in1 = np.arange(16, dtype=np.int32)
+        return { 'INPUT0' : in0, 'INPUT1' : [in1] }, in0 + in1, in0 - in1
+
+    def _check_results(self, results, expected0, expected1):
+        self.assertEqual(len(results['OUTPUT0']), 1)
+        self.assertTrue(np.array_equal(results['OUTPUT0'][0], expected0))
+        self.assertEqual(results['OUTPUT1'].shape, (1, 16))
+        self.assertTrue(np.array_equal(results['OUTPUT1'][0], expected1))
+
+    def test_threads(self):
+        thread_count = 16
+        request_count = 20
+        for protocol, url in self.protocols_:
+            with BatchingInferClient(url, protocol, self.model_name_,
+                                     max_delay_us=5000) as client:
+                self.assertEqual(client.max_batch_size(), 8)
+                errors = list()
+
+                def worker(thread_idx):
+                    try:
+                        for i in range(request_count):
+                            inputs, expected0, expected1 = self._inputs(
+                                thread_idx * request_count + i)
+                            self._check_results(client.run(inputs, self.outputs_),
+                                                expected0, expected1)
+                    except Exception as ex:
+                        errors.append(ex)
+
+                threads = [threading.Thread(target=worker, args=(t,))
+                           for t in range(thread_count)]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+                self.assertEqual(errors, [])
+
+                # Each batch holds at most 8 requests, and the requests
+                # of the concurrent threads must have been batched.
+                batch_count = client.get_stat()["completed_request_count"]
+                self.assertGreaterEqual(batch_count, thread_count * request_count / 8)
+                self.assertLess(batch_count, thread_count * request_count)
+
+    def test_asyncio(self):
+        request_count = 32
+        for protocol, url in self.protocols_:
+            with BatchingInferClient(url, protocol, self.model_name_,
+                                     max_batch_size=4) as client:
+                self.assertEqual(client.max_batch_size(), 4)
+
+                async def run_all():
+                    futures = [asyncio.wrap_future(
+                        client.submit(self._inputs(idx)[0], self.outputs_))
+                               for idx in range(request_count)]
+                    return await asyncio.gather(*futures)
+
+                results = asyncio.get_event_loop().run_until_complete(run_all())
+                for idx in range(request_count):
+                    _, expected0, expected1 = self._inputs(idx)
+                    self._check_results(results[idx], expected0, expected1)
+                batch_count = client.get_stat()["completed_request_count"]
+                self.assertGreaterEqual(batch_count, request_count / 4)
+                self.assertLess(batch_count, request_count)
+
+    def test_error(self):
+        for protocol, url in self.protocols_:
+            with BatchingInferClient(url, protocol, self.model_name_) as client:
+                inputs, _, _ = self._inputs(0)
+                with self.assertRaises(InferenceServerException):
+                    client.run(inputs, { 'OUTPUT2' : InferContext.ResultFormat.RAW })
+                with self.assertRaises(InferenceServerException):
+                    client.run({ 'INPUT0' : [inputs['INPUT0'], inputs['INPUT0']] },
+                               self.outputs_)
+
+            with self.assertRaises(InferenceServerException):
+                client.run(inputs, self.outputs_)
+
+    def test_nobatch(self):
+        model_name = tu.get_model_name("graphdef_nobatch", np.int32, np.int32, np.int32)
+        for protocol, url in self.protocols_:
+            with self.assertRaises(InferenceServerException) as cm:
+                BatchingInferClient(url, protocol, model_name)
+            self.assertIn("does not support batching", cm.exception.message())
+
+if __name__ == '__main__':
+    unittest.main()
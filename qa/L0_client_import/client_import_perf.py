@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import argparse
+import subprocess
+import sys
+
+FLAGS = None
+
+def _import_ms(module, repeat):
+    # Each measurement is taken in a fresh interpreter so that nothing
+    # is already imported.
+    statement = ('import time; start = time.perf_counter(); import {}; ' +
+                 'print((time.perf_counter() - start) * 1000)').format(module)
+    times = list()
+    for _ in range(repeat):
+        out = subprocess.check_output([sys.executable, '-c', statement])
+        times.append(float(out))
+    times.sort()
+    return times[len(times) // 2]
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-r', '--repeat', type=int, required=False, default=20,
+                        help='Number of imports measured for each module. Default is 20.')
+    parser.add_argument('-m', '--max-overhead-ms', type=float, required=False, default=50,
+                        help='Fail if importing tensorrtserver.api takes longer than ' +
+                        'this, in milliseconds, on top of importing numpy. Default is 50.')
+    FLAGS = parser.parse_args()
+
+    # numpy is a dependency of the client that is loaded in any case
+    numpy_ms = _import_ms('numpy', FLAGS.repeat)
+    api_ms = _import_ms('tensorrtserver.api', FLAGS.repeat)
+    overhead_ms = api_ms - numpy_ms
+
+    print("{:<24} {:>12}".format("module", "median (ms)"))
+    print("{:<24} {:>12.1f}".format("numpy", numpy_ms))
+    print("{:<24} {:>12.1f}".format("tensorrtserver.api", api_ms))
+    print("{:<24} {:>12.1f}".format("overhead", overhead_ms))
+
+    if overhead_ms > FLAGS.max_overhead_ms:
+        print("error: import overhead {:.1f} ms exceeds {:.1f} ms".format(
+            overhead_ms, FLAGS.max_overhead_ms))
+        sys.exit(1)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+import subprocess
+import sys
+import unittest
+
+# Prints what a fresh interpreter has loaded after running the given
+# statements.
+_PROBE = '''
+import json
+import sys
+{}
+import tensorrtserver.api as api
+with open('/proc/self/maps') as f:
+    maps = f.read()
+print(json.dumps({{
+    'modules' : sorted(m for m in sys.modules
+                       if m.startswith(('pkg_resources', 'google.protobuf')) or
+                       m.endswith('_pb2')),
+    'crequest_loaded' : 'libcrequest' in maps,
+    'lazy_functions' : sorted(name for (name, value) in vars(api).items()
+                              if type(value).__name__ == '_LazyFunction'),
+}}))
+'''
+
+def _probe(statements=''):
+    out = subprocess.check_output(
+        [sys.executable, '-c', _PROBE.format(statements)])
+    return json.loads(out.decode())
+
+class ClientImportTest(unittest.TestCase):
+
+    def test_import(self):
+        # Importing the client loads neither the client libraries nor
+        # pkg_resources and the protobuf modules.
+        probe = _probe('import tensorrtserver.api')
+        self.assertEqual(probe['modules'], [])
+        self.assertFalse(probe['crequest_loaded'])
+        self.assertIn('_crequest_infer_ctx_run', probe['lazy_functions'])
+        self.assertIn('_crequest_error_new', probe['lazy_functions'])
+
+    def test_protobuf_access(self):
+        probe = _probe('from tensorrtserver.api import InferRequestHeader')
+        self.assertIn('tensorrtserver.api.api_pb2', probe['modules'])
+        self.assertNotIn('tensorrtserver.api.server_status_pb2', probe['modules'])
+        self.assertFalse(probe['crequest_loaded'])
+
+    def test_star_import(self):
+        # The star import exports the protobuf names as before.
+        probe = _probe('from tensorrtserver.api import *\n' +
+                       'assert InferRequestHeader.FLAG_NONE == 0\n' +
+                       'assert callable(ServerStatus)\n' +
+                       'assert InferContext is not None')
+        self.assertIn('tensorrtserver.api.api_pb2', probe['modules'])
+        self.assertIn('tensorrtserver.api.server_status_pb2', probe['modules'])
+
+    def test_first_call(self):
+        # Only the functions that were called are bound.
+        probe = _probe('import tensorrtserver.api as api\n' +
+                       'api.ServerHealthContext("localhost:8000", api.ProtocolType.HTTP).close()')
+        self.assertTrue(probe['crequest_loaded'])
+        self.assertNotIn('_crequest_health_ctx_new', probe['lazy_functions'])
+        self.assertNotIn('_crequest_health_ctx_del', probe['lazy_functions'])
+        self.assertIn('_crequest_infer_ctx_run', probe['lazy_functions'])
+        self.assertNotIn('pkg_resources', probe['modules'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import sys
+sys.path.append("../common")
+
+import argparse
+import subprocess
+import time
+import numpy as np
+import tritongrpcclient.core as grpcclient
+
+FLAGS = None
+
+def _throughput_mb_s(client, input_data, compression_algorithm, iterations):
+    inputs = [grpcclient.InferInput('INPUT0')]
+    inputs[0].set_data_from_numpy(input_data)
+    outputs = [grpcclient.InferOutput('OUTPUT0')]
+
+    # Warm up the connection
+    client.infer(inputs, outputs, FLAGS.model_name,
+                 compression_algorithm=compression_algorithm)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        client.infer(inputs, outputs, FLAGS.model_name,
+                     compression_algorithm=compression_algorithm)
+    elapsed_s = time.perf_counter() - start
+    return input_data.nbytes * iterations / elapsed_s / (1024 * 1024)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-u', '--url', type=str, required=False, default=None,
+                        help='Inference server URL. Default is to start a mock ' +
+                        'server, see ../common/grpc_v2_mock_server.py.')
+    parser.add_argument('-m', '--model-name', type=str, required=False, default='identity',
+                        help='Name of an FP32 identity model with a variable-size ' +
+                        'INPUT0 and OUTPUT0. Default is identity.')
+    parser.add_argument('-i', '--iterations', type=int, required=False, default=20,
+                        help='Number of requests for each measurement. Default is 20.')
+    FLAGS = parser.parse_args()
+
+    server = None
+    url = FLAGS.url
+    if url is None:
+        # The mock server runs in its own process so that it does not
+        # compete with the client for the interpreter lock.
+        server = subprocess.Popen(
+            [sys.executable, '../common/grpc_v2_mock_server.py', 'localhost:0'],
+            stdout=subprocess.PIPE)
+        url = server.stdout.readline().decode().strip()
+
+    try:
+        client = grpcclient.InferenceServerClient(url, max_message_size=-1)
+        print("{:>8} {:>8} {:>14} {:>14} {:>14}".format(
+            "tensor", "data", "none (MB/s)", "gzip (MB/s)", "deflate (MB/s)"))
+        for element_count in (16 * 1024, 256 * 1024, 4 * 1024 * 1024):
+            # Zeros compress well, uniform random values hardly at all
+            for data, input_data in (
+                    ("zeros", np.zeros(element_count, dtype=np.float32)),
+                    ("random", np.random.random(element_count).astype(np.float32))):
+                throughputs = [
+                    _throughput_mb_s(client, input_data, compression_algorithm,
+                                     FLAGS.iterations)
+                    for compression_algorithm in (None, 'gzip', 'deflate')
+                ]
+                print("{:>7}K {:>8} {:>14.1f} {:>14.1f} {:>14.1f}".format(
+                    input_data.nbytes // 1024, data, *throughputs))
+        client.close()
+    finally:
+        if server is not None:
+            server.kill()
+            server.wait()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import sys
+sys.path.append("../common")
+
+import gc
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import grpc
+import numpy as np
+import tritongrpcclient.core as grpcclient
+from grpc_v2_mock_server import MockServer
+
+
+class GrpcV2ChannelTest(unittest.TestCase):
+    def setUp(self):
+        self.server_ = MockServer()
+
+    def tearDown(self):
+        self.server_.stop()
+
+    def _identity(self, client, input_data, **kwargs):
+        inputs = [grpcclient.InferInput('INPUT0')]
+        inputs[0].set_data_from_numpy(input_data)
+        outputs = [grpcclient.InferOutput('OUTPUT0')]
+        return client.infer(inputs, outputs, 'identity', **kwargs).as_numpy('OUTPUT0')
+
+    def test_max_message_size(self):
+        # The 8 MB response exceeds the default gRPC limit of 4 MB
+        input_data = np.arange(2 * 1024 * 1024, dtype=np.float32)
+        client = grpcclient.InferenceServerClient(self.server_.url)
+        with self.assertRaises(grpcclient.InferenceServerException) as ctx:
+            self._identity(client, input_data)
+        self.assertEqual(ctx.exception.status(), str(grpc.StatusCode.RESOURCE_EXHAUSTED))
+        client.close()
+
+        client = grpcclient.InferenceServerClient(self.server_.url, max_message_size=-1)
+        self.assertTrue(np.array_equal(self._identity(client, input_data), input_data))
+        client.close()
+
+    def test_compression(self):
+        input_data = np.zeros(64 * 1024, dtype=np.float32)
+        client = grpcclient.InferenceServerClient(self.server_.url)
+        for compression_algorithm in (None, 'gzip', 'deflate'):
+            self.assertTrue(np.array_equal(
+                self._identity(client, input_data,
+                               compression_algorithm=compression_algorithm),
+                input_data))
+
+        with self.assertRaises(grpcclient.InferenceServerException) as ctx:
+            self._identity(client, input_data, compression_algorithm='lz4')
+        self.assertEqual(ctx.exception.message(), "unsupported compression algorithm 'lz4'")
+        self.assertEqual(client.get_outstanding_request_count(), 0)
+        client.close()
+
+    def test_async_compression(self):
+        input_data = np.zeros(64 * 1024, dtype=np.float32)
+        client = grpcclient.InferenceServerClient(self.server_.url)
+        completed = threading.Event()
+        results = []
+
+        def callback(result):
+            results.append(result.as_numpy('OUTPUT0'))
+            completed.set()
+
+        inputs = [grpcclient.InferInput('INPUT0')]
+        inputs[0].set_data_from_numpy(input_data)
+        client.async_infer(callback, inputs, [grpcclient.InferOutput('OUTPUT0')],
+                           'identity', compression_algorithm='gzip')
+        self.assertTrue(completed.wait(30))
+        self.assertTrue(np.array_equal(results[0], input_data))
+        client.close()
+
+    def test_channel_count(self):
+        # The requests are spread over a connection for each channel
+        input_data = np.arange(16, dtype=np.float32)
+        client = grpcclient.InferenceServerClient(self.server_.url, channel_count=4)
+        for _ in range(16):
+            self.assertTrue(np.array_equal(self._identity(client, input_data), input_data))
+        self.assertEqual(self.server_.request_count, 16)
+        self.assertEqual(len(self.server_.peers), 4)
+        client.close()
+
+        # The client that fails to be created is closed cleanly
+        unraisable = []
+        unraisablehook = sys.unraisablehook
+        sys.unraisablehook = unraisable.append
+        try:
+            for channel_count in (0, -1):
+                with self.assertRaises(grpcclient.InferenceServerException) as ctx:
+                    grpcclient.InferenceServerClient(self.server_.url,
+                                                     channel_count=channel_count)
+                self.assertEqual(ctx.exception.message(), "channel_count must be at least 1")
+                del ctx
+                gc.collect()
+        finally:
+            sys.unraisablehook = unraisablehook
+        self.assertEqual(unraisable, [])
+
+    def test_keepalive_options(self):
+        input_data = np.arange(16, dtype=np.float32)
+        client = grpcclient.InferenceServerClient(
+            self.server_.url,
+            keepalive_options=grpcclient.KeepAliveOptions(
+                keepalive_time_ms=10000, keepalive_timeout_ms=5000),
+            channel_args=[('grpc.initial_reconnect_backoff_ms', 100)])
+        self.assertTrue(np.array_equal(self._identity(client, input_data), input_data))
+        client.close()
+
+    def test_unix_domain_socket(self):
+        socket_dir = tempfile.mkdtemp()
+        server = MockServer(address='unix:' + os.path.join(socket_dir, 'grpc.sock'))
+        try:
+            input_data = np.arange(16, dtype=np.float32)
+            client = grpcclient.InferenceServerClient(server.url)
+            self.assertTrue(client.is_server_ready())
+            self.assertTrue(np.array_equal(self._identity(client, input_data), input_data))
+            self.assertEqual(server.request_count, 1)
+            client.close()
+        finally:
+            server.stop()
+            shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+    def test_stream_callback_error(self):
+        # A failing callback does not stop the responses that follow
+        client = grpcclient.InferenceServerClient(self.server_.url)
+        results = []
+
+        def callback(result, error):
+            self.assertIsNone(error)
+            results.append(result.as_numpy('OUTPUT0'))
+            if len(results) == 2:
+                raise ValueError("callback failed")
+
+        client.start_stream(callback)
+        for index in range(4):
+            inputs = [grpcclient.InferInput('INPUT0')]
+            inputs[0].set_data_from_numpy(np.full(16, index, dtype=np.int32))
+            client.async_stream_infer(inputs, [grpcclient.InferOutput('OUTPUT0')], 'identity')
+        with self.assertRaises(ValueError):
+            client.stop_stream()
+        self.assertEqual(len(results), 4)
+        for index, output_data in enumerate(results):
+            self.assertTrue(np.array_equal(output_data, np.full(16, index, dtype=np.int32)))
+
+        # The client can start a new stream
+        client.start_stream(callback)
+        client.stop_stream()
+        client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
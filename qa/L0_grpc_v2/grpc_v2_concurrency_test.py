@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import threading
+import unittest
+import numpy as np
+import tritongrpcclient.core as grpcclient
+
+
+class GrpcV2ConcurrencyTest(unittest.TestCase):
+    def setUp(self):
+        self.url_ = "localhost:8001"
+        self.model_name_ = "simple"
+
+    def _prepare_request(self, index):
+        input0_data = np.full((1, 16), index, dtype=np.int32)
+        input1_data = np.arange(16, dtype=np.int32).reshape(1, 16)
+        inputs = [grpcclient.InferInput('INPUT0'), grpcclient.InferInput('INPUT1')]
+        inputs[0].set_data_from_numpy(input0_data)
+        inputs[1].set_data_from_numpy(input1_data)
+        outputs = [grpcclient.InferOutput('OUTPUT0'), grpcclient.InferOutput('OUTPUT1')]
+        return inputs, outputs, input0_data + input1_data
+
+    def test_shared_client_threads(self):
+        # Every thread checks that it gets the response to its own
+        # request from the shared client.
+        client = grpcclient.InferenceServerClient(self.url_)
+        errors = []
+
+        def worker(thread_idx):
+            try:
+                for i in range(20):
+                    index = thread_idx * 100 + i
+                    inputs, outputs, expected = self._prepare_request(index)
+                    result = client.infer(inputs, outputs, self.model_name_,
+                                          request_id=str(index))
+                    if not np.array_equal(result.as_numpy('OUTPUT0'), expected):
+                        errors.append("thread {} got wrong result for request {}".format(
+                            thread_idx, index))
+            except Exception as ex:
+                errors.append(str(ex))
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(32)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(client.get_outstanding_request_count(), 0)
+        client.close()
+
+    def test_async_max_outstanding(self):
+        max_outstanding = 4
+        request_count = 64
+        client = grpcclient.InferenceServerClient(
+            self.url_, max_outstanding_requests=max_outstanding)
+
+        lock = threading.Lock()
+        completed = threading.Semaphore(0)
+        results = dict()
+        observed = []
+
+        def callback(index, result):
+            with lock:
+                results[index] = result
+            completed.release()
+
+        expected = dict()
+        for index in range(request_count):
+            inputs, outputs, expected[index] = self._prepare_request(index)
+            client.async_infer(
+                lambda result, index=index: callback(index, result),
+                inputs, outputs, self.model_name_)
+            observed.append(client.get_outstanding_request_count())
+
+        for _ in range(request_count):
+            self.assertTrue(completed.acquire(timeout=30))
+
+        self.assertLessEqual(max(observed), max_outstanding)
+        self.assertEqual(len(results), request_count)
+        for index in range(request_count):
+            self.assertTrue(
+                np.array_equal(results[index].as_numpy('OUTPUT0'), expected[index]))
+        self.assertEqual(client.get_outstanding_request_count(), 0)
+        client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+import numpy as np
+import tritongrpcclient.core as grpcclient
+from tritongrpcclient import grpc_service_v2_pb2
+from tritongrpcclient.utils import serialize_byte_tensor
+
+
+class GrpcV2InferResultTest(unittest.TestCase):
+    def _result(self, response):
+        return grpcclient.InferResult(response)
+
+    def _add_output(self, response, name, datatype, shape):
+        output = response.outputs.add()
+        output.name = name
+        output.datatype = datatype
+        output.shape.extend(shape)
+        return output
+
+    def test_many_outputs(self):
+        response = grpc_service_v2_pb2.ModelInferResponse()
+        expected = {}
+        for i in range(48):
+            name = "OUTPUT{}".format(i)
+            expected[name] = np.full((2, 8), i, dtype=np.float32)
+            output = self._add_output(response, name, "FP32", [2, 8])
+            output.contents.raw_contents = expected[name].tobytes()
+
+        result = self._result(response)
+        for name in reversed(list(expected)):
+            np_array = result.as_numpy(name)
+            self.assertEqual(np_array.shape, (2, 8))
+            self.assertEqual(np_array.dtype, np.float32)
+            self.assertTrue(np.array_equal(np_array, expected[name]))
+
+            # Decoded once, later calls return the same array
+            self.assertIs(result.as_numpy(name), np_array)
+
+        self.assertIsNone(result.as_numpy("OUTPUT48"))
+
+    def test_read_only(self):
+        response = grpc_service_v2_pb2.ModelInferResponse()
+        output = self._add_output(response, "OUTPUT0", "INT32", [4, 4])
+        output.contents.raw_contents = np.arange(16, dtype=np.int32).tobytes()
+        output = self._add_output(response, "OUTPUT1", "BYTES", [2, 2])
+        output.contents.raw_contents = serialize_byte_tensor(
+            np.array(["a", "bc", "def", "ghij"], dtype=np.object)).tobytes()
+
+        result = self._result(response)
+        for name in ("OUTPUT0", "OUTPUT1"):
+            np_array = result.as_numpy(name)
+            self.assertFalse(np_array.flags.writeable)
+            with self.assertRaises(ValueError):
+                np_array[0, 0] = np_array[1, 1]
+
+        self.assertTrue(
+            np.array_equal(result.as_numpy("OUTPUT0"),
+                           np.arange(16, dtype=np.int32).reshape(4, 4)))
+        self.assertEqual(result.as_numpy("OUTPUT1").shape, (2, 2))
+        self.assertEqual(result.as_numpy("OUTPUT1")[1, 1], b"ghij")
+
+    def test_byte_contents(self):
+        response = grpc_service_v2_pb2.ModelInferResponse()
+        output = self._add_output(response, "OUTPUT0", "BYTES", [1, 2])
+        output.contents.byte_contents.extend([b"0:1.5:a", b"1:0.5:b"])
+
+        np_array = self._result(response).as_numpy("OUTPUT0")
+        self.assertEqual(np_array.shape, (1, 2))
+        self.assertEqual(np_array[0, 1], b"1:0.5:b")
+
+    def test_typed_contents(self):
+        response = grpc_service_v2_pb2.ModelInferResponse()
+        expected = {
+            "BOOL": ("bool_contents", np.array([True, False, True])),
+            "INT8": ("int_contents", np.array([-128, 0, 127], dtype=np.int8)),
+            "INT16": ("int_contents", np.array([-32768, 1, 32767], dtype=np.int16)),
+            "INT32": ("int_contents", np.array([-(1 << 31), -1, (1 << 31) - 1], dtype=np.int32)),
+            "INT64": ("int64_contents", np.array([-(1 << 63), -1, (1 << 63) - 1], dtype=np.int64)),
+            "UINT8": ("uint_contents", np.array([0, 128, 255], dtype=np.uint8)),
+            "UINT16": ("uint_contents", np.array([0, 300, 65535], dtype=np.uint16)),
+            "UINT32": ("uint_contents", np.array([0, 1 << 20, (1 << 32) - 1], dtype=np.uint32)),
+            "UINT64": ("uint64_contents", np.array([0, 1 << 40, (1 << 64) - 1], dtype=np.uint64)),
+            "FP32": ("fp32_contents", np.array([-1.5, 0, 3.25], dtype=np.float32)),
+            "FP64": ("fp64_contents", np.array([-1e300, 0, 1e-300], dtype=np.float64)),
+        }
+        for datatype, (field, values) in expected.items():
+            output = self._add_output(response, datatype, datatype, [1, 3])
+            getattr(output.contents, field).extend(values.tolist())
+
+        result = self._result(response)
+        for datatype, (field, values) in expected.items():
+            np_array = result.as_numpy(datatype)
+            self.assertEqual(np_array.dtype, values.dtype)
+            self.assertEqual(np_array.shape, (1, 3))
+            self.assertTrue(np.array_equal(np_array[0], values))
+
+    def test_empty_output(self):
+        response = grpc_service_v2_pb2.ModelInferResponse()
+        self._add_output(response, "OUTPUT0", "INT32", [0, 16])
+
+        np_array = self._result(response).as_numpy("OUTPUT0")
+        self.assertEqual(np_array.shape, (0, 16))
+        self.assertEqual(np_array.dtype, np.int32)
+
+
+class GrpcV2EncodedInferResultTest(GrpcV2InferResultTest):
+    """Runs the same tests on responses in the wire format, as received
+    by infer(), as well as tests specific to that format.
+    """
+
+    def _result(self, response):
+        return grpcclient.InferResult(
+            grpcclient._EncodedInferResponse(response.SerializeToString()))
+
+    def test_views(self):
+        response = grpc_service_v2_pb2.ModelInferResponse(model_name="simple")
+        response.statistics.success.count = 1
+        for i in range(4):
+            output = self._add_output(response, "OUTPUT{}".format(i), "FP32", [2, 1024])
+            output.contents.raw_contents = np.full((2, 1024), i, dtype=np.float32).tobytes()
+        buffer = response.SerializeToString()
+        encoded = grpcclient._EncodedInferResponse(buffer)
+        result = grpcclient.InferResult(encoded)
+
+        # The array is a view of the received message, which is not
+        # parsed by protobuf
+        np_array = result.as_numpy("OUTPUT2")
+        self.assertTrue(np.array_equal(np_array, np.full((2, 1024), 2, dtype=np.float32)))
+        self.assertTrue(np.shares_memory(np_array, np.frombuffer(buffer, dtype=np.uint8)))
+        self.assertIsNone(encoded._message)
+        self.assertEqual(list(result._output_arrays), ["OUTPUT2"])
+
+        self.assertEqual(result.get_response(), response)
+        self.assertEqual(result.get_statistics().success.count, 1)
+
+    def test_unpacked_shape(self):
+        # A shape encoded as one varint per dimension, which parsers
+        # must accept, and a negative dimension
+        contents = grpc_service_v2_pb2.InferTensorContents(
+            raw_contents=np.arange(6, dtype=np.int32).tobytes()).SerializeToString()
+        serialized_output = (b"\x0a\x07OUTPUT0\x12\x05INT32\x18\x02\x18\x03\x22" +
+                             bytes([len(contents)]) + contents)
+        buffer = b"\x3a" + bytes([len(serialized_output)]) + serialized_output
+        encoded = grpcclient._EncodedInferResponse(buffer)
+        self.assertEqual(encoded._get_message().outputs[0].shape, [2, 3])
+        np_array = grpcclient.InferResult(encoded).as_numpy("OUTPUT0")
+        self.assertTrue(np.array_equal(np_array, np.arange(6, dtype=np.int32).reshape(2, 3)))
+
+        output = grpc_service_v2_pb2.ModelInferResponse.InferOutputTensor(
+            name="OUTPUT0", datatype="INT32", shape=[-1, 2])
+        response = grpc_service_v2_pb2.ModelInferResponse()
+        response.outputs.extend([output])
+        outputs = grpcclient._EncodedInferResponse(response.SerializeToString())._get_outputs()
+        self.assertEqual(outputs["OUTPUT0"].shape, [-1, 2])
+
+    def test_unpacked_typed_contents(self):
+        # Repeated numeric fields one value per field, which parsers must
+        # accept, and contents split over two fields, which are merged
+        contents0 = b"\x18\x05\x18\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01"
+        contents1 = grpc_service_v2_pb2.InferTensorContents(
+            int_contents=[7, 8]).SerializeToString()
+        serialized_output = (b"\x0a\x07OUTPUT0\x12\x05INT32\x1a\x01\x04" +
+                             b"\x22" + bytes([len(contents0)]) + contents0 +
+                             b"\x22" + bytes([len(contents1)]) + contents1)
+        buffer = b"\x3a" + bytes([len(serialized_output)]) + serialized_output
+        encoded = grpcclient._EncodedInferResponse(buffer)
+        self.assertEqual(list(encoded._get_message().outputs[0].contents.int_contents),
+                         [5, -1, 7, 8])
+        np_array = grpcclient.InferResult(encoded).as_numpy("OUTPUT0")
+        self.assertTrue(np.array_equal(np_array, np.array([5, -1, 7, 8], dtype=np.int32)))
+
+    def test_truncated(self):
+        response = grpc_service_v2_pb2.ModelInferResponse()
+        output = self._add_output(response, "OUTPUT0", "INT32", [16])
+        output.contents.raw_contents = np.arange(16, dtype=np.int32).tobytes()
+        serialized = response.SerializeToString()
+        # The response holds a single field, so cutting it anywhere but
+        # at the start leaves a field that runs past the end.
+        for cut in range(len(serialized)):
+            result = grpcclient.InferResult(
+                grpcclient._EncodedInferResponse(serialized[:cut]))
+            if cut == 0:
+                self.assertIsNone(result.as_numpy("OUTPUT0"))
+                continue
+            with self.assertRaises(grpcclient.InferenceServerException):
+                result.as_numpy("OUTPUT0")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,330 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import sys
+sys.path.append("../common")
+
+import threading
+import time
+import unittest
+import grpc
+import numpy as np
+import tritongrpcclient.core as grpcclient
+from grpc_v2_mock_server import MockServer
+
+
+class _MockServerTest(unittest.TestCase):
+    def setUp(self):
+        self.model_name_ = "simple"
+        self.servers_ = []
+
+    def tearDown(self):
+        for server in self.servers_:
+            server.stop()
+
+    def _start_servers(self, delays_s, jitter_s=0):
+        self.servers_ = [MockServer(delay_s, jitter_s) for delay_s in delays_s]
+        return [server.url for server in self.servers_]
+
+    def _prepare_request(self, index):
+        input0_data = np.full((1, 16), index, dtype=np.int32)
+        input1_data = np.arange(16, dtype=np.int32).reshape(1, 16)
+        inputs = [grpcclient.InferInput('INPUT0'), grpcclient.InferInput('INPUT1')]
+        inputs[0].set_data_from_numpy(input0_data)
+        inputs[1].set_data_from_numpy(input1_data)
+        outputs = [grpcclient.InferOutput('OUTPUT0')]
+        return inputs, outputs, input0_data + input1_data
+
+    def _infer(self, client, index, sequence_id=0):
+        inputs, outputs, expected = self._prepare_request(index)
+        result = client.infer(inputs, outputs, self.model_name_,
+                              sequence_id=sequence_id)
+        self.assertTrue(np.array_equal(result.as_numpy('OUTPUT0'), expected))
+
+    def _wait_ready(self, client, url, ready):
+        for _ in range(100):
+            if client.get_endpoint_stats()[url]['ready'] == ready:
+                return
+            time.sleep(0.02)
+        self.assertTrue(False, "readiness of " + url + " did not change")
+
+
+class GrpcV2LoadBalanceTest(_MockServerTest):
+
+    def test_latency_aware(self):
+        # Most of the requests go to the server that answers faster
+        urls = self._start_servers((0, 0.02))
+        client = grpcclient.LoadBalancedInferenceServerClient(urls)
+        errors = []
+
+        def worker(thread_idx):
+            try:
+                for i in range(25):
+                    self._infer(client, thread_idx * 100 + i)
+            except Exception as ex:
+                errors.append(str(ex))
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(errors, [])
+        fast_count = self.servers_[0].request_count
+        slow_count = self.servers_[1].request_count
+        self.assertEqual(fast_count + slow_count, 200)
+        self.assertGreater(fast_count, 2 * slow_count)
+        stats = client.get_endpoint_stats()
+        self.assertLess(stats[urls[0]]['latency_s'], stats[urls[1]]['latency_s'])
+        self.assertEqual(client.get_outstanding_request_count(), 0)
+        client.close()
+
+    def test_async_infer(self):
+        request_count = 64
+        urls = self._start_servers((0.001, 0.001, 0.001))
+        client = grpcclient.LoadBalancedInferenceServerClient(urls)
+
+        lock = threading.Lock()
+        completed = threading.Semaphore(0)
+        results = dict()
+
+        def callback(index, result):
+            with lock:
+                results[index] = result
+            completed.release()
+
+        expected = dict()
+        for index in range(request_count):
+            inputs, outputs, expected[index] = self._prepare_request(index)
+            client.async_infer(
+                lambda result, index=index: callback(index, result),
+                inputs, outputs, self.model_name_)
+
+        for _ in range(request_count):
+            self.assertTrue(completed.acquire(timeout=30))
+        for index in range(request_count):
+            self.assertTrue(
+                np.array_equal(results[index].as_numpy('OUTPUT0'), expected[index]))
+        for server in self.servers_:
+            self.assertGreater(server.request_count, 0)
+        self.assertEqual(
+            sum(stats['request_count'] for stats in client.get_endpoint_stats().values()),
+            request_count)
+        client.close()
+
+    def test_not_ready(self):
+        # A server that is not ready is not sent requests until it is
+        # ready again
+        urls = self._start_servers((0, 0))
+        client = grpcclient.LoadBalancedInferenceServerClient(
+            urls, health_check_interval_s=0.05)
+
+        self.servers_[1].ready = False
+        self._wait_ready(client, urls[1], False)
+        for index in range(20):
+            self._infer(client, index)
+        self.assertEqual(self.servers_[0].request_count, 20)
+        self.assertEqual(self.servers_[1].request_count, 0)
+
+        self.servers_[1].ready = True
+        self._wait_ready(client, urls[1], True)
+        for index in range(20):
+            self._infer(client, index)
+        self.assertGreater(self.servers_[1].request_count, 0)
+        client.close()
+
+    def test_unavailable(self):
+        # A server that fails a request as unavailable is taken out
+        urls = self._start_servers((0, 0))
+        client = grpcclient.LoadBalancedInferenceServerClient(
+            urls, health_check_interval_s=None)
+        self.servers_[1].stop()
+
+        failure_count = 0
+        for index in range(20):
+            try:
+                self._infer(client, index)
+            except grpcclient.InferenceServerException as ex:
+                self.assertEqual(ex.status(), str(grpc.StatusCode.UNAVAILABLE))
+                failure_count += 1
+        self.assertLessEqual(failure_count, 1)
+        self.assertEqual(self.servers_[0].request_count, 20 - failure_count)
+        self.assertFalse(client.get_endpoint_stats()[urls[1]]['ready'])
+        client.close()
+
+    def test_async_unavailable(self):
+        # A server that fails an async request as unavailable is taken
+        # out of the async requests that follow
+        urls = self._start_servers((0, 0))
+        client = grpcclient.LoadBalancedInferenceServerClient(
+            urls, health_check_interval_s=None)
+        self.servers_[1].stop()
+
+        completed = []
+        for index in range(20):
+            inputs, outputs, expected = self._prepare_request(index)
+            client.async_infer(
+                lambda result: completed.append(result.as_numpy('OUTPUT0')),
+                inputs, outputs, self.model_name_)
+            # A failed request does not reach the callback
+            for _ in range(250):
+                if client.get_outstanding_request_count() == 0:
+                    break
+                time.sleep(0.02)
+
+        self.assertFalse(client.get_endpoint_stats()[urls[1]]['ready'])
+        self.assertGreaterEqual(len(completed), 19)
+        self.assertEqual(self.servers_[0].request_count, len(completed))
+        client.close()
+
+    def test_no_ready_server(self):
+        urls = self._start_servers((0, 0))
+        for server in self.servers_:
+            server.ready = False
+        client = grpcclient.LoadBalancedInferenceServerClient(
+            urls, health_check_interval_s=None)
+        self.assertFalse(client.is_server_ready())
+        with self.assertRaises(grpcclient.InferenceServerException) as ctx:
+            self._infer(client, 0)
+        self.assertEqual(ctx.exception.message(), "no inference server is ready")
+        client.close()
+
+    def test_sequence(self):
+        # All the requests of a sequence go to the same server
+        urls = self._start_servers((0, 0, 0))
+        client = grpcclient.LoadBalancedInferenceServerClient(urls)
+        for index in range(12):
+            self._infer(client, index, sequence_id=7)
+        self.assertEqual(sorted(server.request_count for server in self.servers_),
+                         [0, 0, 12])
+        client.close()
+
+
+class GrpcV2HedgingTest(_MockServerTest):
+    def test_hedge_slow_server(self):
+        # Once the server taking the requests becomes slow its requests
+        # are hedged to the other server, which wins
+        urls = self._start_servers((0.002, 0.002))
+        policy = grpcclient.HedgingPolicy(percentile=90, budget_ratio=1.0,
+                                          min_sample_count=10)
+        client = grpcclient.LoadBalancedInferenceServerClient(
+            urls, hedging_policy=policy)
+        for index in range(30):
+            self._infer(client, index)
+        self.assertEqual(policy.get_stats()[self.model_name_]['hedge_win_count'], 0)
+
+        slow_server = max(self.servers_, key=lambda server: server.request_count)
+        slow_server.delay_s = 0.5
+        for index in range(10):
+            start = time.monotonic()
+            self._infer(client, index)
+            self.assertLess(time.monotonic() - start, 0.25)
+
+        stats = policy.get_stats()[self.model_name_]
+        self.assertEqual(stats['request_count'], 40)
+        self.assertGreater(stats['hedge_count'], 0)
+        self.assertGreater(stats['hedge_win_count'], 0)
+        self.assertLessEqual(stats['hedge_win_count'], stats['hedge_count'])
+
+        # The requests left on the slow server were cancelled
+        time.sleep(0.6)
+        self.assertGreater(slow_server.cancel_count, 0)
+        self.assertEqual(client.get_outstanding_request_count(), 0)
+        client.close()
+
+    def test_hedge_budget(self):
+        # Half of the requests take longer than the median, but the
+        # hedges are limited by the budget of the model
+        urls = self._start_servers((0.001, 0.001), jitter_s=0.01)
+        policy = grpcclient.HedgingPolicy(percentile=50, budget_ratio=0.1,
+                                          max_burst=2, min_sample_count=5)
+        client = grpcclient.LoadBalancedInferenceServerClient(
+            urls, hedging_policy=policy)
+        for index in range(100):
+            self._infer(client, index)
+
+        stats = policy.get_stats()[self.model_name_]
+        self.assertEqual(stats['request_count'], 100)
+        self.assertGreater(stats['hedge_count'], 0)
+        self.assertLessEqual(stats['hedge_count'], 2 + 0.1 * 100)
+        # A hedge can be cancelled before its server receives it
+        server_request_count = sum(server.request_count for server in self.servers_)
+        self.assertGreaterEqual(server_request_count, 100)
+        self.assertLessEqual(server_request_count, 100 + stats['hedge_count'])
+        client.close()
+
+    def test_hedge_not_sent(self):
+        # A hedge that cannot be sent returns its budget and the request
+        # completes on the server it was sent to
+        urls = self._start_servers((0.002, 0.002))
+        policy = grpcclient.HedgingPolicy(percentile=0, budget_ratio=1.0,
+                                          min_sample_count=1)
+        client = grpcclient.LoadBalancedInferenceServerClient(
+            urls, hedging_policy=policy, max_outstanding_requests=1)
+        choose = client._choose
+
+        def choose_none_ready(sequence_id=0, exclude=None):
+            if exclude is not None:
+                raise grpcclient.InferenceServerException(
+                    msg="no inference server is ready")
+            return choose(sequence_id)
+
+        client._choose = choose_none_ready
+        for index in range(10):
+            self._infer(client, index)
+        stats = policy.get_stats()[self.model_name_]
+        self.assertEqual(stats['request_count'], 10)
+        self.assertEqual(stats['hedge_count'], 0)
+        self.assertEqual(sum(server.request_count for server in self.servers_), 10)
+
+        # Nor does a hedge wait for a client at its limit of requests
+        client._choose = choose
+        for endpoint in client._endpoints:
+            endpoint.client._inflight.acquire()
+        with self.assertRaises(grpcclient.InferenceServerException) as ctx:
+            client._endpoints[0].client._start_infer(None, block=False)
+        self.assertEqual(ctx.exception.message(),
+                         "maximum number of outstanding requests reached")
+        for endpoint in client._endpoints:
+            endpoint.client._inflight.release()
+        self.assertEqual(client.get_outstanding_request_count(), 0)
+        client.close()
+
+    def test_sequence_not_hedged(self):
+        urls = self._start_servers((0.002, 0.002))
+        policy = grpcclient.HedgingPolicy(percentile=0, min_sample_count=1)
+        client = grpcclient.LoadBalancedInferenceServerClient(
+            urls, hedging_policy=policy)
+        for index in range(10):
+            self._infer(client, index, sequence_id=3)
+        self.assertEqual(policy.get_stats(), {})
+        client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+import numpy as np
+import tritongrpcclient.core as grpcclient
+from tritongrpcclient import grpc_service_v2_pb2
+
+
+class GrpcV2RequestEncodingTest(unittest.TestCase):
+    def _check(self, inputs, outputs, model_name, model_version="",
+               request_id=None, sequence_id=0):
+        # The encoded request must parse to the message built by protobuf
+        encoded = grpcclient._encode_inference_request(
+            inputs, outputs, model_name, model_version, request_id, sequence_id)
+        serialized = encoded.SerializeToString()
+        self.assertEqual(len(serialized), encoded.ByteSize())
+        request = grpc_service_v2_pb2.ModelInferRequest()
+        request.ParseFromString(serialized)
+        expected = grpcclient._get_inference_request(
+            inputs, outputs, model_name, model_version, request_id, sequence_id)
+        self.assertEqual(request, expected)
+        return encoded
+
+    def _input(self, name, input_data):
+        infer_input = grpcclient.InferInput(name)
+        infer_input.set_data_from_numpy(input_data)
+        return infer_input
+
+    def test_tensors(self):
+        inputs = [
+            self._input("INPUT0", np.arange(16, dtype=np.float32).reshape(4, 4)),
+            self._input("INPUT1", np.array(["a", "bc", "", "def"], dtype=np.object)),
+            self._input("INPUT2", np.array(True)),
+            self._input("INPUT3", np.zeros((0, 3), dtype=np.int64)),
+            # Not contiguous, so copied into a contiguous array
+            self._input("INPUT4", np.arange(64, dtype=np.int16).reshape(8, 8)[:, ::3]),
+        ]
+        outputs = [grpcclient.InferOutput("OUTPUT0"), grpcclient.InferOutput("OUTPUT1")]
+        outputs[1].set_parameter("classification", 3)
+        self._check(inputs, outputs, "simple")
+        self._check(inputs, outputs, "simple", "2", "request", 1 << 40)
+
+    def test_large_tensor(self):
+        # 16 MB, so that the lengths take multiple varint bytes
+        input_data = np.random.random(4 * 1024 * 1024).astype(np.float32)
+        encoded = self._check([self._input("INPUT0", input_data)], [], "identity")
+
+        # The request references the array until it is serialized
+        input_data[0] = -1
+        request = grpc_service_v2_pb2.ModelInferRequest()
+        request.ParseFromString(encoded.SerializeToString())
+        self.assertEqual(np.frombuffer(request.inputs[0].contents.raw_contents,
+                                       dtype=np.float32)[0], -1)
+
+    def test_unicode_names(self):
+        inputs = [self._input("INPUTé", np.arange(4, dtype=np.int32))]
+        outputs = [grpcclient.InferOutput("OUTPUTé")]
+        self._check(inputs, outputs, "modèle", request_id="é")
+
+    def test_no_data(self):
+        self._check([grpcclient.InferInput("INPUT0")], [], "simple")
+
+    def test_parameter_change(self):
+        infer_output = grpcclient.InferOutput("OUTPUT0")
+        self._check([], [infer_output], "simple")
+        infer_output.set_parameter("classification", 2)
+        self._check([], [infer_output], "simple")
+
+    def test_typed_contents(self):
+        expected = [
+            ("bool_contents", np.array([[True, False], [False, True]])),
+            ("int_contents", np.array([[-128, 0], [1, 127]], dtype=np.int8)),
+            ("int_contents", np.array([[-(1 << 31), -1], [0, (1 << 31) - 1]], dtype=np.int32)),
+            ("int64_contents", np.array([[-(1 << 63), -1], [300, (1 << 63) - 1]], dtype=np.int64)),
+            ("uint_contents", np.array([[0, 128], [65535, (1 << 32) - 1]], dtype=np.uint32)),
+            ("uint64_contents", np.array([[0, 1 << 40], [127, (1 << 64) - 1]], dtype=np.uint64)),
+            ("fp32_contents", np.array([[-1.5, 0], [3.25, 1e30]], dtype=np.float32)),
+            ("fp64_contents", np.array([[-1e300, 0], [1e-300, 2]], dtype=np.float64)),
+            ("byte_contents", np.array([["a", ""], ["x" * 200, "\u00e9"]], dtype=np.object)),
+        ]
+        for field, input_data in expected:
+            infer_input = grpcclient.InferInput("INPUT0")
+            infer_input.set_data_from_numpy(input_data, binary_data=False)
+            encoded = grpcclient._encode_inference_request(
+                [infer_input], [], "simple", "", None, 0)
+            request = grpc_service_v2_pb2.ModelInferRequest()
+            request.ParseFromString(encoded.SerializeToString())
+
+            tensor = grpc_service_v2_pb2.ModelInferRequest.InferInputTensor(
+                name="INPUT0", datatype=infer_input.datatype(), shape=[2, 2])
+            if field == "byte_contents":
+                tensor.contents.byte_contents.extend(
+                    [value.encode('utf-8') for value in input_data.flat])
+            else:
+                getattr(tensor.contents, field).extend(input_data.flatten().tolist())
+            self.assertEqual(request.inputs[0], tensor)
+            self.assertEqual(infer_input._get_tensor(), tensor)
+
+        infer_input = grpcclient.InferInput("INPUT0")
+        with self.assertRaises(grpcclient.InferenceServerException):
+            infer_input.set_data_from_numpy(np.zeros(4, dtype=np.float16),
+                                            binary_data=False)
+
+    def test_digest(self):
+        inputs = [self._input("INPUT0", np.arange(16, dtype=np.int32))]
+        outputs = [grpcclient.InferOutput("OUTPUT0")]
+        digest = grpcclient._encode_inference_request(
+            inputs, outputs, "simple", "", None, 0)._digest()
+        self.assertEqual(
+            grpcclient._encode_inference_request(inputs, outputs, "simple", "",
+                                                 None, 0)._digest(), digest)
+        self.assertNotEqual(
+            grpcclient._encode_inference_request(inputs, outputs, "simple", "1",
+                                                 None, 0)._digest(), digest)
+
+
+if __name__ == '__main__':
+    unittest.main()
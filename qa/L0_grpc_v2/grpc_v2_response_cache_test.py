@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import threading
+import time
+import unittest
+import numpy as np
+import tritongrpcclient.core as grpcclient
+from tritongrpcclient.utils import InferenceServerException, ResponseCache
+
+
+class GrpcV2ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.url_ = "localhost:8001"
+        self.model_name_ = "simple"
+
+    def _infer(self, client, index, sequence_id=0):
+        input0_data = np.full((1, 16), index, dtype=np.int32)
+        input1_data = np.arange(16, dtype=np.int32).reshape(1, 16)
+        inputs = [grpcclient.InferInput('INPUT0'), grpcclient.InferInput('INPUT1')]
+        inputs[0].set_data_from_numpy(input0_data)
+        inputs[1].set_data_from_numpy(input1_data)
+        outputs = [grpcclient.InferOutput('OUTPUT0')]
+        result = client.infer(inputs, outputs, self.model_name_,
+                              sequence_id=sequence_id)
+        self.assertTrue(
+            np.array_equal(result.as_numpy('OUTPUT0'), input0_data + input1_data))
+        return result
+
+    def test_hit(self):
+        cache = ResponseCache(1 << 20)
+        client = grpcclient.InferenceServerClient(self.url_, response_cache=cache)
+        first = self._infer(client, 1)
+        self.assertIs(self._infer(client, 1), first)
+        self._infer(client, 2)
+
+        stats = cache.get_stats()
+        self.assertEqual(stats['hit_count'], 1)
+        self.assertEqual(stats['miss_count'], 2)
+        self.assertEqual(stats['entry_count'], 2)
+        self.assertEqual(stats['byte_size'], 2 * first.get_response().ByteSize())
+
+    def test_eviction(self):
+        client = grpcclient.InferenceServerClient(self.url_)
+        byte_size = self._infer(client, 0).get_response().ByteSize()
+
+        # Room for the responses of two requests
+        cache = ResponseCache(2 * byte_size)
+        client = grpcclient.InferenceServerClient(self.url_, response_cache=cache)
+        for index in (0, 1, 0, 2, 0, 1):
+            self._infer(client, index)
+
+        stats = cache.get_stats()
+        self.assertEqual(stats['hit_count'], 2)
+        self.assertEqual(stats['miss_count'], 4)
+        self.assertEqual(stats['eviction_count'], 2)
+        self.assertEqual(stats['entry_count'], 2)
+
+    def test_ttl(self):
+        cache = ResponseCache(1 << 20, ttl_s=0.5)
+        client = grpcclient.InferenceServerClient(self.url_, response_cache=cache)
+        self._infer(client, 1)
+        self._infer(client, 1)
+        time.sleep(0.6)
+        self._infer(client, 1)
+
+        stats = cache.get_stats()
+        self.assertEqual(stats['hit_count'], 1)
+        self.assertEqual(stats['miss_count'], 2)
+
+    def test_shared_threads(self):
+        # Identical requests issued concurrently reach the server once
+        cache = ResponseCache(1 << 20)
+        client = grpcclient.InferenceServerClient(self.url_, response_cache=cache)
+        results = []
+        errors = []
+
+        def worker():
+            try:
+                results.append(self._infer(client, 3))
+            except Exception as ex:
+                errors.append(ex)
+
+        threads = [threading.Thread(target=worker) for t in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(errors), 0, errors)
+        self.assertEqual(len(set(id(result) for result in results)), 1)
+        stats = cache.get_stats()
+        self.assertEqual(stats['miss_count'], 1)
+        self.assertEqual(stats['hit_count'] + stats['collapsed_count'], 15)
+
+    def test_error_not_cached(self):
+        cache = ResponseCache(1 << 20)
+        client = grpcclient.InferenceServerClient(self.url_, response_cache=cache)
+        input0 = grpcclient.InferInput('INPUT0')
+        input0.set_data_from_numpy(np.zeros((1, 16), dtype=np.int32))
+        for _ in range(2):
+            with self.assertRaises(InferenceServerException):
+                client.infer([input0], [], "unknown_model")
+
+        stats = cache.get_stats()
+        self.assertEqual(stats['miss_count'], 2)
+        self.assertEqual(stats['entry_count'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -42,6 +42,8 @@ RET=0
 SIMPLE_HEALTH_CLIENT=../clients/simple_grpc_v2_health_metadata.py
 SIMPLE_INFER_CLIENT=../clients/simple_grpc_v2_infer_client.py
 SIMPLE_ASYNC_INFER_CLIENT=../clients/simple_grpc_v2_async_infer_client.py
+SIMPLE_AIO_INFER_CLIENT=../clients/simple_grpc_v2_aio_infer_client.py
+SIMPLE_STREAM_INFER_CLIENT=../clients/simple_grpc_v2_stream_infer_client.py
 SIMPLE_STRING_INFER_CLIENT=../clients/simple_grpc_v2_string_infer_client.py
 SIMPLE_CLASS_CLIENT=../clients/simple_grpc_v2_class_client.py
 EXPLICIT_BYTE_CONTENT_CLIENT=../clients/grpc_v2_explicit_byte_content_client.py
@@ -49,6 +51,13 @@ EXPLICIT_INT_CONTENT_CLIENT=../clients/grpc_v2_explicit_int_content_client.py
 EXPLICIT_INT8_CONTENT_CLIENT=../clients/grpc_v2_explicit_int8_content_client.py
 GRPC_V2_CLIENT=../clients/grpc_v2_client.py
 GRPC_IMAGE_CLIENT=../clients/grpc_v2_image_client.py
+CONCURRENCY_TEST=grpc_v2_concurrency_test.py
+INFER_RESULT_TEST=grpc_v2_infer_result_test.py
+RESPONSE_CACHE_TEST=grpc_v2_response_cache_test.py
+LOAD_BALANCE_TEST=grpc_v2_load_balance_test.py
+CHANNEL_TEST=grpc_v2_channel_test.py
+REQUEST_ENCODING_TEST=grpc_v2_request_encoding_test.py
+CHANNEL_PERF=grpc_v2_channel_perf.py
 
 rm -f *.log
 rm -f *.log.*
@@ -95,6 +104,8 @@ IMAGE=../images/vulture.jpeg
 for i in \
         $SIMPLE_INFER_CLIENT \
         $SIMPLE_ASYNC_INFER_CLIENT \
+        $SIMPLE_AIO_INFER_CLIENT \
+        $SIMPLE_STREAM_INFER_CLIENT \
         $SIMPLE_STRING_INFER_CLIENT \
         $SIMPLE_CLASS_CLIENT \
         $EXPLICIT_BYTE_CONTENT_CLIENT \
@@ -122,6 +133,50 @@ for i in \
     fi
 done
 
+python $CONCURRENCY_TEST >> ${CLIENT_LOG}.concurrency 2>&1
+if [ $? -ne 0 ]; then
+    cat ${CLIENT_LOG}.concurrency
+    RET=1
+fi
+
+python $INFER_RESULT_TEST >> ${CLIENT_LOG}.infer_result 2>&1
+if [ $? -ne 0 ]; then
+    cat ${CLIENT_LOG}.infer_result
+    RET=1
+fi
+
+python $RESPONSE_CACHE_TEST >> ${CLIENT_LOG}.response_cache 2>&1
+if [ $? -ne 0 ]; then
+    cat ${CLIENT_LOG}.response_cache
+    RET=1
+fi
+
+python $REQUEST_ENCODING_TEST >> ${CLIENT_LOG}.request_encoding 2>&1
+if [ $? -ne 0 ]; then
+    cat ${CLIENT_LOG}.request_encoding
+    RET=1
+fi
+
+# Uses its own mock servers
+python $LOAD_BALANCE_TEST >> ${CLIENT_LOG}.load_balance 2>&1
+if [ $? -ne 0 ]; then
+    cat ${CLIENT_LOG}.load_balance
+    RET=1
+fi
+
+python $CHANNEL_TEST >> ${CLIENT_LOG}.channel 2>&1
+if [ $? -ne 0 ]; then
+    cat ${CLIENT_LOG}.channel
+    RET=1
+fi
+
+# Throughput for each payload size and compression algorithm
+python $CHANNEL_PERF >> ${CLIENT_LOG}.channel_perf 2>&1
+if [ $? -ne 0 ]; then
+    RET=1
+fi
+cat ${CLIENT_LOG}.channel_perf
+
 kill $SERVER_PID
 wait $SERVER_PID
 
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import sys
+sys.path.append("../common")
+
+import unittest
+import numpy as np
+import rapidjson as json
+import tritonhttpclient.core as httpclient
+from http_v2_mock_server import MockServer
+
+
+class HttpV2InferTest(unittest.TestCase):
+    def setUp(self):
+        self.server_ = MockServer()
+        self.client_ = httpclient.InferenceServerClient(self.server_.url)
+
+    def tearDown(self):
+        self.client_.close()
+        self.server_.stop()
+
+    def _simple_inputs(self, binary_data=True):
+        input0_data = np.arange(16, dtype=np.int32).reshape(1, 16)
+        input1_data = np.ones((1, 16), dtype=np.int32)
+        inputs = [httpclient.InferInput('INPUT0'), httpclient.InferInput('INPUT1')]
+        inputs[0].set_data_from_numpy(input0_data, binary_data=binary_data)
+        inputs[1].set_data_from_numpy(input1_data, binary_data=binary_data)
+        return inputs, input0_data, input1_data
+
+    def _request_header(self):
+        # The JSON inference header of the last request received
+        header_length = self.server_.last_headers.get('Inference-Header-Content-Length')
+        if header_length is None:
+            return json.loads(self.server_.last_body), b''
+        header_length = int(header_length)
+        return (json.loads(self.server_.last_body[:header_length]),
+                self.server_.last_body[header_length:])
+
+    def test_binary(self):
+        inputs, input0_data, input1_data = self._simple_inputs()
+        outputs = [httpclient.InferOutput('OUTPUT0'), httpclient.InferOutput('OUTPUT1')]
+        result = self.client_.infer(inputs, outputs, 'simple', request_id='1')
+
+        # The inputs follow the JSON inference header in the request
+        header, binary = self._request_header()
+        self.assertEqual(header['id'], '1')
+        for tensor in header['inputs']:
+            self.assertNotIn('data', tensor)
+            self.assertEqual(tensor['parameters']['binary_data_size'], 64)
+        self.assertEqual(binary, input0_data.tobytes() + input1_data.tobytes())
+
+        # And the outputs follow the JSON inference header in the response
+        for output in result.get_response()['outputs']:
+            self.assertNotIn('data', output)
+            self.assertEqual(output['parameters']['binary_data_size'], 64)
+        self.assertTrue(np.array_equal(result.as_numpy('OUTPUT0'), input0_data + input1_data))
+        self.assertTrue(np.array_equal(result.as_numpy('OUTPUT1'), input0_data - input1_data))
+        self.assertIsNone(result.as_numpy('OUTPUT2'))
+
+    def test_binary_data_view(self):
+        # Contiguous inputs are only copied into the request body
+        input_data = np.arange(16, dtype=np.float32)
+        infer_input = httpclient.InferInput('INPUT0')
+        infer_input.set_data_from_numpy(input_data)
+        self.assertTrue(np.shares_memory(infer_input._get_binary_data(), input_data))
+
+        # Others are made contiguous once
+        infer_input.set_data_from_numpy(input_data[::2])
+        self.assertEqual(infer_input._get_binary_data().tobytes(),
+                         input_data[::2].tobytes())
+
+    def test_json(self):
+        inputs, input0_data, input1_data = self._simple_inputs(binary_data=False)
+        outputs = [httpclient.InferOutput('OUTPUT0', binary_data=False),
+                   httpclient.InferOutput('OUTPUT1', binary_data=False)]
+        result = self.client_.infer(inputs, outputs, 'simple')
+
+        # Without binary data the body is the JSON inference header only
+        self.assertIsNone(self.server_.last_headers.get('Inference-Header-Content-Length'))
+        header, _ = self._request_header()
+        self.assertEqual(header['inputs'][0]['data'], input0_data.flatten().tolist())
+        self.assertEqual(result.get_response()['outputs'][0]['data'],
+                         (input0_data + input1_data).flatten().tolist())
+        self.assertTrue(np.array_equal(result.as_numpy('OUTPUT0'), input0_data + input1_data))
+        self.assertTrue(np.array_equal(result.as_numpy('OUTPUT1'), input0_data - input1_data))
+
+    def test_mixed(self):
+        # Binary data is located by the outputs that have it, whatever
+        # their position in the header
+        inputs, input0_data, input1_data = self._simple_inputs()
+        inputs[0].set_data_from_numpy(input0_data, binary_data=False)
+        outputs = [httpclient.InferOutput('OUTPUT0', binary_data=False),
+                   httpclient.InferOutput('OUTPUT1')]
+        result = self.client_.infer(inputs, outputs, 'simple', model_version='1')
+
+        header, binary = self._request_header()
+        self.assertIn('data', header['inputs'][0])
+        self.assertEqual(binary, input1_data.tobytes())
+        self.assertTrue(np.array_equal(result.as_numpy('OUTPUT0'), input0_data + input1_data))
+        self.assertTrue(np.array_equal(result.as_numpy('OUTPUT1'), input0_data - input1_data))
+
+    def test_bytes(self):
+        input_data = np.array([str(i) * i for i in range(16)], dtype=np.object_).reshape(4, 4)
+        expected = np.array([s.encode('utf-8') for s in input_data.flat],
+                            dtype=np.object_).reshape(4, 4)
+        for binary_data in (True, False):
+            inputs = [httpclient.InferInput('INPUT0')]
+            inputs[0].set_data_from_numpy(input_data, binary_data=binary_data)
+            outputs = [httpclient.InferOutput('OUTPUT0', binary_data=binary_data)]
+            result = self.client_.infer(inputs, outputs, 'identity')
+
+            output_data = result.as_numpy('OUTPUT0')
+            self.assertEqual(output_data.shape, (4, 4))
+            if binary_data:
+                self.assertTrue(np.array_equal(output_data, expected))
+            else:
+                self.assertTrue(np.array_equal(output_data, input_data.astype(np.str_)))
+
+    def test_error(self):
+        inputs, _, _ = self._simple_inputs()
+        with self.assertRaises(httpclient.InferenceServerException) as ctx:
+            self.client_.infer(inputs, [], 'unknown')
+        self.assertEqual(ctx.exception.status(), '400')
+        self.assertEqual(ctx.exception.message(), "unknown model 'unknown'")
+
+        # The connection is still usable
+        result = self.client_.infer(inputs, [], 'simple')
+        self.assertIsNotNone(result.as_numpy('OUTPUT0'))
+
+    def test_async(self):
+        inputs, input0_data, input1_data = self._simple_inputs()
+        outputs = [httpclient.InferOutput('OUTPUT0')]
+        requests = [self.client_.async_infer(inputs, outputs, 'simple') for i in range(4)]
+        for request in requests:
+            result = request.get_result()
+            self.assertTrue(np.array_equal(result.as_numpy('OUTPUT0'), input0_data + input1_data))
+        self.assertEqual(self.server_.request_count, 4)
+
+    def test_async_error(self):
+        inputs, _, _ = self._simple_inputs()
+        request = self.client_.async_infer(inputs, [], 'unknown')
+        with self.assertRaises(httpclient.InferenceServerException) as ctx:
+            request.get_result()
+        self.assertEqual(ctx.exception.status(), '400')
+
+    def test_async_not_ready(self):
+        self.server_.delay_s = 0.5
+        inputs, input0_data, input1_data = self._simple_inputs()
+        request = self.client_.async_infer(inputs, [httpclient.InferOutput('OUTPUT0')], 'simple')
+        self.assertIsNone(request.get_result(block=False))
+        with self.assertRaises(httpclient.InferenceServerException) as ctx:
+            request.get_result(timeout=0.1)
+        self.assertEqual(ctx.exception.message(), "timed out waiting for the inference response")
+
+        result = request.get_result(timeout=5)
+        self.assertTrue(np.array_equal(result.as_numpy('OUTPUT0'), input0_data + input1_data))
+        self.assertIs(request.get_result(block=False).get_response(), result.get_response())
+
+
+if __name__ == '__main__':
+    unittest.main()
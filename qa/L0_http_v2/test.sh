@@ -88,6 +88,14 @@ fi
 
 
 SIMPLE_V2_CLIENT=/workspace/builddir/trtis-clients/install/bin/simple_v2_client
+INFER_TEST=http_v2_infer_test.py
+
+pip3 install --upgrade /workspace/builddir/trtis-clients/install/python/tritonhttpclient-*.whl \
+    geventhttpclient python-rapidjson
+if [ $? -ne 0 ]; then
+    echo -e "\n***\n*** HTTP V2 client wheel install Failed\n***"
+    exit 1
+fi
 
 (rm -fr models && mkdir models && \
     cp -r /workspace/docs/examples/model_repository/simple models/.)
@@ -116,6 +124,13 @@ if [ `grep -c "localhost:8000" client_c++.log` != "2" ]; then
     RET=1
 fi
 
+# Uses its own mock server
+python $INFER_TEST >>client_infer.log 2>&1
+if [ $? -ne 0 ]; then
+    cat client_infer.log
+    RET=1
+fi
+
 kill $SERVER_PID
 wait $SERVER_PID
 
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import sys
+sys.path.append("../common")
+
+import threading
+import time
+import unittest
+import numpy as np
+from tensorrtserver.api import *
+import tensorrtserver.shared_memory as shm
+import test_util as tu
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.protocols_ = ((ProtocolType.HTTP, 'localhost:8000'),
+                           (ProtocolType.GRPC, 'localhost:8001'))
+        self.model_name_ = tu.get_model_name("graphdef", np.int32, np.int32, np.int32)
+        self.outputs_ = { 'OUTPUT0' : InferContext.ResultFormat.RAW,
+                          'OUTPUT1' : InferContext.ResultFormat.RAW }
+
+    def _run(self, ctx, idx, corr_id=0):
+        in0 = np.full((16,), idx, dtype=np.int32)
+        in1 = np.arange(16, dtype=np.int32)
+        results = ctx.run({ 'INPUT0' : [in0], 'INPUT1' : [in1] }, self.outputs_,
+                          corr_id=corr_id)
+        self.assertTrue(np.array_equal(results['OUTPUT0'][0], in0 + in1))
+        self.assertTrue(np.array_equal(results['OUTPUT1'][0], in0 - in1))
+        return results
+
+    def test_hit(self):
+        for protocol, url in self.protocols_:
+            cache = ResponseCache(1 << 20)
+            ctx = InferContext(url, protocol, self.model_name_, response_cache=cache)
+            first = self._run(ctx, 1)
+            self.assertIsNotNone(ctx.get_last_request_id())
+            second = self._run(ctx, 1)
+            self.assertIsNone(ctx.get_last_request_id())
+            self.assertIs(first['OUTPUT0'][0], second['OUTPUT0'][0])
+            self.assertFalse(second['OUTPUT0'][0].flags.writeable)
+            self._run(ctx, 2)
+
+            stats = cache.get_stats()
+            self.assertEqual(stats['hit_count'], 1)
+            self.assertEqual(stats['miss_count'], 2)
+            self.assertEqual(stats['entry_count'], 2)
+            self.assertEqual(stats['byte_size'], 4 * 64)
+            ctx.close()
+
+    def test_eviction(self):
+        for protocol, url in self.protocols_:
+            # Room for the results of two requests
+            cache = ResponseCache(2 * 128)
+            ctx = InferContext(url, protocol, self.model_name_, response_cache=cache)
+            self._run(ctx, 0)
+            self._run(ctx, 1)
+            self._run(ctx, 0)
+            self._run(ctx, 2)
+            self._run(ctx, 0)
+            self._run(ctx, 1)
+
+            stats = cache.get_stats()
+            self.assertEqual(stats['hit_count'], 2)
+            self.assertEqual(stats['miss_count'], 4)
+            self.assertEqual(stats['eviction_count'], 2)
+            self.assertEqual(stats['entry_count'], 2)
+            ctx.close()
+
+    def test_ttl(self):
+        for protocol, url in self.protocols_:
+            cache = ResponseCache(1 << 20, ttl_s=0.5)
+            ctx = InferContext(url, protocol, self.model_name_, response_cache=cache)
+            self._run(ctx, 1)
+            self._run(ctx, 1)
+            time.sleep(0.6)
+            self._run(ctx, 1)
+
+            stats = cache.get_stats()
+            self.assertEqual(stats['hit_count'], 1)
+            self.assertEqual(stats['miss_count'], 2)
+            self.assertEqual(stats['entry_count'], 1)
+            ctx.close()
+
+    def test_correlation_id(self):
+        for protocol, url in self.protocols_:
+            cache = ResponseCache(1 << 20)
+            ctx = InferContext(url, protocol, self.model_name_, response_cache=cache)
+            self._run(ctx, 1, corr_id=5)
+            self._run(ctx, 1, corr_id=5)
+            self.assertEqual(cache.get_stats()['entry_count'], 0)
+            ctx.close()
+
+    def test_shared_memory(self):
+        # Requests with an input or output in shared memory bypass the
+        # cache
+        for protocol, url in self.protocols_:
+            shm_ip0_handle = shm.create_shared_memory_region("input0_data", "/input0_data", 64)
+            shm_op0_handle = shm.create_shared_memory_region("output0_data", "/output0_data", 64)
+            shared_memory_ctx = SharedMemoryControlContext(url, protocol)
+            shared_memory_ctx.register(shm_ip0_handle)
+            shared_memory_ctx.register(shm_op0_handle)
+
+            cache = ResponseCache(1 << 20)
+            ctx = InferContext(url, protocol, self.model_name_, response_cache=cache)
+            in1 = np.arange(16, dtype=np.int32)
+            for idx in (1, 2):
+                in0 = np.full((16,), idx, dtype=np.int32)
+                shm.set_shared_memory_region(shm_ip0_handle, [in0])
+                results = ctx.run({ 'INPUT0' : shm_ip0_handle, 'INPUT1' : [in1] },
+                                  { 'OUTPUT0' : InferContext.ResultFormat.RAW,
+                                    'OUTPUT1' : InferContext.ResultFormat.RAW })
+                self.assertTrue(np.array_equal(results['OUTPUT0'][0], in0 + in1))
+
+                results = ctx.run({ 'INPUT0' : [in0], 'INPUT1' : [in1] },
+                                  { 'OUTPUT0' : (InferContext.ResultFormat.RAW, shm_op0_handle),
+                                    'OUTPUT1' : InferContext.ResultFormat.RAW })
+                self.assertTrue(np.array_equal(results['OUTPUT0'][0], in0 + in1))
+                self.assertTrue(np.array_equal(results['OUTPUT1'][0], in0 - in1))
+
+            stats = cache.get_stats()
+            self.assertEqual(stats['hit_count'], 0)
+            self.assertEqual(stats['miss_count'], 0)
+            self.assertEqual(stats['entry_count'], 0)
+            ctx.close()
+
+            shared_memory_ctx.unregister_all()
+            shared_memory_ctx.close()
+            shm.destroy_shared_memory_region(shm_ip0_handle)
+            shm.destroy_shared_memory_region(shm_op0_handle)
+
+    def test_shared_threads(self):
+        # Identical requests from contexts sharing the cache reach the
+        # server once
+        for protocol, url in self.protocols_:
+            cache = ResponseCache(1 << 20)
+            errors = []
+
+            def worker():
+                try:
+                    ctx = InferContext(url, protocol, self.model_name_, response_cache=cache)
+                    self._run(ctx, 3)
+                    ctx.close()
+                except Exception as ex:
+                    errors.append(ex)
+
+            threads = [threading.Thread(target=worker) for t in range(16)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            self.assertEqual(len(errors), 0, errors)
+            stats = cache.get_stats()
+            self.assertEqual(stats['miss_count'], 1)
+            self.assertEqual(stats['hit_count'] + stats['collapsed_count'], 15)
+
+if __name__ == '__main__':
+    unittest.main()
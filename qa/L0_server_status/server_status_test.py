@@ -100,6 +100,37 @@ class ServerStatusTest(unittest.TestCase):
             self.assertTrue(
                 ex.message().startswith("no status available for unknown model"))
 
+    def test_model_status_cache(self):
+        try:
+            for pair in [("localhost:8000", ProtocolType.HTTP), ("localhost:8001", ProtocolType.GRPC)]:
+                cache = get_model_status_cache(pair[0], pair[1])
+                self.assertTrue(cache is get_model_status_cache(pair[0], pair[1]))
+                cache.invalidate()
+
+                model_name = "graphdef_int32_int8_int8"
+                status0 = cache.get_model_status(model_name)
+                status1 = cache.get_model_status(model_name)
+                self.assertEqual(status0, status1)
+                self.assertEqual(cache.get_model_config(model_name).name, model_name)
+                stats = cache.get_stats()
+                self.assertEqual(stats["miss_count"], 1)
+                self.assertEqual(stats["hit_count"], 2)
+                self.assertEqual(stats["entry_count"], 1)
+
+                cache.invalidate(model_name)
+                cache.get_model_status(model_name)
+                self.assertEqual(cache.get_stats()["miss_count"], 2)
+        except InferenceServerException as ex:
+            self.assertTrue(False, "unexpected error {}".format(ex))
+
+        for pair in [("localhost:8000", ProtocolType.HTTP), ("localhost:8001", ProtocolType.GRPC)]:
+            try:
+                get_model_status_cache(pair[0], pair[1]).get_model_status("foo")
+                self.assertTrue(False, "expected unknown model failure")
+            except InferenceServerException as ex:
+                self.assertTrue(
+                    ex.message().startswith("no status available for unknown model"))
+
     def test_model_latest_infer(self):
         input_size = 16
         tensor_shape = (input_size,)
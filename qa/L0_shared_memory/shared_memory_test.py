@@ -27,6 +27,8 @@
 import tensorrtserver.shared_memory as shm
 from tensorrtserver.api import *
 import numpy as np
+import queue
+import threading
 import unittest
 
 class SharedMemoryTest(unittest.TestCase):
@@ -96,6 +98,17 @@ class SharedMemoryTest(unittest.TestCase):
         shared_memory_ctx.register(shm_op1_handle)
         return [shm_ip0_handle, shm_ip1_handle, shm_op0_handle, shm_op1_handle]
 
+    def _string_inputs(self, i):
+        input0_data = np.array([str(x) for x in range(16)], dtype=object)
+        input1_data = np.array([str(i)] * 16, dtype=object)
+        return input0_data, input1_data
+
+    def _check_string_results(self, results, i):
+        output0 = [int(x) for x in results['OUTPUT0'][0]]
+        output1 = [int(x) for x in results['OUTPUT1'][0]]
+        self.assertTrue(output0 == [x + i for x in range(16)])
+        self.assertTrue(output1 == [x - i for x in range(16)])
+
     def _cleanup_server(self, shm_handles):
         for shm_handle in shm_handles:
             shm.destroy_shared_memory_region(shm_handle)
@@ -175,6 +188,146 @@ class SharedMemoryTest(unittest.TestCase):
         self.assertTrue(len(status_after.shared_memory_region) == 0)
         self._cleanup_server(shm_handles)
 
+    def test_arena_inference(self):
+        # Inputs and outputs allocated from a single registered region
+        shared_memory_ctx = SharedMemoryControlContext(_url,  _protocol)
+        with shm.SharedMemoryArena(shared_memory_ctx, "arena_data", "/arena_data", 1024) as arena:
+            shm_status = shared_memory_ctx.get_shared_memory_status()
+            self.assertTrue(len(shm_status.shared_memory_region) == 1)
+
+            infer_ctx = InferContext(_url, _protocol, "simple", -1)
+            for i in range(4):
+                shm_handles = [arena.allocate(64) for _ in range(4)]
+                input0_data = np.full(shape=16, fill_value=i, dtype=np.int32)
+                input1_data = np.arange(start=0, stop=16, dtype=np.int32)
+                shm.set_shared_memory_region(shm_handles[0], [input0_data])
+                shm.set_shared_memory_region(shm_handles[1], [input1_data])
+                results = infer_ctx.run({ 'INPUT0' : shm_handles[0], 'INPUT1' : shm_handles[1], },
+                        { 'OUTPUT0' : (InferContext.ResultFormat.RAW, shm_handles[2]),
+                        'OUTPUT1' : (InferContext.ResultFormat.RAW, shm_handles[3])}, 1)
+                self.assertTrue((results['OUTPUT0'][0] == (input0_data + input1_data)).all())
+                self.assertTrue((results['OUTPUT1'][0] == (input0_data - input1_data)).all())
+                for shm_handle in shm_handles:
+                    arena.free(shm_handle)
+                self.assertTrue(arena.free_byte_size() == 1024)
+
+            # String outputs are decoded from slices past the start of
+            # the region
+            string_ctx = InferContext(_url, _protocol, "simple_string", -1)
+            first_handle = arena.allocate(64)
+            for i in range(4):
+                shm_handles = [arena.allocate(128) for _ in range(2)]
+                input0_data, input1_data = self._string_inputs(i)
+                results = string_ctx.run({ 'INPUT0' : [input0_data], 'INPUT1' : [input1_data] },
+                        { 'OUTPUT0' : (InferContext.ResultFormat.RAW, shm_handles[0]),
+                        'OUTPUT1' : (InferContext.ResultFormat.RAW, shm_handles[1])}, 1)
+                self._check_string_results(results, i)
+                for shm_handle in shm_handles:
+                    arena.free(shm_handle)
+            arena.free(first_handle)
+
+        shm_status = shared_memory_ctx.get_shared_memory_status()
+        self.assertTrue(len(shm_status.shared_memory_region) == 0)
+
+    def test_arena_exhausted(self):
+        # Allocations fail once the region is used up and succeed again
+        # after a free
+        shared_memory_ctx = SharedMemoryControlContext(_url,  _protocol)
+        with shm.SharedMemoryArena(shared_memory_ctx, "arena_data", "/arena_data", 256) as arena:
+            shm_handles = [arena.allocate(60) for _ in range(4)]
+            try:
+                arena.allocate(1)
+                self.assertTrue(False, "expected allocation to fail")
+            except shm.SharedMemoryException as ex:
+                self.assertTrue("unable to allocate 1 bytes" in str(ex))
+            arena.free(shm_handles[1])
+            arena.free(shm_handles[2])
+            shm_handles[1] = arena.allocate(128)
+            self.assertTrue(arena.free_byte_size() == 0)
+
+    def test_region_ndarray(self):
+        # Write inputs and read outputs in place through views of the
+        # regions
+        shm_handles = self._configure_sever()
+        input0_data = np.full(shape=16, fill_value=3, dtype=np.int32)
+        input1_data = np.arange(start=0, stop=16, dtype=np.int32)
+        shm.get_region_ndarray(shm_handles[0], np.int32, (16,))[:] = input0_data
+        shm.get_region_ndarray(shm_handles[1], np.int32, (2, 8))[:] = input1_data.reshape(2, 8)
+
+        infer_ctx = InferContext(_url, _protocol, "simple", -1)
+        infer_ctx.run({ 'INPUT0' : shm_handles[0], 'INPUT1' : shm_handles[1], },
+                { 'OUTPUT0' : (InferContext.ResultFormat.RAW, shm_handles[2]),
+                'OUTPUT1' : (InferContext.ResultFormat.RAW, shm_handles[3])}, 1)
+        output0 = shm.get_region_ndarray(shm_handles[2], np.int32, (16,))
+        output1 = shm.get_region_ndarray(shm_handles[3], np.int32, (8,), offset=32)
+        self.assertTrue((output0 == (input0_data + input1_data)).all())
+        self.assertTrue((output1 == (input0_data - input1_data)[8:]).all())
+
+        try:
+            shm.get_region_ndarray(shm_handles[0], np.int32, (16,), offset=4)
+            self.assertTrue(False, "expected view to exceed the region")
+        except shm.SharedMemoryException as ex:
+            self.assertTrue("exceeds the shared memory region of 64 bytes" in str(ex))
+        self._cleanup_server(shm_handles)
+
+    def test_output_ring(self):
+        # Pipelined requests take the free slots of the ring, the issue
+        # blocks until the results of an earlier request are read
+        request_count = 8
+        ring = SharedMemoryOutputRing(_url, _protocol, { 'OUTPUT0' : 64, 'OUTPUT1' : 64 }, 2,
+                                      "ring_data", "/ring_data")
+        shared_memory_ctx = SharedMemoryControlContext(_url,  _protocol)
+        shm_status = shared_memory_ctx.get_shared_memory_status()
+        self.assertTrue(len(shm_status.shared_memory_region) == 1)
+
+        infer_ctx = InferContext(_url, _protocol, "simple", -1)
+        input1_data = np.ones(shape=16, dtype=np.int32)
+        completed = queue.Queue()
+        errors = []
+
+        def issue():
+            try:
+                for i in range(request_count):
+                    input0_data = np.full(shape=16, fill_value=i, dtype=np.int32)
+                    infer_ctx.async_run(lambda ctx, request_id, idx=i: completed.put((idx, request_id)),
+                                        { 'INPUT0' : [input0_data], 'INPUT1' : [input1_data] },
+                                        { 'OUTPUT0' : InferContext.ResultFormat.RAW,
+                                          'OUTPUT1' : InferContext.ResultFormat.RAW }, 1,
+                                        output_ring=ring)
+                    self.assertTrue(ring.free_slot_count() <= 1)
+            except Exception as ex:
+                errors.append(ex)
+
+        issuer = threading.Thread(target=issue)
+        issuer.start()
+        for _ in range(request_count):
+            idx, request_id = completed.get(timeout=10)
+            results = infer_ctx.get_async_run_results(request_id)
+            self.assertTrue((results['OUTPUT0'][0] == (idx + input1_data)).all())
+            self.assertTrue((results['OUTPUT1'][0] == (idx - input1_data)).all())
+        issuer.join()
+
+        self.assertTrue(len(errors) == 0, errors)
+        self.assertTrue(ring.free_slot_count() == 2)
+        ring.close()
+
+        # String outputs are decoded from every slot
+        ring = SharedMemoryOutputRing(_url, _protocol, { 'OUTPUT0' : 128, 'OUTPUT1' : 128 }, 2,
+                                      "string_ring_data", "/string_ring_data")
+        string_ctx = InferContext(_url, _protocol, "simple_string", -1)
+        for i in range(4):
+            input0_data, input1_data = self._string_inputs(i)
+            string_ctx.async_run(lambda ctx, request_id: completed.put(request_id),
+                                 { 'INPUT0' : [input0_data], 'INPUT1' : [input1_data] },
+                                 { 'OUTPUT0' : InferContext.ResultFormat.RAW,
+                                   'OUTPUT1' : InferContext.ResultFormat.RAW }, 1,
+                                 output_ring=ring)
+            results = string_ctx.get_async_run_results(completed.get(timeout=10))
+            self._check_string_results(results, i)
+        ring.close()
+        shm_status = shared_memory_ctx.get_shared_memory_status()
+        self.assertTrue(len(shm_status.shared_memory_region) == 0)
+
 if __name__ == '__main__':
     if os.environ.get('CLIENT_TYPE', "") == "http":
         _protocol = ProtocolType.HTTP
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import argparse
+import time
+import numpy as np
+from tensorrtserver.api import *
+
+FLAGS = None
+
+def _latency_ms(url, model_size, shared_memory_threshold):
+    in0 = np.random.random((1, model_size)).astype(np.float32)
+    outputs = { 'OUTPUT0' : InferContext.ResultFormat.RAW }
+    model_name = "custom_identity_" + str(model_size)
+    with InferContext(url, ProtocolType.GRPC, model_name,
+                      shared_memory_threshold=shared_memory_threshold) as ctx:
+        # Warm up, which also creates the shared memory regions
+        ctx.run({ 'INPUT0' : in0 }, outputs, 1)
+
+        start = time.perf_counter()
+        for _ in range(FLAGS.iterations):
+            ctx.run({ 'INPUT0' : in0 }, outputs, 1)
+        return (time.perf_counter() - start) * 1000 / FLAGS.iterations
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-i', '--iterations', type=int, required=False, default=20,
+                        help='Number of requests for each measurement. Default is 20.')
+    parser.add_argument('-t', '--tcp-url', type=str, required=False, default='localhost:8001',
+                        help='GRPC URL of the server over TCP loopback. ' +
+                        'Default is localhost:8001.')
+    parser.add_argument('-s', '--uds-url', type=str, required=False,
+                        default='unix:/tmp/trtserver_grpc.sock',
+                        help='GRPC URL of the server over a unix domain socket. ' +
+                        'Default is unix:/tmp/trtserver_grpc.sock.')
+    FLAGS = parser.parse_args()
+
+    # The tensors move over TCP loopback, over the unix domain socket,
+    # or through system shared memory with the requests over TCP
+    print("{:>8} {:>12} {:>12} {:>12} {:>6}".format(
+        "tensor", "tcp (ms)", "uds (ms)", "shm (ms)", "best"))
+    for model_size in (256, 16384, 262144, 4194304, 16777216):
+        latencies = (
+            ("tcp", _latency_ms(FLAGS.tcp_url, model_size, 0)),
+            ("uds", _latency_ms(FLAGS.uds_url, model_size, 0)),
+            ("shm", _latency_ms(FLAGS.tcp_url, model_size, 1)))
+        print("{:>7}K {:>12.3f} {:>12.3f} {:>12.3f} {:>6}".format(
+            model_size * 4 // 1024, *[ms for _, ms in latencies],
+            min(latencies, key=lambda latency: latency[1])[0]))
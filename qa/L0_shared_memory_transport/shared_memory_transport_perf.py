@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import argparse
+import time
+import numpy as np
+from tensorrtserver.api import *
+
+FLAGS = None
+
+def _latency_ms(ctx, model_size, batch_size, iterations):
+    in0 = np.random.random((batch_size, model_size)).astype(np.float32)
+    outputs = { 'OUTPUT0' : InferContext.ResultFormat.RAW }
+
+    # Warm up, which also creates the shared memory regions
+    ctx.run({ 'INPUT0' : in0 }, outputs, batch_size)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        ctx.run({ 'INPUT0' : in0 }, outputs, batch_size)
+    return (time.perf_counter() - start) * 1000 / iterations
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-i', '--iterations', type=int, required=False, default=50,
+                        help='Number of requests for each measurement. Default is 50.')
+    parser.add_argument('-b', '--batch-size', type=int, required=False, default=1,
+                        help='Batch size of each request. Default is 1.')
+    FLAGS = parser.parse_args()
+
+    print("{:>8} {:>10} {:>12} {:>12} {:>8}".format(
+        "protocol", "tensor", "wire (ms)", "shm (ms)", "speedup"))
+    for protocol, url in ((ProtocolType.HTTP, 'localhost:8000'),
+                          (ProtocolType.GRPC, 'localhost:8001')):
+        for model_size in (1024, 16384, 262144, 4194304):
+            model_name = "custom_identity_" + str(model_size)
+            with InferContext(url, protocol, model_name) as ctx:
+                wire_ms = _latency_ms(ctx, model_size, FLAGS.batch_size, FLAGS.iterations)
+            with InferContext(url, protocol, model_name, shared_memory_threshold=1) as ctx:
+                shm_ms = _latency_ms(ctx, model_size, FLAGS.batch_size, FLAGS.iterations)
+            print("{:>8} {:>9}K {:>12.3f} {:>12.3f} {:>7.2f}x".format(
+                protocol.name, model_size * 4 // 1024, wire_ms, shm_ms, wire_ms / shm_ms))
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+import numpy as np
+from tensorrtserver.api import *
+
+class SharedMemoryTransportTest(unittest.TestCase):
+    def setUp(self):
+        self.protocols_ = ((ProtocolType.HTTP, 'localhost:8000'),
+                           (ProtocolType.GRPC, 'localhost:8001'))
+
+    def _region_count(self, protocol, url):
+        with SharedMemoryControlContext(url, protocol) as ctx:
+            return len(ctx.get_shared_memory_status().shared_memory_region)
+
+    def test_large_tensors(self):
+        # Tensors above the threshold go through shared memory regions
+        # that are destroyed when the context is closed
+        for protocol, url in self.protocols_:
+            ctx = InferContext(url, protocol, "custom_identity_16384",
+                               shared_memory_threshold=4096)
+            for batch_size in (1, 3, 8):
+                in0 = np.random.random((batch_size, 16384)).astype(np.float32)
+                results = ctx.run({ 'INPUT0' : in0 },
+                                  { 'OUTPUT0' : InferContext.ResultFormat.RAW },
+                                  batch_size)
+                self.assertEqual(len(results['OUTPUT0']), batch_size)
+                for b in range(batch_size):
+                    self.assertTrue(np.array_equal(results['OUTPUT0'][b], in0[b]))
+            self.assertEqual(self._region_count(protocol, url), 1)
+            ctx.close()
+            self.assertEqual(self._region_count(protocol, url), 0)
+
+    def test_small_tensors(self):
+        # Tensors below the threshold go over the wire
+        for protocol, url in self.protocols_:
+            ctx = InferContext(url, protocol, "custom_identity_1024",
+                               shared_memory_threshold=1024 * 1024)
+            in0 = [ np.random.random((1024,)).astype(np.float32) ]
+            results = ctx.run({ 'INPUT0' : in0 },
+                              { 'OUTPUT0' : InferContext.ResultFormat.RAW }, 1)
+            self.assertTrue(np.array_equal(results['OUTPUT0'][0], in0[0]))
+            self.assertEqual(self._region_count(protocol, url), 0)
+            ctx.close()
+
+    def test_raw_batch_output(self):
+        # RAW_BATCH outputs go over the wire while the input goes
+        # through shared memory
+        for protocol, url in self.protocols_:
+            ctx = InferContext(url, protocol, "custom_identity_16384",
+                               shared_memory_threshold=4096)
+            in0 = [ np.random.random((16384,)).astype(np.float32) for _ in range(2) ]
+            results = ctx.run({ 'INPUT0' : in0 },
+                              { 'OUTPUT0' : InferContext.ResultFormat.RAW_BATCH }, 2)
+            self.assertTrue(np.array_equal(results['OUTPUT0'], np.stack(in0)))
+            ctx.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/bin/bash
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+CLIENT_LOG="./client.log"
+PERF_LOG="./perf.log"
+TRANSPORT_TEST=shared_memory_transport_test.py
+TRANSPORT_PERF=shared_memory_transport_perf.py
+GRPC_TRANSPORT_PERF=grpc_transport_perf.py
+GRPC_TRANSPORT_LOG="./grpc_transport_perf.log"
+
+SERVER=/opt/tensorrtserver/bin/trtserver
+SERVER_ARGS=--model-repository=`pwd`/models
+SERVER_LOG="./inference_server.log"
+UDS_SERVER_LOG="./inference_server_uds.log"
+GRPC_SOCKET=/tmp/trtserver_grpc.sock
+source ../common/util.sh
+
+rm -f $CLIENT_LOG $PERF_LOG $GRPC_TRANSPORT_LOG $SERVER_LOG $UDS_SERVER_LOG $GRPC_SOCKET
+
+# Identity models with fixed-size tensors of 1 KB to 64 MB, so that
+# the output sizes are known to the client
+rm -fr models && mkdir models
+for SIZE in 256 1024 16384 262144 4194304 16777216; do
+    MODEL=custom_identity_$SIZE
+    cp -r ../custom_models/custom_zero_1_float32 models/$MODEL && \
+        mkdir -p models/$MODEL/1 && \
+        cp `pwd`/libidentity.so models/$MODEL/1/. && \
+        (cd models/$MODEL && \
+                sed -i "s/custom_zero_1_float32/$MODEL/" config.pbtxt && \
+                sed -i "s/dims: \[ 1 \]/dims: \[ $SIZE \]/" config.pbtxt && \
+                sed -i "s/max_batch_size:.*/max_batch_size: 8/" config.pbtxt && \
+                echo "default_model_filename: \"libidentity.so\"" >> config.pbtxt && \
+                echo "instance_group [ { kind: KIND_CPU }]" >> config.pbtxt)
+done
+
+run_server
+if [ "$SERVER_PID" == "0" ]; then
+    echo -e "\n***\n*** Failed to start $SERVER\n***"
+    cat $SERVER_LOG
+    exit 1
+fi
+
+RET=0
+
+set +e
+
+python $TRANSPORT_TEST >$CLIENT_LOG 2>&1
+if [ $? -ne 0 ]; then
+    cat $CLIENT_LOG
+    echo -e "\n***\n*** Test Failed\n***"
+    RET=1
+fi
+
+# Latency over the wire and through shared memory for each tensor size
+python $TRANSPORT_PERF >$PERF_LOG 2>&1
+if [ $? -ne 0 ]; then
+    echo -e "\n***\n*** Benchmark Failed\n***"
+    RET=1
+fi
+cat $PERF_LOG
+
+# A second server on the same models that serves GRPC over a unix
+# domain socket, for comparing that socket with TCP loopback and with
+# shared memory
+$SERVER $SERVER_ARGS --http-port=8010 --allow-metrics=false \
+        --grpc-address=unix:$GRPC_SOCKET > $UDS_SERVER_LOG 2>&1 &
+UDS_SERVER_PID=$!
+for i in `seq 1 30`; do
+    if [ "`curl -s -w %{http_code} -o /dev/null localhost:8010/api/health/ready`" == "200" ]; then
+        break
+    fi
+    sleep 1
+done
+
+python $GRPC_TRANSPORT_PERF -s unix:$GRPC_SOCKET >$GRPC_TRANSPORT_LOG 2>&1
+if [ $? -ne 0 ]; then
+    cat $UDS_SERVER_LOG
+    echo -e "\n***\n*** GRPC Transport Benchmark Failed\n***"
+    RET=1
+fi
+cat $GRPC_TRANSPORT_LOG
+
+kill $UDS_SERVER_PID
+wait $UDS_SERVER_PID
+
+set -e
+
+kill $SERVER_PID
+wait $SERVER_PID
+
+if [ $RET -eq 0 ]; then
+    echo -e "\n***\n*** Test Passed\n***"
+fi
+
+exit $RET
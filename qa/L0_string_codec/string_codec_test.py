@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import sys
+sys.path.append("../common")
+
+import struct
+import timeit
+import unittest
+import numpy as np
+from tensorrtserver.api import serialize_string_tensor
+import tritongrpcclient.utils as utils
+
+def _legacy_serialize(input_tensor):
+    # Element-by-element serialization used by the clients before the
+    # vectorized implementation, kept as the reference output.
+    flattened = bytes()
+    for obj in np.nditer(input_tensor, flags=["refs_ok"], order='C'):
+        if obj.dtype.type == np.bytes_:
+            if type(obj.item()) == bytes:
+                s = obj.item()
+            else:
+                s = bytes(obj)
+        else:
+            s = str(obj).encode('utf-8')
+        flattened += struct.pack("<I", len(s))
+        flattened += s
+    return flattened
+
+def _legacy_deserialize(encoded_tensor):
+    strs = list()
+    offset = 0
+    while offset < len(encoded_tensor):
+        l = struct.unpack_from("<I", encoded_tensor, offset)[0]
+        offset += 4
+        sb = struct.unpack_from("<{}s".format(l), encoded_tensor, offset)[0]
+        offset += l
+        strs.append(sb)
+    return strs
+
+class StringCodecTest(unittest.TestCase):
+    def setUp(self):
+        self.serializers_ = (serialize_string_tensor, utils.serialize_byte_tensor)
+
+    def _check_identical(self, input_tensor, expected=None):
+        # Check both the small-input and the vectorized code paths
+        for repeat in (1, 100):
+            in0 = np.tile(input_tensor, repeat)
+            if expected is None:
+                expected_bytes = _legacy_serialize(in0)
+            else:
+                expected_bytes = expected * repeat
+            for serialize in self.serializers_:
+                serialized = serialize(in0)
+                self.assertEqual(serialized.dtype, np.uint8)
+                self.assertEqual(serialized.ndim, 1)
+                self.assertEqual(serialized.tobytes(), expected_bytes)
+
+    def test_object(self):
+        self._check_identical(np.array(['', 'a', 'ab' * 100, u'é中'], dtype=object))
+        self._check_identical(np.array([b'b\x00y\x00', 7, 1.5, None], dtype=object))
+        self._check_identical(np.array([str(i) for i in range(24)],
+                                       dtype=object).reshape(2, 3, 4))
+
+    def test_fixed_width_bytes(self):
+        self._check_identical(np.array([b'', b'a\x00b', b'\x00\x00c', b'abcdef']))
+        self._check_identical(np.array([b'', b'']))
+        in0 = np.array([str(i).encode() for i in range(24)]).reshape(2, 3, 4)
+        self._check_identical(in0)
+        # Non-contiguous input is serialized in logical 'C' order
+        self._check_identical(in0.transpose())
+        self._check_identical(in0[:, ::2, 1:])
+
+    def test_fixed_width_str(self):
+        in0 = np.array([u'', u'abc', u'é中', u'x' * 9])
+        expected = _legacy_serialize(in0.astype(object))
+        self._check_identical(in0, expected)
+
+    def test_serialize_perf(self):
+        rng = np.random.RandomState(0)
+        for count in (1, 10, 100, 1000, 10000, 100000, 1000000):
+            words = rng.randint(0, 100000, size=count)
+            for name, in0 in (("object", np.array([str(w) for w in words], dtype=object)),
+                              ("bytes", np.array([str(w).encode() for w in words]))):
+                number = max(1, 10000 // count)
+                new_s = timeit.timeit(lambda: utils.serialize_byte_tensor(in0),
+                                      number=number) / number
+                # The reference serializer is quadratic, only time it on
+                # small inputs.
+                if count <= 10000:
+                    legacy_s = timeit.timeit(lambda: _legacy_serialize(in0),
+                                             number=number) / number
+                    print("{} {:>8} elements: {:10.6f}s vs legacy {:10.6f}s ({:.1f}x)".format(
+                        name, count, new_s, legacy_s, legacy_s / new_s))
+                else:
+                    print("{} {:>8} elements: {:10.6f}s".format(name, count, new_s))
+
+    def _check_deserialize(self, elements):
+        encoded = _legacy_serialize(np.array(elements, dtype=np.bytes_)) \
+            if len(elements) > 0 else b''
+        deserialized = utils.deserialize_bytes_tensor(encoded)
+        self.assertEqual(deserialized.dtype, np.object)
+        self.assertEqual(deserialized.tolist(), elements)
+
+        data, offsets = utils.deserialize_bytes_tensor_offsets(encoded)
+        self.assertEqual(offsets.size, len(elements) + 1)
+        self.assertEqual(offsets[-1], len(encoded))
+        for i, element in enumerate(elements):
+            self.assertEqual(data[offsets[i] + 4:offsets[i + 1]].tobytes(), element)
+
+    def test_deserialize(self):
+        self._check_deserialize([])
+        self._check_deserialize([b''])
+        self._check_deserialize([b'abc', b'de', b'', b'\xc3\xa9'])
+        # Uniform element length
+        self._check_deserialize([b'ab', b'cd', b'ef'])
+        self._check_deserialize([b'ab', b'cd', b'e'])
+
+    def test_deserialize_view(self):
+        encoded = bytearray(_legacy_serialize(np.array([b'ab', b'cde'])))
+        data, offsets = utils.deserialize_bytes_tensor_offsets(encoded)
+        # The data is a view of the encoded buffer
+        encoded[offsets[1] + 4] = ord('x')
+        self.assertEqual(data[offsets[1] + 4:offsets[2]].tobytes(), b'xde')
+
+    def test_deserialize_invalid(self):
+        encoded = _legacy_serialize(np.array([b'ab', b'cde']))
+        for invalid in (encoded[:-1], encoded + b'\x01\x00'):
+            with self.assertRaises(utils.InferenceServerException):
+                utils.deserialize_bytes_tensor(invalid)
+
+    def test_deserialize_perf(self):
+        rng = np.random.RandomState(0)
+        for count in (1, 10, 100, 1000, 10000, 100000, 1000000):
+            words = rng.randint(0, 100000, size=count)
+            for name, in0 in (("variable", np.array([str(w) for w in words], dtype=object)),
+                              ("uniform", np.array(['{:06}'.format(w) for w in words],
+                                                   dtype=object))):
+                encoded = utils.serialize_byte_tensor(in0).tobytes()
+                number = max(1, 10000 // count)
+                new_s = timeit.timeit(lambda: utils.deserialize_bytes_tensor(encoded),
+                                      number=number) / number
+                view_s = timeit.timeit(
+                    lambda: utils.deserialize_bytes_tensor_offsets(encoded),
+                    number=number) / number
+                legacy_s = timeit.timeit(lambda: _legacy_deserialize(encoded),
+                                         number=number) / number
+                print("{} {:>8} elements: {:10.6f}s, offsets {:10.6f}s vs legacy {:10.6f}s".format(
+                    name, count, new_s, view_s, legacy_s))
+
+if __name__ == '__main__':
+    unittest.main()
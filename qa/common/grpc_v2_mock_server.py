@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import random
+import sys
+import threading
+import time
+from concurrent import futures
+import grpc
+import numpy as np
+from tritongrpcclient import grpc_service_v2_pb2
+from tritongrpcclient import grpc_service_v2_pb2_grpc
+
+
+class MockServer(grpc_service_v2_pb2_grpc.GRPCInferenceServiceServicer):
+    """An inference server that serves the 'simple' model, whose OUTPUT0
+    is INPUT0 + INPUT1, and an 'identity' model that returns each input
+    INPUTn as OUTPUTn, on both the ModelInfer and the ModelStreamInfer
+    calls. Each request is answered after 'delay_s' plus a
+    random time of up to 'jitter_s'. The server counts the requests it
+    receives and the requests that were cancelled by the client, and
+    records the peers that sent them. Messages of any size are accepted.
+    The server listens on 'address', which is either a host and port, a
+    port of 0 picking any free port, or a unix domain socket given as
+    'unix:<path>'.
+    """
+
+    def __init__(self, delay_s=0, jitter_s=0, address="localhost:0"):
+        self.delay_s = delay_s
+        self.jitter_s = jitter_s
+        self.ready = True
+        self.request_count = 0
+        self.cancel_count = 0
+        self.peers = set()
+        self._lock = threading.Lock()
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=16),
+            options=[('grpc.max_send_message_length', -1),
+                     ('grpc.max_receive_message_length', -1)])
+        grpc_service_v2_pb2_grpc.add_GRPCInferenceServiceServicer_to_server(
+            self, self._server)
+        port = self._server.add_insecure_port(address)
+        if address.startswith('unix:'):
+            self.url = address
+        else:
+            self.url = address.rsplit(':', 1)[0] + ":" + str(port)
+        self._server.start()
+
+    def stop(self):
+        self._server.stop(None)
+
+    def wait(self):
+        self._server.wait_for_termination()
+
+    def ServerReady(self, request, context):
+        return grpc_service_v2_pb2.ServerReadyResponse(ready=self.ready)
+
+    def ModelInfer(self, request, context):
+        with self._lock:
+            self.request_count += 1
+            self.peers.add(context.peer())
+        time.sleep(self.delay_s + random.uniform(0, self.jitter_s))
+        if not context.is_active():
+            with self._lock:
+                self.cancel_count += 1
+
+        response = grpc_service_v2_pb2.ModelInferResponse(
+            model_name=request.model_name, id=request.id)
+        if request.model_name == 'identity':
+            for tensor in request.inputs:
+                output = response.outputs.add()
+                output.name = tensor.name.replace('INPUT', 'OUTPUT')
+                output.datatype = tensor.datatype
+                output.shape.extend(tensor.shape)
+                output.contents.raw_contents = tensor.contents.raw_contents
+            return response
+
+        inputs = { tensor.name : np.frombuffer(tensor.contents.raw_contents, dtype=np.int32)
+                   for tensor in request.inputs }
+        output = response.outputs.add()
+        output.name = 'OUTPUT0'
+        output.datatype = 'INT32'
+        output.shape.extend(request.inputs[0].shape)
+        output.contents.raw_contents = (inputs['INPUT0'] + inputs['INPUT1']).tobytes()
+        return response
+
+    def ModelStreamInfer(self, request_iterator, context):
+        for request in request_iterator:
+            yield grpc_service_v2_pb2.ModelStreamInferResponse(
+                infer_response=self.ModelInfer(request, context))
+
+
+if __name__ == '__main__':
+    # Serves on the address given as argument until killed
+    server = MockServer(address=sys.argv[1] if len(sys.argv) > 1 else "localhost:8001")
+    print(server.url, flush=True)
+    server.wait()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+
+import struct
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+import rapidjson as json
+from tritonhttpclient.utils import *
+
+
+class MockServer:
+    """An inference server that serves the 'simple' model, whose OUTPUT0
+    is INPUT0 + INPUT1 and whose OUTPUT1 is INPUT0 - INPUT1, and an
+    'identity' model that returns each input INPUTn as OUTPUTn, on the
+    v2 HTTP inference endpoint. Inputs are read from the JSON inference
+    header or from the binary data following it. The requested outputs
+    that set the 'binary_data' parameter are returned as binary data,
+    the others as JSON. Each request is answered after 'delay_s'. The
+    server records the headers and body of the last request it
+    received. Requests for any other model fail with status 400.
+    """
+
+    def __init__(self, delay_s=0, address="localhost:0"):
+        self.delay_s = delay_s
+        self.request_count = 0
+        self.last_headers = None
+        self.last_body = None
+        self._lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers['Content-Length']))
+                with server._lock:
+                    server.request_count += 1
+                    server.last_headers = self.headers
+                    server.last_body = body
+                time.sleep(server.delay_s)
+                try:
+                    status, headers, body = server._infer(
+                        self.path, self.headers, body)
+                except Exception as ex:
+                    status, headers, body = 400, {}, json.dumps({
+                        'error': str(ex)
+                    }).encode('utf-8')
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        host, port = address.rsplit(':', 1)
+        self._server = ThreadingHTTPServer((host, int(port)), Handler)
+        self._server.daemon_threads = True
+        self.url = host + ":" + str(self._server.server_address[1])
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def wait(self):
+        self._thread.join()
+
+    def _infer(self, path, headers, body):
+        model_name = path.split('/')[3]
+        header_length = headers.get('Inference-Header-Content-Length')
+        if header_length is None:
+            request = json.loads(body)
+            binary = b''
+        else:
+            request = json.loads(body[:int(header_length)])
+            binary = body[int(header_length):]
+
+        inputs = {}
+        offset = 0
+        for tensor in request['inputs']:
+            dtype = triton_to_np_dtype(tensor['datatype'])
+            size = tensor.get('parameters', {}).get('binary_data_size')
+            if size is None:
+                if tensor['datatype'] == 'BYTES':
+                    data = np.array([d.encode('utf-8') for d in tensor['data']],
+                                    dtype=np.object_)
+                else:
+                    data = np.array(tensor['data'], dtype=dtype)
+            else:
+                raw = np.frombuffer(binary, dtype=np.uint8, count=size,
+                                    offset=offset)
+                offset += size
+                if tensor['datatype'] == 'BYTES':
+                    data = deserialize_bytes_tensor(raw)
+                else:
+                    data = raw.view(dtype)
+            inputs[tensor['name']] = (tensor['datatype'],
+                                      data.reshape(tensor['shape']))
+
+        if model_name == 'identity':
+            outputs = { name.replace('INPUT', 'OUTPUT') : value
+                        for name, value in inputs.items() }
+        elif model_name == 'simple':
+            outputs = {
+                'OUTPUT0' : ('INT32', inputs['INPUT0'][1] + inputs['INPUT1'][1]),
+                'OUTPUT1' : ('INT32', inputs['INPUT0'][1] - inputs['INPUT1'][1])
+            }
+        else:
+            raise Exception("unknown model '" + model_name + "'")
+
+        requested = request.get('outputs')
+        if requested is None:
+            requested = [{'name': name} for name in sorted(outputs)]
+        response = {'model_name': model_name, 'outputs': []}
+        if 'id' in request:
+            response['id'] = request['id']
+        binary_outputs = []
+        for output in requested:
+            datatype, data = outputs[output['name']]
+            tensor = {
+                'name': output['name'],
+                'datatype': datatype,
+                'shape': list(data.shape)
+            }
+            if output.get('parameters', {}).get('binary_data', False):
+                if datatype == 'BYTES':
+                    raw = b''.join(
+                        struct.pack('<I', len(d)) + d for d in data.flat)
+                else:
+                    raw = data.tobytes()
+                tensor['parameters'] = {'binary_data_size': len(raw)}
+                binary_outputs.append(raw)
+            elif datatype == 'BYTES':
+                tensor['data'] = [d.decode('utf-8') for d in data.flat]
+            else:
+                tensor['data'] = data.flatten().tolist()
+            response['outputs'].append(tensor)
+
+        response_json = json.dumps(response).encode('utf-8')
+        if not binary_outputs:
+            return 200, {}, response_json
+        return 200, {
+            'Inference-Header-Content-Length': str(len(response_json))
+        }, b''.join([response_json] + binary_outputs)
+
+
+if __name__ == '__main__':
+    # Serves on the address given as argument until killed
+    server = MockServer(address=sys.argv[1] if len(sys.argv) > 1 else "localhost:8000")
+    print(server.url, flush=True)
+    server.wait()
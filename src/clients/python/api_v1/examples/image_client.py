@@ -80,14 +80,7 @@ def parse_model(url, protocol, model_name, batch_size, verbose=False):
     requirements for an image classification network (as expected by
     this client)
     """
-    ctx = ServerStatusContext(url, protocol, model_name, verbose)
-    server_status = ctx.get_server_status()
-
-    if model_name not in server_status.model_status:
-        raise Exception("unable to get status for '" + model_name + "'")
-
-    status = server_status.model_status[model_name]
-    config = status.config
+    config = get_model_status_cache(url, protocol, verbose).get_model_config(model_name)
 
     if len(config.input) != 1:
         raise Exception("expecting 1 input, got {}".format(len(config.input)))
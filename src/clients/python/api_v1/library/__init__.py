@@ -25,21 +25,36 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from builtins import range
+from collections import deque
+from collections import OrderedDict
 from enum import IntEnum
 from functools import partial
 from future.utils import iteritems
 from ctypes import *
+import importlib
 import numpy as np
 from numpy.ctypeslib import ndpointer
-import pkg_resources
+import os
 import struct
+import sys
 import threading
-from google.protobuf import text_format
-import tensorrtserver.api.model_config_pb2
-from tensorrtserver.api.server_status_pb2 import ModelRepositoryIndex
-from tensorrtserver.api.server_status_pb2 import ServerStatus
-from tensorrtserver.api.server_status_pb2 import SharedMemoryStatus
-from tensorrtserver.api.api_pb2 import *
+import time
+
+# The protobuf modules are imported on first access of one of these
+# names, see __getattr__() at the end of this module.
+_LAZY_ATTRIBUTES = {
+    'text_format' : ('google.protobuf.text_format', None),
+    'model_config_pb2' : ('tensorrtserver.api.model_config_pb2', None),
+    'server_status_pb2' : ('tensorrtserver.api.server_status_pb2', None),
+    'api_pb2' : ('tensorrtserver.api.api_pb2', None),
+    'MODEL_READY' : ('tensorrtserver.api.server_status_pb2', 'MODEL_READY'),
+    'ModelRepositoryIndex' : ('tensorrtserver.api.server_status_pb2', 'ModelRepositoryIndex'),
+    'ServerStatus' : ('tensorrtserver.api.server_status_pb2', 'ServerStatus'),
+    'SharedMemoryStatus' : ('tensorrtserver.api.server_status_pb2', 'SharedMemoryStatus'),
+    'InferSharedMemory' : ('tensorrtserver.api.api_pb2', 'InferSharedMemory'),
+    'InferRequestHeader' : ('tensorrtserver.api.api_pb2', 'InferRequestHeader'),
+    'InferResponseHeader' : ('tensorrtserver.api.api_pb2', 'InferResponseHeader'),
+}
 
 class _utf8(object):
     @classmethod
@@ -51,13 +66,60 @@ class _utf8(object):
         else:
             return value.encode('utf8')
 
-import os
 _request_lib = "request" if os.name == 'nt' else 'librequest.so'
 _crequest_lib = "crequest" if os.name == 'nt' else 'libcrequest.so'
-_request_path = pkg_resources.resource_filename('tensorrtserver.api', _request_lib)
-_request = cdll.LoadLibrary(_request_path)
-_crequest_path = pkg_resources.resource_filename('tensorrtserver.api', _crequest_lib)
-_crequest = cdll.LoadLibrary(_crequest_path)
+_library_dir = os.path.dirname(os.path.abspath(__file__))
+_library_lock = threading.Lock()
+_crequest_library = None
+
+def _load_crequest_library():
+    """
+    Load the client libraries, once, and return libcrequest.
+    """
+    global _crequest_library
+    with _library_lock:
+        if _crequest_library is None:
+            # libcrequest depends on librequest, which is not on the
+            # search path of the dynamic loader.
+            cdll.LoadLibrary(os.path.join(_library_dir, _request_lib))
+            _crequest_library = cdll.LoadLibrary(
+                os.path.join(_library_dir, _crequest_lib))
+    return _crequest_library
+
+class _LazyFunction(object):
+    """
+    A function of libcrequest that is bound on its first call, using
+    the 'restype' and 'argtypes' set on this object. The module globals
+    referring to this object are then replaced by the bound function
+    so that later calls go directly to the library.
+    """
+    def __init__(self, name):
+        self._name = name
+        self.restype = c_int
+        self.argtypes = None
+
+    def __call__(self, *args):
+        fn = getattr(_load_crequest_library(), self._name)
+        fn.restype = self.restype
+        if self.argtypes is not None:
+            fn.argtypes = self.argtypes
+        module_globals = globals()
+        for name, value in list(module_globals.items()):
+            if value is self:
+                module_globals[name] = fn
+        return fn(*args)
+
+class _LazyLibrary(object):
+    """
+    Stands in for libcrequest so that declaring its functions does not
+    load the library.
+    """
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return _LazyFunction(name)
+
+_crequest = _LazyLibrary()
 
 _crequest_error_new = _crequest.ErrorNew
 _crequest_error_new.restype = c_void_p
@@ -188,6 +250,9 @@ _crequest_infer_ctx_input_new.restype = c_void_p
 _crequest_infer_ctx_input_new.argtypes = [POINTER(c_void_p), c_void_p, _utf8]
 _crequest_infer_ctx_input_del = _crequest.InferContextInputDelete
 _crequest_infer_ctx_input_del.argtypes = [c_void_p]
+_crequest_infer_ctx_input_reset = _crequest.InferContextInputReset
+_crequest_infer_ctx_input_reset.restype = c_void_p
+_crequest_infer_ctx_input_reset.argtypes = [c_void_p]
 _crequest_infer_ctx_input_set_shape = _crequest.InferContextInputSetShape
 _crequest_infer_ctx_input_set_shape.restype = c_void_p
 _crequest_infer_ctx_input_set_shape.argtypes = [c_void_p,
@@ -196,6 +261,11 @@ _crequest_infer_ctx_input_set_shape.argtypes = [c_void_p,
 _crequest_infer_ctx_input_set_raw = _crequest.InferContextInputSetRaw
 _crequest_infer_ctx_input_set_raw.restype = c_void_p
 _crequest_infer_ctx_input_set_raw.argtypes = [c_void_p, c_void_p, c_uint64]
+_crequest_infer_ctx_input_set_raw_batch = _crequest.InferContextInputSetRawBatch
+_crequest_infer_ctx_input_set_raw_batch.restype = c_void_p
+_crequest_infer_ctx_input_set_raw_batch.argtypes = [c_void_p, c_void_p,
+                                                    ndpointer(c_uint64, flags="C_CONTIGUOUS"),
+                                                    c_uint64]
 
 _crequest_infer_ctx_input_set_shared_memory = _crequest.InferContextInputSetSharedMemory
 _crequest_infer_ctx_input_set_shared_memory.restype = c_void_p
@@ -227,6 +297,10 @@ _crequest_infer_ctx_result_next_raw = _crequest.InferContextResultNextRaw
 _crequest_infer_ctx_result_next_raw.restype = c_void_p
 _crequest_infer_ctx_result_next_raw.argtypes = [c_void_p, c_uint64, POINTER(c_char_p),
                                                 POINTER(c_uint64)]
+_crequest_infer_ctx_result_batch_raw = _crequest.InferContextResultBatchRaw
+_crequest_infer_ctx_result_batch_raw.restype = c_void_p
+_crequest_infer_ctx_result_batch_raw.argtypes = [c_void_p, c_uint64, c_void_p, c_uint64,
+                                                 POINTER(c_uint64)]
 _crequest_infer_ctx_result_class_cnt = _crequest.InferContextResultClassCount
 _crequest_infer_ctx_result_class_cnt.restype = c_void_p
 _crequest_infer_ctx_result_class_cnt.argtypes = [c_void_p, c_uint64, POINTER(c_uint64)]
@@ -268,6 +342,55 @@ def _raise_error(msg):
     raise ex
 
 
+# Inputs with fewer elements than this are serialized without the
+# vectorized fast paths.
+_MIN_VECTORIZED_ELEMENTS = 64
+
+def _serialize_fixed_width_bytes(input_tensor):
+    # Each np.bytes_ element occupies 'itemsize' bytes padded with trailing
+    # nulls, which are not part of the element value. Lay every element out
+    # as a row of [4-byte length | padded value] and then keep only the
+    # significant bytes of each row, all without a per-element loop.
+    count = input_tensor.size
+    width = input_tensor.dtype.itemsize
+    values = np.ascontiguousarray(input_tensor).view(np.uint8).reshape(count, width)
+
+    nonzero = values != 0
+    lengths = np.where(nonzero.any(axis=1),
+                       width - np.argmax(nonzero[:, ::-1], axis=1), 0)
+
+    rows = np.empty((count, 4 + width), dtype=np.uint8)
+    rows[:, :4] = lengths.astype('<u4').view(np.uint8).reshape(count, 4)
+    rows[:, 4:] = values
+    return rows[np.arange(4 + width) < (lengths[:, None] + 4)]
+
+def _serialize_variable_width_bytes(elements):
+    # Compute all lengths up front, then scatter the lengths and the
+    # concatenated element bytes into a single preallocated buffer. The
+    # setup cost of the vectorized scatter dominates for few elements so
+    # those are simply joined.
+    count = len(elements)
+    if count < _MIN_VECTORIZED_ELEMENTS:
+        pieces = list()
+        for s in elements:
+            pieces.append(struct.pack("<I", len(s)))
+            pieces.append(s)
+        return np.frombuffer(b''.join(pieces), dtype=np.uint8)
+
+    lengths = np.fromiter(map(len, elements), dtype='<u4', count=count)
+    data = np.frombuffer(b''.join(elements), dtype=np.uint8)
+
+    flattened = np.empty(4 * count + data.size, dtype=np.uint8)
+    prefix_offsets = np.arange(count, dtype=np.int64) * 4
+    prefix_offsets[1:] += np.cumsum(lengths[:-1], dtype=np.int64)
+    prefix_positions = (prefix_offsets[:, None] + np.arange(4)).ravel()
+
+    is_prefix = np.zeros(flattened.size, dtype=np.bool_)
+    is_prefix[prefix_positions] = True
+    flattened[prefix_positions] = lengths.view(np.uint8)
+    flattened[~is_prefix] = data
+    return flattened
+
 def serialize_string_tensor(input_tensor):
     """
     Serializes a string tensor into a flat numpy array of length prepend strings.
@@ -300,26 +423,64 @@ def serialize_string_tensor(input_tensor):
     # a 1-dimensional array containing the 4-byte string length followed by the
     # actual string characters. All strings are concatenated together in "C"
     # order.
-    if (input_tensor.dtype == np.object) or (input_tensor.dtype.type == np.bytes_):
-        flattened = bytes()
-        for obj in np.nditer(input_tensor, flags=["refs_ok"], order='C'):
-            # If directly passing bytes to STRING type,
-            # don't convert it to str as Python will encode the
-            # bytes which may distort the meaning
-            if obj.dtype.type == np.bytes_:
-                if type(obj.item()) == bytes:
-                    s = obj.item()
-                else:
-                    s = bytes(obj)
-            else:
-                s = str(obj).encode('utf-8')
-            flattened += struct.pack("<I", len(s))
-            flattened += s
-        return np.asarray(flattened)
+    if input_tensor.dtype.type == np.str_:
+        input_tensor = np.char.encode(input_tensor, 'utf-8')
+
+    if input_tensor.dtype.type == np.bytes_:
+        # Fixed-width bytes are handled entirely with vectorized operations.
+        # Small inputs go through tolist(), which drops the trailing null
+        # padding in the same way.
+        if input_tensor.size >= _MIN_VECTORIZED_ELEMENTS:
+            return _serialize_fixed_width_bytes(input_tensor)
+        return _serialize_variable_width_bytes(input_tensor.ravel().tolist())
+    elif input_tensor.dtype == np.object:
+        # Python objects are converted with str(), so bytes objects are
+        # serialized using their string representation.
+        return _serialize_variable_width_bytes(
+            [str(obj).encode('utf-8') for obj in input_tensor.flat])
     else:
         _raise_error("cannot serialize string tensor: invalid datatype")
     return None
 
+def _string_tensor_offsets(data, start=0, count=None):
+    # Elements of uniform length, e.g. fixed size tokens, can be located
+    # and validated without visiting each element.
+    end = data.size
+    if end - start >= 4:
+        stride = 4 + int(data[start:start + 4].view('<u4')[0])
+        uniform_count = (end - start) // stride if count is None else count
+        uniform_end = start + uniform_count * stride
+        if (uniform_end <= end) and ((count is not None) or (uniform_end == end)):
+            prefixes = data[start:uniform_end].reshape(uniform_count, stride)[:, :4]
+            if np.all(prefixes == data[start:start + 4]):
+                return start + np.arange(uniform_count + 1, dtype=np.int64) * stride
+
+    # Otherwise walk the length prefixes, one unpack per element.
+    unpack_from = struct.Struct("<I").unpack_from
+    buf = memoryview(data)
+    offsets = [start]
+    offset = start
+    while (offset < end) if count is None else (len(offsets) <= count):
+        if offset + 4 > end:
+            _raise_error("invalid string tensor: truncated length prefix")
+        offset += 4 + unpack_from(buf, offset)[0]
+        offsets.append(offset)
+    if offset > end:
+        _raise_error("invalid string tensor: element exceeds buffer")
+    return np.array(offsets, dtype=np.int64)
+
+def _deserialize_string_tensor(val_buf, start=0, count=None):
+    # String results contain a 4-byte string length followed by the
+    # actual string characters. Locate all elements first and then
+    # slice them out of a single copy of the buffer.
+    data = np.frombuffer(val_buf, dtype=np.uint8)
+    offsets = _string_tensor_offsets(data, start, count)
+    encoded = data[:offsets[-1]].tobytes()
+    val = np.empty(offsets.size - 1, dtype=object)
+    val[:] = [encoded[begin:end]
+              for begin, end in zip((offsets[:-1] + 4).tolist(), offsets[1:].tolist())]
+    return val
+
 class ProtocolType(IntEnum):
     """Protocol types supported by the client API
 
@@ -628,7 +789,9 @@ class ServerStatusContext:
             c_void_p(_crequest_status_ctx_get(
                 self._ctx, byref(cstatus), byref(cstatus_len))))
 
-        status = text_format.Parse(cstatus.value.decode(), ServerStatus())
+        from tensorrtserver.api.server_status_pb2 import ServerStatus
+        status = ServerStatus()
+        status.ParseFromString(string_at(cstatus, cstatus_len.value))
         return status
 
     def get_last_request_id(self):
@@ -727,6 +890,7 @@ class ModelRepositoryContext:
                 self._ctx, byref(cindex), byref(cindex_len))))
         index_buf = cast(cindex, POINTER(c_byte * cindex_len.value))[0]
 
+        from tensorrtserver.api.server_status_pb2 import ModelRepositoryIndex
         index = ModelRepositoryIndex()
         index.ParseFromString(index_buf)
         return index
@@ -744,6 +908,195 @@ class ModelRepositoryContext:
         return self._last_request_id
 
 
+class ModelStatusCache:
+    """A ModelStatusCache object holds the status of the models of an
+    inference server, including their configuration, so that repeated
+    lookups do not contact the server. The status of a model is fetched
+    on its first lookup, and fetched again when a lookup asks for a
+    version that is not ready in the held status. Loading or unloading
+    a model with a ModelControlContext drops its held status from the
+    cache shared by the process, see get_model_status_cache().
+
+    The statistics in a held status are those at the time it was
+    fetched, use ServerStatusContext to get current statistics.
+
+    Parameters
+    ----------
+    url : str
+        The inference server URL, e.g. localhost:8000.
+
+    protocol : ProtocolType
+        The protocol used to communicate with the server.
+
+    verbose : bool
+        If True generate verbose output.
+
+    http_headers : list of strings
+        HTTP headers to send with request. Ignored for GRPC
+        protocol. Each header must be specified as "Header:Value".
+
+    """
+    def __init__(self, url, protocol, verbose=False, http_headers=[]):
+        self._url = url
+        self._protocol = protocol
+        self._verbose = verbose
+        self._http_headers = http_headers
+        self._lock = threading.Lock()
+        # Model name -> ModelStatus
+        self._model_status = dict()
+        self._hit_count = 0
+        self._miss_count = 0
+
+    def get_model_status(self, model_name, model_version=None):
+        """Get the status of a model. The returned protobuf is shared
+        and must not be modified.
+
+        Parameters
+        ----------
+        model_name : str
+            The name of the model.
+
+        model_version : int
+            The version of the model that must be ready in the status,
+            or None to accept the held status of any version.
+
+        Returns
+        -------
+        ModelStatus
+            The ModelStatus protobuf of the model.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get the status of the model.
+
+        """
+        from tensorrtserver.api.server_status_pb2 import MODEL_READY
+        with self._lock:
+            status = self._model_status.get(model_name)
+            if (status is not None) and \
+               ((model_version is None) or
+                ((model_version in status.version_status) and
+                 (status.version_status[model_version].ready_state == MODEL_READY))):
+                self._hit_count += 1
+                return status
+            self._miss_count += 1
+
+        with ServerStatusContext(self._url, self._protocol, model_name,
+                                 self._verbose, self._http_headers) as ctx:
+            server_status = ctx.get_server_status()
+        if model_name not in server_status.model_status:
+            _raise_error("unable to get status for model '" + model_name + "'")
+        status = server_status.model_status[model_name]
+        with self._lock:
+            self._model_status[model_name] = status
+        return status
+
+    def get_model_config(self, model_name, model_version=None):
+        """Get the configuration of a model, as for get_model_status().
+
+        Returns
+        -------
+        ModelConfig
+            The ModelConfig protobuf of the model.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get the status of the model.
+
+        """
+        return self.get_model_status(model_name, model_version).config
+
+    def invalidate(self, model_name=None):
+        """Drop the held status of a model, so that it is fetched again
+        on the next lookup.
+
+        Parameters
+        ----------
+        model_name : str
+            The name of the model, or None to drop the status of all
+            models.
+
+        """
+        with self._lock:
+            if model_name is None:
+                self._model_status.clear()
+            else:
+                self._model_status.pop(model_name, None)
+
+    def refresh(self):
+        """Drop the held status of the models that are no longer in the
+        model repository of the server.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get the index of the model repository.
+
+        """
+        with ModelRepositoryContext(self._url, self._protocol,
+                                    self._verbose, self._http_headers) as ctx:
+            index = ctx.get_model_repository_index()
+        model_names = set(model.name for model in index.models)
+        with self._lock:
+            for model_name in list(self._model_status):
+                if model_name not in model_names:
+                    del self._model_status[model_name]
+
+    def get_stats(self):
+        """Get the statistics of the cache.
+
+        Returns
+        -------
+        dict
+            The 'hit_count' and 'miss_count' of the lookups and the
+            'entry_count' of the models whose status is held.
+
+        """
+        with self._lock:
+            return {
+                'hit_count' : self._hit_count,
+                'miss_count' : self._miss_count,
+                'entry_count' : len(self._model_status) }
+
+_model_status_caches = dict()
+_model_status_caches_lock = threading.Lock()
+
+def get_model_status_cache(url, protocol, verbose=False, http_headers=[]):
+    """Get the ModelStatusCache shared by the process for the inference
+    server at 'url'. The cache is created by the first call for the
+    server, using its 'verbose' and 'http_headers'.
+
+    Parameters
+    ----------
+    url : str
+        The inference server URL, e.g. localhost:8000.
+
+    protocol : ProtocolType
+        The protocol used to communicate with the server.
+
+    verbose : bool
+        If True generate verbose output.
+
+    http_headers : list of strings
+        HTTP headers to send with request. Ignored for GRPC
+        protocol. Each header must be specified as "Header:Value".
+
+    Returns
+    -------
+    ModelStatusCache
+        The cache for the server.
+
+    """
+    with _model_status_caches_lock:
+        key = (url, int(protocol))
+        cache = _model_status_caches.get(key)
+        if cache is None:
+            cache = ModelStatusCache(url, protocol, verbose, http_headers)
+            _model_status_caches[key] = cache
+        return cache
+
 class ModelControlContext:
     """Performs a model control request to an inference server.
 
@@ -766,6 +1119,7 @@ class ModelControlContext:
     def __init__(self, url, protocol, verbose=False, http_headers=[]):
         self._last_request_id = 0
         self._ctx = c_void_p()
+        self._status_cache_key = (url, int(protocol))
 
         b_http_headers = list()
         if http_headers is not None:
@@ -821,6 +1175,7 @@ class ModelControlContext:
 
         self._last_request_id = _raise_if_error(
             c_void_p(_crequest_model_control_ctx_load(self._ctx, model_name)))
+        self._invalidate_status(model_name)
         return
 
     def unload(self, model_name):
@@ -843,8 +1198,15 @@ class ModelControlContext:
 
         self._last_request_id = _raise_if_error(
             c_void_p(_crequest_model_control_ctx_unload(self._ctx, model_name)))
+        self._invalidate_status(model_name)
         return
 
+    def _invalidate_status(self, model_name):
+        with _model_status_caches_lock:
+            cache = _model_status_caches.get(self._status_cache_key)
+        if cache is not None:
+            cache.invalidate(model_name)
+
     def get_last_request_id(self):
         """Get the request ID of the most recent load() or unload()
         request.
@@ -1021,6 +1383,8 @@ class SharedMemoryControlContext:
             c_void_p(_crequest_shm_control_ctx_get_status(
                 self._ctx, byref(cstatus), byref(cstatus_len))))
 
+        from google.protobuf import text_format
+        from tensorrtserver.api.server_status_pb2 import SharedMemoryStatus
         status = text_format.Parse(cstatus.value.decode(), SharedMemoryStatus())
         return status
 
@@ -1038,6 +1402,343 @@ class SharedMemoryControlContext:
         return self._last_request_id
 
 
+class _InflightResponse:
+    """The response of a request in flight, shared with the identical
+    requests issued before it completes.
+    """
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+class ResponseCache:
+    """A ResponseCache object holds the results of inference requests
+    so that repeating a request returns the held results without
+    contacting the server. Results are evicted in least recently used
+    order to stay within the byte budget of the cache and expire once
+    they are older than the time to live. Identical requests issued
+    while the first one is in flight wait for its results instead of
+    being sent to the server.
+
+    The cache must only be used with deterministic models, i.e. models
+    that always produce the same outputs for the same inputs. A cache
+    can be shared by multiple InferContext objects and threads.
+
+    Parameters
+    ----------
+    max_byte_size : int
+        The maximum total size, in bytes, of the results held by the
+        cache.
+
+    ttl_s : float
+        The time, in seconds, after which held results expire, or
+        None to indicate that results never expire.
+
+    """
+    def __init__(self, max_byte_size, ttl_s=None):
+        self._max_byte_size = max_byte_size
+        self._ttl_s = ttl_s
+        self._lock = threading.Lock()
+        # key -> (value, byte size, expiry time) in LRU order
+        self._entries = OrderedDict()
+        self._inflight = dict()
+        self._byte_size = 0
+        self._hit_count = 0
+        self._miss_count = 0
+        self._collapsed_count = 0
+        self._eviction_count = 0
+
+    def get_stats(self):
+        """Get the statistics of the cache.
+
+        Returns
+        -------
+        dict
+            The 'hit_count' and 'miss_count' of the lookups, the
+            'collapsed_count' of the requests that waited for an
+            identical request in flight, the 'eviction_count' of the
+            results evicted to stay within the byte budget, and the
+            'entry_count' and 'byte_size' of the held results.
+
+        """
+        with self._lock:
+            return {
+                'hit_count' : self._hit_count,
+                'miss_count' : self._miss_count,
+                'collapsed_count' : self._collapsed_count,
+                'eviction_count' : self._eviction_count,
+                'entry_count' : len(self._entries),
+                'byte_size' : self._byte_size }
+
+    def clear(self):
+        """Remove all the results held by the cache.
+
+        """
+        with self._lock:
+            self._entries.clear()
+            self._byte_size = 0
+
+    def _get_or_compute(self, key, compute, byte_size_fn):
+        """Returns the value held for 'key'. On a miss the value is
+        produced by 'compute', which runs once for all the identical
+        requests in flight, and is held if it fits the byte budget.
+        Errors are raised to every waiting request and not held.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if (entry[2] is None) or (time.monotonic() < entry[2]):
+                    self._entries.move_to_end(key)
+                    self._hit_count += 1
+                    return entry[0]
+                self._remove(key)
+
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                self._collapsed_count += 1
+                leader = False
+            else:
+                self._miss_count += 1
+                inflight = _InflightResponse()
+                self._inflight[key] = inflight
+                leader = True
+
+        if not leader:
+            inflight.event.wait()
+            if inflight.error is not None:
+                raise inflight.error
+            return inflight.value
+
+        try:
+            inflight.value = compute()
+        except BaseException as e:
+            inflight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+                if inflight.error is None:
+                    self._insert(key, inflight.value, byte_size_fn(inflight.value))
+            inflight.event.set()
+        return inflight.value
+
+    def _insert(self, key, value, byte_size):
+        if byte_size > self._max_byte_size:
+            return
+        if key in self._entries:
+            self._remove(key)
+        expiry = None if self._ttl_s is None else time.monotonic() + self._ttl_s
+        self._entries[key] = (value, byte_size, expiry)
+        self._byte_size += byte_size
+        while self._byte_size > self._max_byte_size:
+            self._remove(next(iter(self._entries)))
+            self._eviction_count += 1
+
+    def _remove(self, key):
+        _, byte_size, _ = self._entries.pop(key)
+        self._byte_size -= byte_size
+
+def _results_byte_size(results):
+    """Returns the approximate size, in bytes, of the results of
+    InferContext.run().
+    """
+    byte_size = 0
+    for value in results.values():
+        for v in (value if isinstance(value, list) else [value]):
+            byte_size += v.nbytes if isinstance(v, np.ndarray) else sys.getsizeof(v)
+    return byte_size
+
+def _model_dtype_to_np(model_dtype):
+    import tensorrtserver.api.model_config_pb2 as model_config_pb2
+    if model_dtype == model_config_pb2.TYPE_BOOL:
+        return np.bool_
+    elif model_dtype == model_config_pb2.TYPE_UINT8:
+        return np.uint8
+    elif model_dtype == model_config_pb2.TYPE_UINT16:
+        return np.uint16
+    elif model_dtype == model_config_pb2.TYPE_UINT32:
+        return np.uint32
+    elif model_dtype == model_config_pb2.TYPE_UINT64:
+        return np.uint64
+    elif model_dtype == model_config_pb2.TYPE_INT8:
+        return np.int8
+    elif model_dtype == model_config_pb2.TYPE_INT16:
+        return np.int16
+    elif model_dtype == model_config_pb2.TYPE_INT32:
+        return np.int32
+    elif model_dtype == model_config_pb2.TYPE_INT64:
+        return np.int64
+    elif model_dtype == model_config_pb2.TYPE_FP16:
+        return np.float16
+    elif model_dtype == model_config_pb2.TYPE_FP32:
+        return np.float32
+    elif model_dtype == model_config_pb2.TYPE_FP64:
+        return np.float64
+    elif model_dtype == model_config_pb2.TYPE_STRING:
+        return np.dtype(object)
+    _raise_error("unknown result datatype " + str(model_dtype))
+
+def _is_local_url(url):
+    """Returns True if 'url' is a unix domain socket or the host of
+    'url' is an address of this host.
+    """
+    import socket
+    if url.startswith('unix:'):
+        return True
+    host = url.split('/')[0]
+    if host.startswith('['):
+        host = host[1:].split(']')[0]
+    elif host.count(':') == 1:
+        host = host.split(':')[0]
+    try:
+        addrs = set(info[4][0] for info in socket.getaddrinfo(host, None))
+    except socket.gaierror:
+        return False
+    local_addrs = set(['::1'])
+    try:
+        local_addrs.update(info[4][0] for info in socket.getaddrinfo(socket.gethostname(), None))
+    except socket.gaierror:
+        pass
+    return any(addr.startswith('127.') or (addr in local_addrs) for addr in addrs)
+
+class _SharedMemoryPool:
+    """A pool of system shared memory regions, registered with the
+    server and handed out as sub-allocations. A new region is added
+    whenever none of the existing regions has room for an allocation.
+    """
+    def __init__(self, shm, url, protocol, verbose, http_headers, region_byte_size):
+        self._shm = shm
+        self._region_byte_size = region_byte_size
+        self._name_prefix = "infer_ctx_" + str(os.getpid()) + "_" + str(id(self))
+        self._shared_memory_ctx = SharedMemoryControlContext(url, protocol, verbose, http_headers)
+        self._arenas = list()
+
+    def allocate(self, byte_size):
+        for arena in self._arenas:
+            if arena.free_byte_size() >= byte_size:
+                try:
+                    return arena, arena.allocate(byte_size)
+                except self._shm.SharedMemoryException:
+                    # Free space is fragmented
+                    pass
+        name = self._name_prefix + "_" + str(len(self._arenas))
+        arena = self._shm.SharedMemoryArena(
+            self._shared_memory_ctx, name, '/' + name, max(self._region_byte_size, byte_size))
+        self._arenas.append(arena)
+        return arena, arena.allocate(byte_size)
+
+    def close(self):
+        for arena in self._arenas:
+            arena.close()
+        self._arenas = list()
+
+class SharedMemoryOutputRing:
+    """A SharedMemoryOutputRing object holds a fixed number of output
+    slots in a single registered system shared memory region, for
+    pipelining InferContext.async_run() requests that return their
+    outputs through shared memory. Each request issued with the ring
+    takes a free slot, so the outputs of outstanding requests do not
+    overwrite each other. The slot is returned to the ring once
+    InferContext.get_async_run_results() has read the results, and
+    async_run() blocks while all the slots are in use.
+
+    Parameters
+    ----------
+    url : str
+        The inference server URL, e.g. localhost:8000.
+
+    protocol : ProtocolType
+        The protocol used to communicate with the server.
+
+    output_byte_sizes : dict
+        Dictionary from output name to the size in bytes of that
+        output for the whole batch of a request.
+
+    slot_count : int
+        The number of slots, i.e. the maximum number of requests using
+        the ring at the same time.
+
+    trtis_shm_name : str
+        The unique name of the shared memory region to be created.
+
+    shm_key : str
+        The unique key of the shared memory object.
+
+    verbose : bool
+        If True generate verbose output.
+
+    http_headers : list of strings
+        HTTP headers to send with request. Ignored for GRPC
+        protocol. Each header must be specified as "Header:Value".
+
+    """
+    def __init__(self, url, protocol, output_byte_sizes, slot_count, trtis_shm_name,
+                 shm_key, verbose=False, http_headers=[]):
+        import tensorrtserver.shared_memory as shm
+
+        if slot_count <= 0:
+            _raise_error("slot_count must be positive")
+        alignment = 64
+        slot_byte_size = sum(-(-byte_size // alignment) * alignment
+                             for byte_size in output_byte_sizes.values())
+        self._shared_memory_ctx = SharedMemoryControlContext(url, protocol, verbose, http_headers)
+        self._arena = shm.SharedMemoryArena(
+            self._shared_memory_ctx, trtis_shm_name, shm_key, slot_count * slot_byte_size,
+            alignment)
+        # Output name -> handle, for each slot
+        self._slots = [ { name : self._arena.allocate(byte_size)
+                          for name, byte_size in iteritems(output_byte_sizes) }
+                        for _ in range(slot_count) ]
+        self._free_slots = deque(range(slot_count))
+        self._cv = threading.Condition()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def close(self):
+        """Unregister and destroy the shared memory region of the ring.
+        Outstanding requests using the ring must be completed first.
+
+        """
+        if self._arena is not None:
+            self._arena.close()
+            self._arena = None
+        self._shared_memory_ctx.close()
+
+    def free_slot_count(self):
+        """Get the number of slots not used by a request.
+
+        Returns
+        -------
+        int
+            The number of free slots.
+
+        """
+        with self._cv:
+            return len(self._free_slots)
+
+    def _acquire(self, outputs):
+        # Returns the slot taken and the outputs using its handles
+        with self._cv:
+            while len(self._free_slots) == 0:
+                self._cv.wait()
+            slot = self._free_slots.popleft()
+        ring_outputs = dict()
+        for (name, output_format) in iteritems(outputs):
+            if (name in self._slots[slot]) and (output_format == InferContext.ResultFormat.RAW):
+                ring_outputs[name] = (InferContext.ResultFormat.RAW, self._slots[slot][name])
+            else:
+                ring_outputs[name] = output_format
+        return slot, ring_outputs
+
+    def _release(self, slot):
+        with self._cv:
+            self._free_slots.append(slot)
+            self._cv.notify()
+
 class InferContext:
     """An InferContext object is used to run inference on an inference
     server for a specific model.
@@ -1076,6 +1777,24 @@ class InferContext:
         HTTP headers to send with request. Ignored for GRPC
         protocol. Each header must be specified as "Header:Value".
 
+    response_cache : ResponseCache
+        The cache holding the results of run(), or None to disable
+        caching. Requests with a correlation ID are never cached.
+
+    shared_memory_threshold : int
+        The size in bytes from which the input and output tensors of
+        run() are transferred through system shared memory when the
+        server runs on the same host, or 0 to always transfer tensors
+        over the wire. The regions are created, registered and reused
+        by the context and destroyed when it is closed. String tensors,
+        outputs with variable-size dimensions and outputs not in RAW
+        format are always transferred over the wire.
+
+    shared_memory_region_byte_size : int
+        The size in bytes of each system shared memory region created
+        for shared_memory_threshold. Larger tensors get a region of
+        their own size.
+
     """
     class ResultFormat:
         """Formats for output tensor results.
@@ -1088,13 +1807,116 @@ class InferContext:
             Specified as tuple (CLASS, k). Top 'k' results
             are returned as an array of (index, value, label) tuples.
 
+        RAW_BATCH
+            All values of the output for the entire batch are returned
+            as a single numpy array of the appropriate type with the
+            batch size as its first dimension.
+
         """
         RAW = 1,
         CLASS = 2
+        RAW_BATCH = 3
+
+    class PreparedRequest:
+        """A request created by InferContext.prepare(). The run options
+        and the input shapes of a prepared request are set up only once,
+        so running it again only needs to provide the input values.
+
+        A PreparedRequest can only be used with the InferContext that
+        created it.
+
+        """
+        def __init__(self, ctx, request_id, inputs, outputs, batch_size, options):
+            self._ctx = ctx
+            self._id = request_id
+            self._inputs = inputs
+            self._outputs = outputs
+            self._batch_size = batch_size
+            self._options = options
+
+        def __del__(self):
+            # when module is unloading may get called after
+            # _crequest_infer_ctx_options_del has been released
+            if _crequest_infer_ctx_options_del is not None:
+                self.close()
+
+        def close(self):
+            """Release the resources held by the prepared request. Any
+            future runs of the request will result in an Error.
+
+            """
+            for (_, _, input, _) in self._inputs:
+                _crequest_infer_ctx_input_del(input)
+            self._inputs = list()
+            _crequest_infer_ctx_options_del(self._options)
+            self._options = None
+
+        def run(self, inputs):
+            """Run inference of the prepared request using the supplied
+            'inputs'.
+
+            Parameters
+            ----------
+            inputs : dict
+                Dictionary from input name to the values for that input
+                as described for InferContext.run(). The values for
+                each input must match the shape given to
+                InferContext.prepare().
+
+            Returns
+            -------
+            dict
+                A dictionary from output name to the values for that
+                output as described for InferContext.run().
+
+            Raises
+            ------
+            InferenceServerException
+                If the input values do not match the prepared request
+                or if the server fails to perform inference.
+
+            """
+            return self._ctx._run_prepared(self, inputs)
+
+        def async_run(self, callback, inputs):
+            """Run asynchronous inference of the prepared request using
+            the supplied 'inputs'. The results are retrieved with
+            InferContext.get_async_run_results().
+
+            Parameters
+            ----------
+            callback : function
+                Python function that accepts an InferContext object
+                that sends the request and an integer identifier as
+                arguments, as described for InferContext.async_run().
+
+            inputs : dict
+                Dictionary from input name to the values for that input
+                as described for InferContext.run(). The values for
+                each input must match the shape given to
+                InferContext.prepare().
+
+            Raises
+            ------
+            InferenceServerException
+                If the input values do not match the prepared request
+                or if the server fails to issue inference.
+
+            """
+            self._ctx._async_run_prepared(self, callback, inputs)
 
     def __init__(self, url, protocol, model_name, model_version=None,
-                 verbose=False, correlation_id=0, streaming=False, http_headers=[]):
+                 verbose=False, correlation_id=0, streaming=False, http_headers=[],
+                 response_cache=None, shared_memory_threshold=0,
+                 shared_memory_region_byte_size=64 * 1024 * 1024):
+        self._model_name = model_name
+        self._model_version = model_version
         self._correlation_id = correlation_id
+        self._response_cache = response_cache
+        self._shm_pool = None
+        self._shm_threshold = shared_memory_threshold
+        # Output name -> (dtype, element count) of the fixed-size outputs
+        self._shm_outputs = dict()
         self._last_request_id = None
         self._last_request_model_name = None
         self._last_request_model_version = None
@@ -1103,6 +1925,10 @@ class InferContext:
         # that has to be kept for callback
         self._callback_resources_dict = dict()
         self._callback_resources_dict_id = 0
+        # The prepared request whose options and input shapes are
+        # currently set in the context, if any
+        self._prepared_request_id = None
+        self._next_prepared_request_id = 0
         self._ctx = c_void_p()
         # Lock for the thread-safety across asynchronous requests
         self._lock = threading.Lock()
@@ -1124,6 +1950,78 @@ class InferContext:
                     model_name, imodel_version, correlation_id,
                     streaming, verbose)))
 
+        if (shared_memory_threshold > 0) and _is_local_url(url):
+            try:
+                import tensorrtserver.shared_memory as shm
+            except ImportError:
+                # System shared memory is only available on Linux
+                shm = None
+            if shm is not None:
+                self._init_shared_memory(shm, url, protocol, model_name, verbose, http_headers,
+                                         shared_memory_region_byte_size)
+
+    def _init_shared_memory(self, shm, url, protocol, model_name, verbose, http_headers,
+                            region_byte_size):
+        config = get_model_status_cache(url, protocol, verbose, http_headers).get_model_config(
+            model_name)
+        import tensorrtserver.api.model_config_pb2 as model_config_pb2
+        for output in config.output:
+            dims = list(output.dims)
+            if (output.data_type != model_config_pb2.TYPE_STRING) and \
+               all(dim >= 0 for dim in dims):
+                self._shm_outputs[output.name] = (np.dtype(_model_dtype_to_np(output.data_type)),
+                                                  int(np.prod(dims)))
+        self._shm_pool = _SharedMemoryPool(shm, url, protocol, verbose, http_headers,
+                                           region_byte_size)
+
+    def _map_shared_memory(self, inputs, outputs, batch_size, allocations):
+        # Replace the large input values and RAW outputs by shared memory
+        # handles, recording the allocations made
+        shm = self._shm_pool._shm
+        shm_inputs = dict()
+        for (name, values) in iteritems(inputs):
+            if isinstance(values, np.ndarray):
+                shape = values.shape[1:]
+                dtype = values.dtype
+            elif isinstance(values, (list, tuple)) and (len(values) > 0) and \
+                 all(isinstance(value, np.ndarray) for value in values) and \
+                 all(value.shape == values[0].shape for value in values):
+                shape = values[0].shape
+                dtype = values[0].dtype
+            else:
+                shm_inputs[name] = values
+                continue
+            byte_size = len(values) * int(np.prod(shape)) * dtype.itemsize
+            if (dtype == np.object) or (dtype.type in (np.bytes_, np.str_)) or \
+               (byte_size < self._shm_threshold):
+                shm_inputs[name] = values
+                continue
+            arena, handle = self._shm_pool.allocate(byte_size)
+            allocations.append((arena, handle))
+            region = shm.get_region_ndarray(handle, dtype, (len(values),) + shape)
+            if isinstance(values, np.ndarray):
+                region[...] = values
+            else:
+                for idx, value in enumerate(values):
+                    region[idx] = value
+            shm_inputs[name] = (handle, list(shape))
+
+        shm_outputs = dict()
+        for (name, output_format) in iteritems(outputs):
+            spec = self._shm_outputs.get(name)
+            if (spec is None) or (output_format != InferContext.ResultFormat.RAW):
+                shm_outputs[name] = output_format
+                continue
+            byte_size = batch_size * spec[1] * spec[0].itemsize
+            if (byte_size == 0) or (byte_size < self._shm_threshold):
+                shm_outputs[name] = output_format
+                continue
+            arena, handle = self._shm_pool.allocate(byte_size)
+            allocations.append((arena, handle))
+            shm_outputs[name] = (InferContext.ResultFormat.RAW, handle)
+
+        return shm_inputs, shm_outputs
+
     def __del__(self):
         # when module is unloading may get called after
         # _crequest_infer_ctx_del has been released
@@ -1149,45 +2047,124 @@ class InferContext:
     def _get_result_numpy_dtype(self, result):
         ctype = c_uint32()
         _raise_if_error(c_void_p(_crequest_infer_ctx_result_dtype(result, byref(ctype))))
-        if ctype.value == model_config_pb2.TYPE_BOOL:
-            return np.bool_
-        elif ctype.value == model_config_pb2.TYPE_UINT8:
-            return np.uint8
-        elif ctype.value == model_config_pb2.TYPE_UINT16:
-            return np.uint16
-        elif ctype.value == model_config_pb2.TYPE_UINT32:
-            return np.uint32
-        elif ctype.value == model_config_pb2.TYPE_UINT64:
-            return np.uint64
-        elif ctype.value == model_config_pb2.TYPE_INT8:
-            return np.int8
-        elif ctype.value == model_config_pb2.TYPE_INT16:
-            return np.int16
-        elif ctype.value == model_config_pb2.TYPE_INT32:
-            return np.int32
-        elif ctype.value == model_config_pb2.TYPE_INT64:
-            return np.int64
-        elif ctype.value == model_config_pb2.TYPE_FP16:
-            return np.float16
-        elif ctype.value == model_config_pb2.TYPE_FP32:
-            return np.float32
-        elif ctype.value == model_config_pb2.TYPE_FP64:
-            return np.float64
-        elif ctype.value == model_config_pb2.TYPE_STRING:
-            return np.dtype(object)
-        _raise_error("unknown result datatype " + ctype.value)
+        return _model_dtype_to_np(ctype.value)
+
+    def _get_result_shape(self, result):
+        max_shape_dims = 16
+        shape_array = np.zeros(max_shape_dims, dtype=np.int64)
+        shape_len = c_uint64()
+        _raise_if_error(
+            c_void_p(
+                _crequest_infer_ctx_result_shape(
+                    result, c_uint64(max_shape_dims),
+                    shape_array, byref(shape_len))))
+        return np.resize(shape_array, shape_len.value).tolist()
+
+    def _add_output_options(self, options, outputs):
+        # An output format may be may be specified as a RAW or (CLASS, cnt)
+        # or as a (RAW, shared_memory_handle).
+        for (output_name, output_format) in iteritems(outputs):
+            if (output_format == InferContext.ResultFormat.RAW) or \
+               (output_format == InferContext.ResultFormat.RAW_BATCH):
+                _raise_if_error(
+                    c_void_p(
+                        _crequest_infer_ctx_options_add_raw(self._ctx, options, output_name)))
+            elif len(output_format) == 2 and isinstance(output_format, (list, tuple)) \
+                and output_format[0] == InferContext.ResultFormat.RAW:
+                if type(output_format[1]) != c_void_p:
+                    _raise_error("shared memory requires tuple of size 2" \
+                                " - output_format(RAW), shared_memory_handle(c_void_p)")
+                _raise_if_error(
+                    c_void_p(
+                        _crequest_infer_ctx_options_add_shared_memory(
+                            self._ctx, options, output_name, output_format[1])))
+            elif (isinstance(output_format, (list, tuple)) and
+                  (output_format[0] == InferContext.ResultFormat.CLASS)):
+                _raise_if_error(
+                    c_void_p(
+                        _crequest_infer_ctx_options_add_class(
+                            self._ctx, options, output_name, c_uint64(output_format[1]))))
+            else:
+                _raise_error("unrecognized output format")
+
+    def _set_input_batch(self, input, input_values, batch_size, contiguous_input_values):
+        # A single array holds the entire batch. The values of all batch
+        # entries are passed as one buffer, which is only copied here if
+        # it is not already contiguous.
+        if input_values.size == 0:
+            batch_byte_sizes = np.zeros(batch_size, dtype=np.uint64)
+            _raise_if_error(
+                c_void_p(
+                    _crequest_infer_ctx_input_set_raw_batch(
+                        input, None, batch_byte_sizes, c_uint64(batch_size))))
+        else:
+            if (input_values.dtype == np.object) or \
+               (input_values.dtype.type in (np.bytes_, np.str_)):
+                # String batch entries are serialized together
+                # and so can differ in byte size.
+                input_value = serialize_string_tensor(input_values)
+                offsets = _string_tensor_offsets(input_value)
+                batch_byte_sizes = np.diff(
+                    offsets[::input_values.size // batch_size]).astype(np.uint64)
+            else:
+                input_value = np.ascontiguousarray(input_values)
+                batch_byte_sizes = np.full(batch_size, input_value.nbytes // batch_size,
+                                           dtype=np.uint64)
+            contiguous_input_values.append(input_value)
+            _raise_if_error(
+                c_void_p(
+                    _crequest_infer_ctx_input_set_raw_batch(
+                        input, input_value.ctypes.data_as(c_void_p),
+                        batch_byte_sizes, c_uint64(batch_size))))
+
+    def _set_input_list(self, input, input_values, contiguous_input_values):
+        for input_value in input_values:
+            # If the input tensor is empty then avoid going
+            # through the more complicated logic since
+            # creating the buffer for string objects results
+            # is a size-1 array instead of 0.
+            if input_value.size == 0:
+                _raise_if_error(
+                    c_void_p(
+                        _crequest_infer_ctx_input_set_raw(input, 0, 0)))
+            else:
+                # If the input is a tensor of string objects,
+                # then must flatten those into a 1-dimensional
+                # array containing the 4-byte string length
+                # followed by the actual string characters.
+                # All strings are concatenated together in "C"
+                # order.
+                if (input_value.dtype == np.object) or \
+                   (input_value.dtype.type in (np.bytes_, np.str_)):
+                    input_value = serialize_string_tensor(input_value)
+
+                if not input_value.flags['C_CONTIGUOUS']:
+                    input_value = np.ascontiguousarray(input_value)
+                contiguous_input_values.append(input_value)
+                _raise_if_error(
+                    c_void_p(
+                        _crequest_infer_ctx_input_set_raw(
+                            input, input_value.ctypes.data_as(c_void_p),
+                            c_uint64(input_value.size * input_value.itemsize))))
 
     def _prepare_request(self, inputs, outputs,
                          flags, batch_size, corr_id, priority, timeout_us,
                          contiguous_input_values):
         # Make sure each input is given as a list (one entry per
-        # batch). It is a common error when using batch-size 1 to
-        # specify an input directly as an array instead of as a list
-        # containing one array.
+        # batch) or as a single array holding the entire batch.
         # An input's data may be specified as a list of numpy arrays,
+        # as a numpy array whose first dimension is the batch size,
         # or as a shared memory handle or as a tuple of a shared memory
         # handle and the shape of the input tensor.
         for inp_name, inp in inputs.items():
+            if isinstance(inp, np.ndarray):
+                # It is a common error when using batch-size 1 to specify
+                # a single batch entry directly as an array.
+                if (inp.ndim == 0) or (inp.shape[0] != batch_size):
+                    _raise_error("input '" + inp_name +
+                                 "' specified as a single numpy array must have the" \
+                                 " batch size " + str(batch_size) + " as its first dimension")
+                continue
             if (not isinstance(inp, (list, tuple))) and (type(inp) != c_void_p):
                 _raise_error("input '" + inp_name +
                              "' values must be specified as a list of numpy arrays" \
@@ -1207,36 +2184,14 @@ class InferContext:
                              " or as a tuple of c_void_p (representing the shared memory handle)" \
                              " and list (representing the shape of the input tensor)")
         # Set run options using formats specified in 'outputs'
-        # An output format may be may be specified as a RAW or (CLASS, cnt)
-        # or as a (RAW, shared_memory_handle).
+        self._prepared_request_id = None
         options = c_void_p()
         try:
             _raise_if_error(c_void_p(
                 _crequest_infer_ctx_options_new(
                     byref(options), flags, batch_size, corr_id, priority, timeout_us)))
 
-            for (output_name, output_format) in iteritems(outputs):
-                if len(output_format) == 2 and isinstance(output_format, (list, tuple)) \
-                    and output_format[0] == InferContext.ResultFormat.RAW:
-                    if type(output_format[1]) != c_void_p:
-                        _raise_error("shared memory requires tuple of size 2" \
-                                    " - output_format(RAW), shared_memory_handle(c_void_p)")
-                    _raise_if_error(
-                        c_void_p(
-                            _crequest_infer_ctx_options_add_shared_memory(
-                                self._ctx, options, output_name, output_format[1])))
-                elif output_format == InferContext.ResultFormat.RAW:
-                    _raise_if_error(
-                        c_void_p(
-                            _crequest_infer_ctx_options_add_raw(self._ctx, options, output_name)))
-                elif (isinstance(output_format, (list, tuple)) and
-                      (output_format[0] == InferContext.ResultFormat.CLASS)):
-                    _raise_if_error(
-                        c_void_p(
-                            _crequest_infer_ctx_options_add_class(
-                                self._ctx, options, output_name, c_uint64(output_format[1]))))
-                else:
-                    _raise_error("unrecognized output format")
+            self._add_output_options(options, outputs)
 
             _raise_if_error(c_void_p(_crequest_infer_ctx_set_options(self._ctx, options)))
 
@@ -1250,8 +2205,19 @@ class InferContext:
                 _raise_if_error(
                     c_void_p(_crequest_infer_ctx_input_new(byref(input), self._ctx, input_name)))
 
+                # A single array holds the entire batch
+                if isinstance(input_values, np.ndarray):
+                    shape_value = np.asarray(input_values.shape[1:], dtype=np.int64)
+                    _raise_if_error(
+                        c_void_p(
+                            _crequest_infer_ctx_input_set_shape(
+                                   input, shape_value, c_uint64(shape_value.size))))
+
+                    self._set_input_batch(input, input_values, batch_size,
+                                          contiguous_input_values)
+
                 # Set the input shape
-                if isinstance(input_values, (list, tuple)):
+                elif isinstance(input_values, (list, tuple)):
                     if len(input_values) > 0:
                         if isinstance(input_values[0], (np.ndarray,)):
                             shape_value = np.asarray(input_values[0].shape, dtype=np.int64)
@@ -1262,33 +2228,7 @@ class InferContext:
 
                     # use values if numpy array, reference if shared memory
                     if isinstance(input_values[0], (np.ndarray,)):
-                        for input_value in input_values:
-                            # If the input tensor is empty then avoid going
-                            # through the more complicated logic since
-                            # creating the buffer for string objects results
-                            # is a size-1 array instead of 0.
-                            if input_value.size == 0:
-                                _raise_if_error(
-                                    c_void_p(
-                                        _crequest_infer_ctx_input_set_raw(input, 0, 0)))
-                            else:
-                                # If the input is a tensor of string objects,
-                                # then must flatten those into a 1-dimensional
-                                # array containing the 4-byte string length
-                                # followed by the actual string characters.
-                                # All strings are concatenated together in "C"
-                                # order.
-                                if (input_value.dtype == np.object) or (input_value.dtype.type == np.bytes_):
-                                    input_value = serialize_string_tensor(input_value)
-
-                                if not input_value.flags['C_CONTIGUOUS']:
-                                    input_value = np.ascontiguousarray(input_value)
-                                contiguous_input_values.append(input_value)
-                                _raise_if_error(
-                                    c_void_p(
-                                        _crequest_infer_ctx_input_set_raw(
-                                            input, input_value.ctypes.data_as(c_void_p),
-                                            c_uint64(input_value.size * input_value.itemsize))))
+                        self._set_input_list(input, input_values, contiguous_input_values)
                     # For variable size tensors, need the shape as well as the
                     # shared memory handle
                     elif isinstance(input_values[1], (list, tuple)) and (type(input_values[0]) == c_void_p):
@@ -1310,6 +2250,86 @@ class InferContext:
             finally:
                 _crequest_infer_ctx_input_del(input)
 
+    def _set_prepared_request(self, prepared, inputs, contiguous_input_values):
+        if prepared._options is None:
+            _raise_error("prepared request has been closed")
+        if prepared._ctx is not self:
+            _raise_error("prepared request belongs to a different InferContext")
+        if len(inputs) != len(prepared._inputs):
+            _raise_error("expected values for " + str(len(prepared._inputs)) +
+                         " prepared inputs, got " + str(len(inputs)))
+
+        # The run options and input shapes only need to be set if another
+        # request was run on the context since this one.
+        if self._prepared_request_id != prepared._id:
+            self._prepared_request_id = None
+            _raise_if_error(
+                c_void_p(_crequest_infer_ctx_set_options(self._ctx, prepared._options)))
+            for (_, _, input, shape_value) in prepared._inputs:
+                _raise_if_error(
+                    c_void_p(
+                        _crequest_infer_ctx_input_set_shape(
+                            input, shape_value, c_uint64(shape_value.size))))
+            self._prepared_request_id = prepared._id
+
+        batch_size = prepared._batch_size
+        for (input_name, shape, input, _) in prepared._inputs:
+            if input_name not in inputs:
+                _raise_error("missing values for prepared input '" + input_name + "'")
+            input_values = inputs[input_name]
+            _raise_if_error(c_void_p(_crequest_infer_ctx_input_reset(input)))
+            if isinstance(input_values, np.ndarray):
+                if input_values.shape != ((batch_size,) + shape):
+                    _raise_error("input '" + input_name + "' has shape " +
+                                 str(list(input_values.shape)) + ", prepared for " +
+                                 str([batch_size] + list(shape)))
+                self._set_input_batch(input, input_values, batch_size, contiguous_input_values)
+            elif isinstance(input_values, (list, tuple)):
+                if len(input_values) != batch_size:
+                    _raise_error("input '" + input_name + "' has " + str(len(input_values)) +
+                                 " batch entries, prepared for " + str(batch_size))
+                for input_value in input_values:
+                    if (not isinstance(input_value, np.ndarray)) or (input_value.shape != shape):
+                        _raise_error("input '" + input_name + "' batch entries must be" \
+                                     " numpy arrays with the prepared shape " + str(list(shape)))
+                self._set_input_list(input, input_values, contiguous_input_values)
+            else:
+                _raise_error("input '" + input_name +
+                             "' values must be specified as a list of numpy arrays" \
+                             " or as a single numpy array holding the entire batch")
+
+    def _run_prepared(self, prepared, inputs):
+        self._last_request_id = None
+        self._last_request_model_name = None
+        self._last_request_model_version = None
+
+        contiguous_input = list()
+        self._set_prepared_request(prepared, inputs, contiguous_input)
+
+        self._last_request_id = _raise_if_error(c_void_p(_crequest_infer_ctx_run(self._ctx)))
+
+        return self._get_results(prepared._outputs, prepared._batch_size)
+
+    def _async_run_prepared(self, prepared, callback, inputs):
+        contiguous_input = list()
+        self._set_prepared_request(prepared, inputs, contiguous_input)
+        self._async_run(callback, prepared._outputs, prepared._batch_size, contiguous_input)
+
+    def _async_run(self, callback, outputs, batch_size, contiguous_input, release=None):
+        # Wrap over the provided callback
+        wrapped_cb = partial(self._async_callback_wrapper, self._callback_resources_dict_id, callback)
+        c_cb = _async_run_callback_prototype(wrapped_cb)
+
+        with self._lock:
+            # Run asynchronous inference...
+            _raise_if_error(
+                c_void_p(
+                    _crequest_infer_ctx_async_run(self._ctx, c_cb)))
+
+            self._callback_resources_dict[self._callback_resources_dict_id] = \
+                (outputs, batch_size, contiguous_input, c_cb, wrapped_cb, release)
+            self._callback_resources_dict_id += 1
+
     def _get_results(self, outputs, batch_size, request_id=None):
         # Create the result map.
         results = dict()
@@ -1343,15 +2363,7 @@ class InferContext:
                 results[output_name] = list()
                 if output_format == InferContext.ResultFormat.RAW:
                     # Get the shape of each result tensor
-                    max_shape_dims = 16
-                    shape_array = np.zeros(max_shape_dims, dtype=np.int64)
-                    shape_len = c_uint64()
-                    _raise_if_error(
-                        c_void_p(
-                            _crequest_infer_ctx_result_shape(
-                                result, c_uint64(max_shape_dims),
-                                shape_array, byref(shape_len))))
-                    shape = np.resize(shape_array, shape_len.value).tolist()
+                    shape = self._get_result_shape(result)
 
                     for b in range(batch_size):
                         # Get the result value into a 1-dim np array
@@ -1376,23 +2388,46 @@ class InferContext:
                             if result_dtype != np.object:
                                 val = np.frombuffer(val_buf, dtype=result_dtype)
                             else:
-                                # String results contain a 4-byte
-                                # string length followed by the actual
-                                # string characters.
-                                strs = list()
-                                offset = 0
-                                while offset < len(val_buf):
-                                    l = struct.unpack_from("<I", val_buf, offset)[0]
-                                    offset += 4
-                                    sb = struct.unpack_from("<{}s".format(l), val_buf, offset)[0]
-                                    offset += l
-                                    strs.append(sb)
-                                val = np.array(strs, dtype=object)
+                                val = _deserialize_string_tensor(val_buf)
 
                             # Reshape the result to the appropriate shape
                             shaped = np.reshape(np.copy(val), shape)
                             results[output_name].append(shaped)
 
+                elif output_format == InferContext.ResultFormat.RAW_BATCH:
+                    # Copy the result of the entire batch out of the
+                    # response with a single call.
+                    batch_shape = [batch_size] + self._get_result_shape(result)
+                    cbyte_size = c_uint64()
+                    if result_dtype != np.object:
+                        val = np.empty(batch_shape, dtype=result_dtype)
+                        _raise_if_error(
+                            c_void_p(
+                                _crequest_infer_ctx_result_batch_raw(
+                                    result, c_uint64(batch_size),
+                                    val.ctypes.data_as(c_void_p), c_uint64(val.nbytes),
+                                    byref(cbyte_size))))
+                        if cbyte_size.value != val.nbytes:
+                            _raise_error("output '" + output_name + "' expected " +
+                                         str(val.nbytes) + " bytes for the batch, got " +
+                                         str(cbyte_size.value))
+                    else:
+                        _raise_if_error(
+                            c_void_p(
+                                _crequest_infer_ctx_result_batch_raw(
+                                    result, c_uint64(batch_size), None, c_uint64(0),
+                                    byref(cbyte_size))))
+                        val_buf = np.empty(cbyte_size.value, dtype=np.uint8)
+                        _raise_if_error(
+                            c_void_p(
+                                _crequest_infer_ctx_result_batch_raw(
+                                    result, c_uint64(batch_size),
+                                    val_buf.ctypes.data_as(c_void_p), c_uint64(val_buf.nbytes),
+                                    byref(cbyte_size))))
+                        val = _deserialize_string_tensor(
+                            val_buf, 0, int(np.prod(batch_shape))).reshape(batch_shape)
+                    results[output_name] = val
+
                 elif (isinstance(output_format, (list, tuple)) and
                       (output_format[0] == InferContext.ResultFormat.CLASS)):
                     for b in range(batch_size):
@@ -1414,15 +2449,7 @@ class InferContext:
                 elif (isinstance(output_format, (list, tuple)) and
                     (output_format[0] == InferContext.ResultFormat.RAW) and (len(output_format) == 2)):
                     # Get the shape of each result tensor
-                    max_shape_dims = 16
-                    shape_array = np.zeros(max_shape_dims, dtype=np.int64)
-                    shape_len = c_uint64()
-                    _raise_if_error(
-                        c_void_p(
-                            _crequest_infer_ctx_result_shape(
-                                result, c_uint64(max_shape_dims),
-                                shape_array, byref(shape_len))))
-                    shape = np.resize(shape_array, shape_len.value).tolist()
+                    shape = self._get_result_shape(result)
 
                     # get info for shared memory regions and read results
                     shm_fd = c_int()
@@ -1461,21 +2488,12 @@ class InferContext:
                                 results[output_name].append(shaped)
                         else:
                             cval = shm_addr
-                            str_offset = start_pos
-                            val_buf = cast(cval, POINTER(c_byte * byte_size.value))[0]
-                            b = 0
-                            while b < batch_size:
-                                ii = 0
-                                strs = list()
-                                while (ii % np.prod(shape) != 0) or (ii == 0):
-                                    l = struct.unpack_from("<I", val_buf, str_offset)[0]
-                                    str_offset += 4
-                                    sb = struct.unpack_from("<{}s".format(l), val_buf, str_offset)[0]
-                                    str_offset += l
-                                    strs.append(sb)
-                                    ii+=1
-                                b+=1
-                                val = np.array(strs, dtype=object)
+                            val_buf = cast(cval, POINTER(c_byte * (start_pos + byte_size.value)))[0]
+                            element_count = max(int(np.prod(shape)), 1)
+                            vals = _deserialize_string_tensor(
+                                val_buf, start_pos, batch_size * element_count)
+                            for b in range(batch_size):
+                                val = vals[b * element_count:(b + 1) * element_count]
 
                                 # Reshape the result to the appropriate shape.
                                 shaped = np.reshape(val, shape)
@@ -1496,6 +2514,9 @@ class InferContext:
         Error.
 
         """
+        if self._shm_pool is not None:
+            self._shm_pool.close()
+            self._shm_pool = None
         _crequest_infer_ctx_del(self._ctx)
         self._ctx = None
 
@@ -1510,6 +2531,82 @@ class InferContext:
         """
         return _crequest_correlation_id(self._ctx)
 
+    def prepare(self, inputs, outputs, batch_size=1, flags=0, corr_id=0,
+                priority=0, timeout_us=0):
+        """Prepare a request that can be run repeatedly with different
+        input values of the same shape. The run options and the input
+        shapes are set up once instead of for every run.
+
+        Parameters
+        ----------
+        inputs : dict
+            Dictionary from input name to the shape of a single batch
+            entry of that input, given as a list of dimensions.
+
+        outputs : dict
+            Dictionary from output name to a value indicating the
+            ResultFormat that should be used for that output, as
+            described for run().
+
+        batch_size : int
+            The batch size of the inference. Each run of the prepared
+            request must provide an appropriately sized batch of inputs.
+
+        flags : int
+            The flags to use for the inference. The bitwise-or of
+            InferRequestHeader.Flag values.
+
+        corr_id : int
+            The correlation id of the inference. Used to differentiate
+            sequences.
+
+        priority : int
+            The priority of the inference.
+
+        timeout_us : int
+            The timeout of the inference, in microseconds.
+
+        Returns
+        -------
+        InferContext.PreparedRequest
+            The prepared request. Use its run() and async_run() to run
+            inference.
+
+        Raises
+        ------
+        InferenceServerException
+            If the inputs or outputs are not valid for the model.
+
+        """
+        prepared_inputs = list()
+        options = c_void_p()
+        try:
+            _raise_if_error(c_void_p(
+                _crequest_infer_ctx_options_new(
+                    byref(options), flags, batch_size, corr_id, priority, timeout_us)))
+            self._add_output_options(options, outputs)
+
+            for (input_name, input_shape) in iteritems(inputs):
+                if not isinstance(input_shape, (list, tuple)):
+                    _raise_error("input '" + input_name +
+                                 "' shape must be specified as a list of dimensions")
+                input = c_void_p()
+                err = c_void_p(_crequest_infer_ctx_input_new(byref(input), self._ctx, input_name))
+                shape = tuple(int(dim) for dim in input_shape)
+                prepared_inputs.append(
+                    (input_name, shape, input, np.asarray(shape, dtype=np.int64)))
+                _raise_if_error(err)
+        except Exception:
+            for (_, _, input, _) in prepared_inputs:
+                _crequest_infer_ctx_input_del(input)
+            _crequest_infer_ctx_options_del(options)
+            raise
+
+        request_id = self._next_prepared_request_id
+        self._next_prepared_request_id += 1
+        return InferContext.PreparedRequest(
+            self, request_id, prepared_inputs, outputs, batch_size, options)
+
     def run(self, inputs, outputs, batch_size=1, flags=0, corr_id=0,
             priority=0, timeout_us=0):
         """Run inference using the supplied 'inputs' to calculate the outputs
@@ -1525,13 +2622,16 @@ class InferContext:
             must equal the 'batch_size'.
             However, for shape tensor input the list should contain
             just a single tensor.
+            Alternatively an input may map to a single numpy array
+            holding the values for the entire batch, in which case the
+            first dimension of the array must equal the 'batch_size'.
 
         outputs : dict
             Dictionary from output name to a value indicating the
             ResultFormat that should be used for that output. For RAW
-            the value should be ResultFormat.RAW. For CLASS the value
-            should be a tuple (ResultFormat.CLASS, k), where 'k'
-            indicates how many classification results should be
+            the value should be ResultFormat.RAW or ResultFormat.RAW_BATCH.
+            For CLASS the value should be a tuple (ResultFormat.CLASS, k),
+            where 'k' indicates how many classification results should be
             returned for the output.
 
         batch_size : int
@@ -1562,7 +2662,14 @@ class InferContext:
             format RAW a value is a numpy array of the appropriate
             type and shape for the output. For format CLASS a value is
             the top 'k' output values returned as an array of (class
-            index, class value, class label) tuples.
+            index, class value, class label) tuples. For format
+            RAW_BATCH the output maps directly to a single numpy array
+            holding the values for the entire batch.
+
+            When the context has a response cache the numpy arrays are
+            read-only, as they are shared with every request served by
+            the cache. The last request ID, model name and version are
+            not set when the results are served by the cache.
 
         Raises
         ------
@@ -1576,22 +2683,92 @@ class InferContext:
         self._last_request_model_name = None
         self._last_request_model_version = None
 
+        if (self._response_cache is None) or corr_id or self._correlation_id or \
+           (not self._is_response_cacheable(inputs, outputs)):
+            return self._run(inputs, outputs, batch_size, flags, corr_id, priority, timeout_us)
+
+        key = self._response_cache_key(inputs, outputs, batch_size, flags)
+        results = self._response_cache._get_or_compute(
+            key,
+            partial(self._run_cacheable, inputs, outputs, batch_size, flags, priority, timeout_us),
+            _results_byte_size)
+
+        # The arrays are shared but each caller gets its own lists
+        return { name : (list(value) if isinstance(value, list) else value)
+                 for name, value in iteritems(results) }
+
+    @staticmethod
+    def _is_response_cacheable(inputs, outputs):
+        # Shared memory inputs are identified by their handle rather than
+        # their contents, and the results of shared memory outputs are
+        # overwritten by the next request that uses the region.
+        for values in inputs.values():
+            if isinstance(values, np.ndarray):
+                continue
+            if (not isinstance(values, (list, tuple))) or \
+               (not all(isinstance(value, np.ndarray) for value in values)):
+                return False
+        for output_format in outputs.values():
+            if isinstance(output_format, (list, tuple)) and \
+               any(type(f) == c_void_p for f in output_format):
+                return False
+        return True
+
+    def _response_cache_key(self, inputs, outputs, batch_size, flags):
+        import hashlib
+        h = hashlib.blake2b(digest_size=16)
+        h.update(repr((self._model_name, self._model_version, batch_size, flags,
+                       sorted(iteritems(outputs)))).encode('utf-8'))
+        for name in sorted(inputs):
+            values = inputs[name]
+            if isinstance(values, np.ndarray):
+                values = [values]
+                h.update(b'batch')
+            for value in values:
+                h.update(repr((name, value.dtype.str, value.shape)).encode('utf-8'))
+                if value.dtype == np.object:
+                    if value.size > 0:
+                        h.update(serialize_string_tensor(value))
+                else:
+                    h.update(np.ascontiguousarray(value))
+        return h.digest()
+
+    def _run_cacheable(self, inputs, outputs, batch_size, flags, priority, timeout_us):
+        results = self._run(inputs, outputs, batch_size, flags, 0, priority, timeout_us)
+        for value in results.values():
+            for v in (value if isinstance(value, list) else [value]):
+                if isinstance(v, np.ndarray):
+                    v.flags.writeable = False
+        return results
+
+    def _run(self, inputs, outputs, batch_size, flags, corr_id, priority, timeout_us):
         # The input values must be contiguous and the lifetime of those
         # contiguous copies must span until the inference completes
         # so grab a reference to them at this scope.
         contiguous_input = list()
 
-        # Set run option and input values
-        self._prepare_request(
-            inputs, outputs, flags, batch_size, corr_id, priority, timeout_us, contiguous_input)
+        # The shared memory holding large tensors is returned to the
+        # pool once the results are read
+        shm_allocations = list()
+        try:
+            if self._shm_pool is not None:
+                inputs, outputs = self._map_shared_memory(
+                    inputs, outputs, batch_size, shm_allocations)
 
-        # Run inference...
-        self._last_request_id = _raise_if_error(c_void_p(_crequest_infer_ctx_run(self._ctx)))
+            # Set run option and input values
+            self._prepare_request(
+                inputs, outputs, flags, batch_size, corr_id, priority, timeout_us, contiguous_input)
 
-        return self._get_results(outputs, batch_size)
+            # Run inference...
+            self._last_request_id = _raise_if_error(c_void_p(_crequest_infer_ctx_run(self._ctx)))
+
+            return self._get_results(outputs, batch_size)
+        finally:
+            for arena, handle in shm_allocations:
+                arena.free(handle)
 
     def async_run(self, callback, inputs, outputs, batch_size=1, flags=0, corr_id=0,
-                  priority=0, timeout_us=0):
+                  priority=0, timeout_us=0, output_ring=None):
         """Run inference using the supplied 'inputs' to calculate the outputs
         specified by 'outputs'.
 
@@ -1616,13 +2793,16 @@ class InferContext:
             must equal the 'batch_size'.
             However, for shape tensor input the list should contain
             just a single tensor.
+            Alternatively an input may map to a single numpy array
+            holding the values for the entire batch, in which case the
+            first dimension of the array must equal the 'batch_size'.
 
         outputs : dict
             Dictionary from output name to a value indicating the
             ResultFormat that should be used for that output. For RAW
-            the value should be ResultFormat.RAW. For CLASS the value
-            should be a tuple (ResultFormat.CLASS, k), where 'k'
-            indicates how many classification results should be
+            the value should be ResultFormat.RAW or ResultFormat.RAW_BATCH.
+            For CLASS the value should be a tuple (ResultFormat.CLASS, k),
+            where 'k' indicates how many classification results should be
             returned for the output.
 
         batch_size : int
@@ -1645,6 +2825,13 @@ class InferContext:
         timeout_us : int
             The timeout of the inference, in microseconds.
 
+        output_ring : SharedMemoryOutputRing
+            The ring providing the shared memory for the RAW outputs
+            held by the ring. The call blocks until a slot of the ring
+            is free, and the slot is freed once the results are
+            retrieved by get_async_run_results(). Default value is None,
+            which means the outputs are returned as given by 'outputs'.
+
         Raises
         ------
         InferenceServerException
@@ -1657,23 +2844,21 @@ class InferContext:
         # the object given that the request is asynchronous
         contiguous_input = list()
 
-        # Set run option and input values
-        self._prepare_request(
-            inputs, outputs, flags, batch_size, corr_id, priority, timeout_us, contiguous_input)
+        release = None
+        if output_ring is not None:
+            slot, outputs = output_ring._acquire(outputs)
+            release = partial(output_ring._release, slot)
 
-        # Wrap over the provided callback
-        wrapped_cb = partial(self._async_callback_wrapper, self._callback_resources_dict_id, callback)
-        c_cb = _async_run_callback_prototype(wrapped_cb)
-
-        with self._lock:
-            # Run asynchronous inference...
-            _raise_if_error(
-                c_void_p(
-                    _crequest_infer_ctx_async_run(self._ctx, c_cb)))
+        try:
+            # Set run option and input values
+            self._prepare_request(
+                inputs, outputs, flags, batch_size, corr_id, priority, timeout_us, contiguous_input)
 
-            self._callback_resources_dict[self._callback_resources_dict_id] = \
-                (outputs, batch_size, contiguous_input, c_cb, wrapped_cb)
-            self._callback_resources_dict_id += 1
+            self._async_run(callback, outputs, batch_size, contiguous_input, release)
+        except Exception:
+            if release is not None:
+                release()
+            raise
 
     def get_async_run_results(self, request_id):
         """Retrieve the results of a previous async_run() using the supplied
@@ -1695,7 +2880,9 @@ class InferContext:
             value is a numpy array of the appropriate type and shape
             for the output. For format CLASS a value is the top 'k'
             output values returned as an array of (class index, class
-            value, class label) tuples.
+            value, class label) tuples. For format RAW_BATCH the output
+            maps directly to a single numpy array holding the values
+            for the entire batch.
 
         Raises
         ------
@@ -1708,17 +2895,19 @@ class InferContext:
         err = c_void_p(_crequest_infer_ctx_get_async_run_results(
             self._ctx, request_id))
 
-        self._last_request_id = _raise_if_error(err)
-
         with self._lock:
-            requested_outputs = self._requested_outputs_dict[request_id]
+            requested_outputs = self._requested_outputs_dict.pop(request_id, None)
             if isinstance(requested_outputs, int):
-                idx = requested_outputs
-                requested_outputs = self._callback_resources_dict[idx]
-                del self._callback_resources_dict[idx]
-            del self._requested_outputs_dict[request_id]
+                requested_outputs = self._callback_resources_dict.pop(requested_outputs)
 
-        return self._get_results(requested_outputs[0], requested_outputs[1], request_id)
+        # The output ring slot of the request is freed once the results
+        # are read, also when the request failed
+        try:
+            self._last_request_id = _raise_if_error(err)
+            return self._get_results(requested_outputs[0], requested_outputs[1], request_id)
+        finally:
+            if (requested_outputs is not None) and (requested_outputs[5] is not None):
+                requested_outputs[5]()
 
     def get_last_request_id(self):
         """Get the request ID of the most recent run() request.
@@ -1789,3 +2978,306 @@ class InferContext:
         stat["cumulative_receive_time_ns"] = cumulative_receive_time_ns.value
 
         return stat
+
+
+class BatchingInferClient:
+    """A BatchingInferClient object collects inference requests for a
+    single batch entry, issued from any number of threads, and runs
+    them on the inference server as batched requests. This reduces the
+    number of requests sent to the server in the same way as dynamic
+    batching does within the server.
+
+    A batch is sent once it holds the maximum batch size of requests,
+    or once its oldest request has waited for the maximum delay. Only
+    requests with the same outputs and the same input shapes and
+    datatypes are batched together.
+
+    Parameters
+    ----------
+    url : str
+        The inference server URL, e.g. localhost:8000.
+
+    protocol : ProtocolType
+        The protocol used to communicate with the server.
+
+    model_name : str
+        The name of the model to use for inference.
+
+    model_version : int
+        The version of the model to use for inference,
+        or None to indicate that the latest (i.e. highest version number)
+        version should be used.
+
+    max_batch_size : int
+        The largest batch to send to the server. If 0 (or larger than
+        the max_batch_size of the model), the max_batch_size of the
+        model reported by the server is used.
+
+    max_delay_us : int
+        The maximum time, in microseconds, that a request waits for
+        other requests to be batched with it.
+
+    verbose : bool
+        If True generate verbose output.
+
+    http_headers : list of strings
+        HTTP headers to send with request. Ignored for GRPC
+        protocol. Each header must be specified as "Header:Value".
+
+    """
+    class _Request:
+        def __init__(self, inputs, outputs):
+            self.inputs = inputs
+            self.outputs = outputs
+            self.key = (tuple((name, value.shape, value.dtype.str)
+                              for (name, value) in sorted(iteritems(inputs))),
+                        tuple(sorted(iteritems(outputs))))
+            from concurrent.futures import Future
+            self.future = Future()
+            self.enqueue_time = time.monotonic()
+
+    def __init__(self, url, protocol, model_name, model_version=None,
+                 max_batch_size=0, max_delay_us=1000, verbose=False,
+                 http_headers=[]):
+        model_max_batch_size = get_model_status_cache(
+            url, protocol, verbose, http_headers).get_model_config(
+                model_name, model_version).max_batch_size
+        if model_max_batch_size == 0:
+            _raise_error("model '" + model_name + "' does not support batching")
+
+        if (max_batch_size <= 0) or (max_batch_size > model_max_batch_size):
+            max_batch_size = model_max_batch_size
+        self._max_batch_size = max_batch_size
+        self._max_delay_s = max_delay_us / 1000000.0
+
+        self._ctx = InferContext(url, protocol, model_name, model_version,
+                                 verbose, http_headers=http_headers)
+        self._queue = deque()
+        self._cv = threading.Condition()
+        self._closed = False
+        self._worker = threading.Thread(target=self._batch_loop)
+        self._worker.daemon = True
+        self._worker.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the client. The requests already submitted are run
+        before the client closes, any future requests will result in an
+        Error. The client must be closed to stop the thread that sends
+        the batches.
+
+        """
+        with self._cv:
+            if self._closed:
+                return
+            self._closed = True
+            self._cv.notify()
+        if self._worker is not threading.current_thread():
+            self._worker.join()
+        self._ctx.close()
+
+    def max_batch_size(self):
+        """Get the largest batch that the client sends to the server.
+
+        Returns
+        -------
+        int
+            The maximum batch size.
+
+        """
+        return self._max_batch_size
+
+    def submit(self, inputs, outputs):
+        """Submit an inference request for a single batch entry. The
+        request is run as part of a batch with other requests.
+
+        Parameters
+        ----------
+        inputs : dict
+            Dictionary from input name to the value for that input. An
+            input value is specified as a numpy array holding a single
+            batch entry, or as a list holding that single numpy array.
+
+        outputs : dict
+            Dictionary from output name to a value indicating the
+            ResultFormat that should be used for that output, as
+            described for InferContext.run().
+
+        Returns
+        -------
+        concurrent.futures.Future
+            The future that is resolved with the results of the request,
+            as returned by InferContext.run() for a batch size of 1. Use
+            asyncio.wrap_future() to await the future from a coroutine.
+
+        Raises
+        ------
+        InferenceServerException
+            If the client is closed or if an input value is not a
+            single numpy array.
+
+        """
+        request_inputs = dict()
+        for (input_name, input_value) in iteritems(inputs):
+            if isinstance(input_value, (list, tuple)) and (len(input_value) == 1):
+                input_value = input_value[0]
+            if not isinstance(input_value, np.ndarray):
+                _raise_error("input '" + input_name +
+                             "' value must be a single numpy array")
+            request_inputs[input_name] = input_value
+
+        request = BatchingInferClient._Request(request_inputs, outputs)
+        with self._cv:
+            if self._closed:
+                _raise_error("BatchingInferClient is closed")
+            self._queue.append(request)
+            self._cv.notify()
+        return request.future
+
+    def run(self, inputs, outputs):
+        """Run inference for a single batch entry using the supplied
+        'inputs' to calculate the outputs specified by 'outputs'. The
+        call blocks until the batch holding the request completes.
+
+        Parameters
+        ----------
+        inputs : dict
+            Dictionary from input name to the value for that input, as
+            described for submit().
+
+        outputs : dict
+            Dictionary from output name to a value indicating the
+            ResultFormat that should be used for that output, as
+            described for InferContext.run().
+
+        Returns
+        -------
+        dict
+            The results of the request, as returned by InferContext.run()
+            for a batch size of 1.
+
+        Raises
+        ------
+        InferenceServerException
+            If the inputs are not valid or if the server fails to
+            perform inference.
+
+        """
+        return self.submit(inputs, outputs).result()
+
+    def get_stat(self):
+        """Get the current statistics of the batched requests sent by
+        the client, as described for InferContext.get_stat().
+
+        Returns
+        -------
+        dict
+            The statistics, where completed_request_count is the number
+            of batches sent to the server.
+
+        Raises
+        ------
+        InferenceServerException
+            If fails to retrieve the statistics.
+
+        """
+        return self._ctx.get_stat()
+
+    def _batchable_count(self):
+        # Number of queued requests, up to a full batch, that can be
+        # batched with the oldest request.
+        key = self._queue[0].key
+        count = 0
+        for request in self._queue:
+            if request.key == key:
+                count += 1
+                if count == self._max_batch_size:
+                    break
+        return count
+
+    def _take_batch(self):
+        key = self._queue[0].key
+        batch = list()
+        remaining = deque()
+        while self._queue:
+            request = self._queue.popleft()
+            if (request.key == key) and (len(batch) < self._max_batch_size):
+                # Skip requests whose future was cancelled by the caller
+                if request.future.set_running_or_notify_cancel():
+                    batch.append(request)
+            else:
+                remaining.append(request)
+        self._queue = remaining
+        return batch
+
+    def _batch_loop(self):
+        while True:
+            with self._cv:
+                while (not self._queue) and (not self._closed):
+                    self._cv.wait()
+                if not self._queue:
+                    return
+
+                # Wait for more requests until the batch is full or the
+                # oldest request has waited for the maximum delay. A
+                # closing client sends the pending requests immediately.
+                deadline = self._queue[0].enqueue_time + self._max_delay_s
+                while ((not self._closed) and
+                       (self._batchable_count() < self._max_batch_size)):
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    self._cv.wait(timeout)
+
+                batch = self._take_batch()
+
+            if batch:
+                self._run_batch(batch)
+
+    def _run_batch(self, batch):
+        inputs = dict()
+        for input_name in batch[0].inputs:
+            inputs[input_name] = [request.inputs[input_name] for request in batch]
+
+        try:
+            results = self._ctx.run(inputs, batch[0].outputs, len(batch))
+        except Exception as ex:
+            for request in batch:
+                request.future.set_exception(ex)
+            return
+
+        # Each output is either a list with one value per batch entry or,
+        # for RAW_BATCH, an array with the batch as its first dimension,
+        # so slicing gives each request its results for a batch size of 1.
+        for (idx, request) in enumerate(batch):
+            request.future.set_result(
+                { name : value[idx:idx + 1] for (name, value) in iteritems(results) })
+
+def __getattr__(name):
+    """
+    Import the protobuf names of this module on first access.
+    """
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(
+            "module '" + __name__ + "' has no attribute '" + name + "'")
+    module_name, attr = _LAZY_ATTRIBUTES[name]
+    value = importlib.import_module(module_name)
+    if attr is not None:
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
+
+# 'from tensorrtserver.api import *' exports the protobuf names as well,
+# which imports them.
+__all__ = [name for name in globals() if not name.startswith('_')] + \
+    [name for name in _LAZY_ATTRIBUTES if name not in globals()]
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ is not supported, import the protobuf names now.
+    for _name in _LAZY_ATTRIBUTES:
+        __getattr__(_name)
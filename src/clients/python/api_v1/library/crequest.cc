@@ -26,6 +26,7 @@
 
 #include "src/clients/python/api_v1/library/crequest.h"
 
+#include <cstring>
 #include <iostream>
 #include "src/clients/c++/library/request_grpc.h"
 #include "src/clients/c++/library/request_http.h"
@@ -247,9 +248,13 @@ ServerStatusContextGetServerStatus(
   ni::ServerStatus server_status;
   nic::Error err = ctx->ctx->GetServerStatus(&server_status);
   if (err.IsOk()) {
-    ctx->status_buf = server_status.ShortDebugString();
-    *status = &ctx->status_buf[0];
-    *status_len = ctx->status_buf.size();
+    if (server_status.SerializeToString(&ctx->status_buf)) {
+      *status = &ctx->status_buf[0];
+      *status_len = ctx->status_buf.size();
+    } else {
+      err = nic::Error(
+          ni::RequestStatusCode::INTERNAL, "failed to serialize server status");
+    }
   }
 
   return new nic::Error(err);
@@ -781,6 +786,13 @@ InferContextInputDelete(InferContextInputCtx* ctx)
   delete ctx;
 }
 
+nic::Error*
+InferContextInputReset(InferContextInputCtx* ctx)
+{
+  nic::Error err = ctx->input->Reset();
+  return new nic::Error(err);
+}
+
 nic::Error*
 InferContextInputSetShape(
     InferContextInputCtx* ctx, const int64_t* dims, uint64_t size)
@@ -804,6 +816,26 @@ InferContextInputSetRaw(
   return new nic::Error(err);
 }
 
+nic::Error*
+InferContextInputSetRawBatch(
+    InferContextInputCtx* ctx, const void* data, const uint64_t* byte_sizes,
+    uint64_t batch_size)
+{
+  // The values of all batch entries are laid out back-to-back in
+  // 'data'. The input only records a pointer to each entry so the batch
+  // is not copied until the request is sent.
+  const uint8_t* base = reinterpret_cast<const uint8_t*>(data);
+  for (uint64_t b = 0; b < batch_size; ++b) {
+    nic::Error err = ctx->input->SetRaw(base, byte_sizes[b]);
+    if (!err.IsOk()) {
+      return new nic::Error(err);
+    }
+    base += byte_sizes[b];
+  }
+
+  return nullptr;
+}
+
 nic::Error*
 InferContextInputSetSharedMemory(InferContextInputCtx* ctx, void* shm_handle)
 {
@@ -977,6 +1009,52 @@ InferContextResultNextRaw(
   return new nic::Error(err);
 }
 
+nic::Error*
+InferContextResultBatchRaw(
+    InferContextResultCtx* ctx, uint64_t batch_size, char* buf,
+    uint64_t buf_len, uint64_t* byte_size)
+{
+  if (ctx->result == nullptr) {
+    return new nic::Error(
+        ni::RequestStatusCode::INTERNAL,
+        "no raw result available for empty result");
+  }
+
+  // Gather the result of every batch entry so that the entire batch
+  // can be delivered to the caller with a single copy. The total size
+  // is always reported, a null 'buf' only queries it.
+  std::vector<const uint8_t*> contents(batch_size);
+  std::vector<size_t> content_byte_sizes(batch_size);
+  size_t total_byte_size = 0;
+  for (size_t b = 0; b < batch_size; ++b) {
+    nic::Error err =
+        ctx->result->GetRaw(b, &contents[b], &content_byte_sizes[b]);
+    if (!err.IsOk()) {
+      return new nic::Error(err);
+    }
+    total_byte_size += content_byte_sizes[b];
+  }
+
+  *byte_size = total_byte_size;
+  if (buf != nullptr) {
+    if (total_byte_size > buf_len) {
+      return new nic::Error(
+          ni::RequestStatusCode::INVALID_ARG,
+          "batch raw result of " + std::to_string(total_byte_size) +
+              " bytes does not fit in buffer of " + std::to_string(buf_len) +
+              " bytes");
+    }
+    for (size_t b = 0; b < batch_size; ++b) {
+      if (content_byte_sizes[b] > 0) {
+        memcpy(buf, contents[b], content_byte_sizes[b]);
+        buf += content_byte_sizes[b];
+      }
+    }
+  }
+
+  return nullptr;
+}
+
 nic::Error*
 InferContextResultClassCount(
     InferContextResultCtx* ctx, size_t batch_idx, uint64_t* count)
@@ -154,10 +154,14 @@ nic::Error* InferContextInputNew(
     InferContextInputCtx** ctx, InferContextCtx* infer_ctx,
     const char* input_name);
 void InferContextInputDelete(InferContextInputCtx* ctx);
+nic::Error* InferContextInputReset(InferContextInputCtx* ctx);
 nic::Error* InferContextInputSetShape(
     InferContextInputCtx* ctx, const int64_t* dims, uint64_t size);
 nic::Error* InferContextInputSetRaw(
     InferContextInputCtx* ctx, const void* data, uint64_t byte_size);
+nic::Error* InferContextInputSetRawBatch(
+    InferContextInputCtx* ctx, const void* data, const uint64_t* byte_sizes,
+    uint64_t batch_size);
 nic::Error* InferContextInputSetSharedMemory(
     InferContextInputCtx* ctx, void* shm_handle);
 
@@ -183,6 +187,9 @@ nic::Error* InferContextResultShape(
 nic::Error* InferContextResultNextRaw(
     InferContextResultCtx* ctx, size_t batch_idx, const char** val,
     uint64_t* val_len);
+nic::Error* InferContextResultBatchRaw(
+    InferContextResultCtx* ctx, uint64_t batch_size, char* buf,
+    uint64_t buf_len, uint64_t* byte_size);
 nic::Error* InferContextResultClassCount(
     InferContextResultCtx* ctx, size_t batch_idx, uint64_t* count);
 nic::Error* InferContextResultNextClass(
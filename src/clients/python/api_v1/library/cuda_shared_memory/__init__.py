@@ -31,7 +31,6 @@ from future.utils import iteritems
 from ctypes import *
 import numpy as np
 from numpy.ctypeslib import ndpointer
-import pkg_resources
 import struct
 
 class _utf8(object):
@@ -46,7 +45,7 @@ class _utf8(object):
 
 import os
 _ccudashm_lib = "ccudashm" if os.name == 'nt' else 'libccudashm.so'
-_ccudashm_path = pkg_resources.resource_filename('tensorrtserver.cuda_shared_memory', _ccudashm_lib)
+_ccudashm_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), _ccudashm_lib)
 _ccudashm = cdll.LoadLibrary(_ccudashm_path)
 
 _ccudashm_shared_memory_region_create = _ccudashm.CudaSharedMemoryRegionCreate
@@ -31,8 +31,8 @@ from future.utils import iteritems
 from ctypes import *
 import numpy as np
 from numpy.ctypeslib import ndpointer
-import pkg_resources
 import struct
+import threading
 
 class _utf8(object):
     @classmethod
@@ -46,7 +46,7 @@ class _utf8(object):
 
 import os
 _cshm_lib = "cshm" if os.name == 'nt' else 'libcshm.so'
-_cshm_path = pkg_resources.resource_filename('tensorrtserver.shared_memory', _cshm_lib)
+_cshm_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), _cshm_lib)
 _cshm = cdll.LoadLibrary(_cshm_path)
 
 _cshm_shared_memory_region_create = _cshm.SharedMemoryRegionCreate
@@ -58,6 +58,15 @@ _cshm_shared_memory_region_set.argtypes = [c_void_p, c_uint64, c_uint64, c_void_
 _cshm_shared_memory_region_destroy = _cshm.SharedMemoryRegionDestroy
 _cshm_shared_memory_region_destroy.restype = c_int
 _cshm_shared_memory_region_destroy.argtypes = [c_void_p]
+_cshm_shared_memory_region_slice = _cshm.SharedMemoryRegionSlice
+_cshm_shared_memory_region_slice.restype = c_int
+_cshm_shared_memory_region_slice.argtypes = [c_void_p, c_uint64, c_uint64, POINTER(c_void_p)]
+_cshm_shared_memory_region_slice_release = _cshm.SharedMemoryRegionSliceRelease
+_cshm_shared_memory_region_slice_release.restype = c_int
+_cshm_shared_memory_region_slice_release.argtypes = [c_void_p]
+_cshm_shared_memory_region_address = _cshm.SharedMemoryRegionAddress
+_cshm_shared_memory_region_address.restype = c_int
+_cshm_shared_memory_region_address.argtypes = [c_void_p, POINTER(c_void_p), POINTER(c_uint64)]
 
 def _raise_if_error(errno):
     """
@@ -126,7 +135,8 @@ def set_shared_memory_region(shm_handle, input_values):
 
     offset_current = 0
     for input_value in input_values:
-        input_value = np.ascontiguousarray(input_value).flatten()
+        # Copied into the region as is unless not contiguous
+        input_value = np.ascontiguousarray(input_value)
         byte_size = input_value.size * input_value.itemsize
         _raise_if_error(
             c_int(_cshm_shared_memory_region_set(shm_handle, c_uint64(offset_current), \
@@ -134,6 +144,54 @@ def set_shared_memory_region(shm_handle, input_values):
         offset_current += byte_size
     return
 
+def get_region_ndarray(shm_handle, dtype, shape, offset=0):
+    """Get a numpy array that is a view of the contents of a shared
+    memory region. Writing to the array writes directly into the
+    region, and the array reflects the results written into the region
+    by the server, so no copy is made in either direction. The array
+    must not be used after the region is destroyed.
+
+    Parameters
+    ----------
+    shm_handle : c_void_p
+        The handle for the shared memory region.
+    dtype : np.dtype
+        The datatype of the array.
+    shape : tuple
+        The shape of the array.
+    offset : int
+        The offset, in bytes, of the array from the start of the region.
+        Default value is 0.
+
+    Returns
+    -------
+    np.array
+        The writable array viewing the shared memory region.
+
+    Raises
+    ------
+    SharedMemoryException
+        If the array does not fit in the shared memory region.
+    """
+
+    dtype = np.dtype(dtype)
+    if dtype == np.object:
+        _raise_error("cannot view string tensors in shared memory region")
+    byte_size = int(np.prod(shape)) * dtype.itemsize
+
+    shm_addr = c_void_p()
+    region_byte_size = c_uint64()
+    _raise_if_error(
+        c_int(_cshm_shared_memory_region_address(shm_handle, byref(shm_addr), byref(region_byte_size))))
+    if (offset < 0) or (offset + byte_size > region_byte_size.value):
+        _raise_error("array of " + str(byte_size) + " bytes at offset " + str(offset) +
+                     " exceeds the shared memory region of " + str(region_byte_size.value) + " bytes")
+    if byte_size == 0:
+        return np.empty(shape, dtype=dtype)
+
+    buf = (c_byte * byte_size).from_address(shm_addr.value + offset)
+    return np.frombuffer(buf, dtype=dtype).reshape(shape)
+
 def destroy_shared_memory_region(shm_handle):
     """Unlink a shared memory region with the specified handle.
 
@@ -152,6 +210,175 @@ def destroy_shared_memory_region(shm_handle):
         c_int(_cshm_shared_memory_region_destroy(shm_handle)))
     return
 
+class SharedMemoryArena:
+    """A SharedMemoryArena object creates and registers a single shared
+    memory region and hands out sub-allocations of that region. The
+    handles of the sub-allocations can be used like the handle of a
+    whole region, as InferContext inputs and outputs and with
+    set_shared_memory_region(), without creating or registering a
+    region for each tensor.
+
+    Freed sub-allocations are reused by later allocations. The arena
+    can be shared by multiple threads.
+
+    Parameters
+    ----------
+    shared_memory_ctx : SharedMemoryControlContext
+        The context used to register the region with the server.
+    trtis_shm_name : str
+        The unique name of the shared memory region to be created.
+    shm_key : str
+        The unique key of the shared memory object.
+    byte_size : int
+        The size in bytes of the shared memory region to be created.
+    alignment : int
+        The alignment, in bytes, of the offset of each sub-allocation.
+        Default value is 64.
+
+    Raises
+    ------
+    SharedMemoryException
+        If unable to create the shared memory region.
+    InferenceServerException
+        If unable to register the shared memory region.
+    """
+
+    def __init__(self, shared_memory_ctx, trtis_shm_name, shm_key, byte_size, alignment=64):
+        self._shared_memory_ctx = shared_memory_ctx
+        self._alignment = alignment
+        self._byte_size = byte_size
+        self._lock = threading.Lock()
+        # Free blocks as (offset, byte size), sorted by offset
+        self._free_blocks = [(0, byte_size)]
+        # Handle value -> (handle, offset, byte size) of the allocations
+        self._allocations = dict()
+        self._shm_handle = create_shared_memory_region(trtis_shm_name, shm_key, byte_size)
+        try:
+            self._shared_memory_ctx.register(self._shm_handle)
+        except Exception:
+            destroy_shared_memory_region(self._shm_handle)
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def close(self):
+        """Release all the sub-allocations, unregister the region from
+        the server and destroy it.
+
+        """
+        if self._shm_handle is None:
+            return
+        with self._lock:
+            for handle, _, _ in self._allocations.values():
+                _cshm_shared_memory_region_slice_release(handle)
+            self._allocations.clear()
+            self._free_blocks = []
+        try:
+            self._shared_memory_ctx.unregister(self._shm_handle)
+        finally:
+            destroy_shared_memory_region(self._shm_handle)
+            self._shm_handle = None
+
+    def allocate(self, byte_size):
+        """Allocate a part of the region.
+
+        Parameters
+        ----------
+        byte_size : int
+            The size in bytes of the sub-allocation.
+
+        Returns
+        -------
+        shm_handle : c_void_p
+            The handle for the sub-allocation.
+
+        Raises
+        ------
+        SharedMemoryException
+            If the region does not have a free block large enough for
+            the sub-allocation.
+        """
+
+        if byte_size <= 0:
+            _raise_error("byte_size must be positive")
+        # Rounding the size keeps the offset of the next block aligned
+        aligned_size = -(-byte_size // self._alignment) * self._alignment
+        with self._lock:
+            if self._shm_handle is None:
+                _raise_error("shared memory arena is closed")
+            for idx, (offset, block_size) in enumerate(self._free_blocks):
+                # Only the block at the end of the region can be smaller
+                # than the aligned size
+                if block_size >= byte_size:
+                    aligned_size = min(aligned_size, block_size)
+                    break
+            else:
+                _raise_error("unable to allocate " + str(byte_size) +
+                             " bytes from the shared memory arena")
+
+            handle = c_void_p()
+            _raise_if_error(
+                c_int(_cshm_shared_memory_region_slice(
+                    self._shm_handle, c_uint64(offset), c_uint64(byte_size), byref(handle))))
+            if block_size == aligned_size:
+                del self._free_blocks[idx]
+            else:
+                self._free_blocks[idx] = (offset + aligned_size, block_size - aligned_size)
+            self._allocations[handle.value] = (handle, offset, aligned_size)
+        return handle
+
+    def free(self, shm_handle):
+        """Return a sub-allocation to the arena. The handle must not be
+        used afterwards.
+
+        Parameters
+        ----------
+        shm_handle : c_void_p
+            The handle returned by allocate().
+
+        Raises
+        ------
+        SharedMemoryException
+            If the handle is not a sub-allocation of the arena.
+        """
+
+        with self._lock:
+            allocation = self._allocations.pop(shm_handle.value, None)
+            if allocation is None:
+                _raise_error("handle is not allocated from the shared memory arena")
+            handle, offset, byte_size = allocation
+            _cshm_shared_memory_region_slice_release(handle)
+
+            # Insert the block, merging it with the adjacent free blocks
+            idx = 0
+            while (idx < len(self._free_blocks)) and (self._free_blocks[idx][0] < offset):
+                idx += 1
+            if (idx < len(self._free_blocks)) and (offset + byte_size == self._free_blocks[idx][0]):
+                byte_size += self._free_blocks[idx][1]
+                del self._free_blocks[idx]
+            if (idx > 0) and (sum(self._free_blocks[idx - 1]) == offset):
+                idx -= 1
+                offset = self._free_blocks[idx][0]
+                byte_size += self._free_blocks[idx][1]
+                del self._free_blocks[idx]
+            self._free_blocks.insert(idx, (offset, byte_size))
+
+    def free_byte_size(self):
+        """Get the number of bytes of the region that are not allocated.
+
+        Returns
+        -------
+        int
+            The total size in bytes of the free blocks.
+
+        """
+        with self._lock:
+            return sum(block_size for _, block_size in self._free_blocks)
+
 class SharedMemoryException(Exception):
     """Exception indicating non-Success status.
 
@@ -165,7 +392,8 @@ class SharedMemoryException(Exception):
         self.err_code_map = { -2: "unable to get shared memory descriptor",
                             -3: "unable to initialize the size",
                             -4: "unable to read/mmap the shared memory region",
-                            -5: "unable to unlink the shared memory region"}
+                            -5: "unable to unlink the shared memory region",
+                            -6: "slice exceeds the shared memory region"}
         self._msg = None
         if type(err) == str:
             self._msg = err
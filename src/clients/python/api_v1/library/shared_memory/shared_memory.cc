@@ -105,9 +105,10 @@ int
 SharedMemoryRegionSet(
     void* shm_handle, size_t offset, size_t byte_size, const void* data)
 {
-  void* shm_addr =
-      reinterpret_cast<SharedMemoryHandle*>(shm_handle)->base_addr_;
-  char* shm_addr_offset = reinterpret_cast<char*>(shm_addr);
+  SharedMemoryHandle* handle =
+      reinterpret_cast<SharedMemoryHandle*>(shm_handle);
+  char* shm_addr_offset =
+      reinterpret_cast<char*>(handle->base_addr_) + handle->offset_;
   std::memcpy(shm_addr_offset + offset, data, byte_size);
   return 0;
 }
@@ -124,4 +125,38 @@ SharedMemoryRegionDestroy(void* shm_handle)
   return 0;
 }
 
+int
+SharedMemoryRegionSlice(
+    void* shm_handle, size_t offset, size_t byte_size, void** slice_handle)
+{
+  SharedMemoryHandle* handle =
+      reinterpret_cast<SharedMemoryHandle*>(shm_handle);
+  if ((offset + byte_size) > handle->byte_size_) {
+    return -6;
+  }
+
+  // The slice shares the mapping and the registration of the region
+  *slice_handle = SharedMemoryHandleCreate(
+      handle->trtis_shm_name_, handle->base_addr_, handle->shm_key_,
+      handle->shm_fd_, handle->offset_ + offset, byte_size);
+  return 0;
+}
+
+int
+SharedMemoryRegionSliceRelease(void* slice_handle)
+{
+  delete reinterpret_cast<SharedMemoryHandle*>(slice_handle);
+  return 0;
+}
+
+int
+SharedMemoryRegionAddress(void* shm_handle, void** shm_addr, size_t* byte_size)
+{
+  SharedMemoryHandle* handle =
+      reinterpret_cast<SharedMemoryHandle*>(shm_handle);
+  *shm_addr = reinterpret_cast<char*>(handle->base_addr_) + handle->offset_;
+  *byte_size = handle->byte_size_;
+  return 0;
+}
+
 //==============================================================================
@@ -42,6 +42,11 @@ int SharedMemoryRegionCreate(
 int SharedMemoryRegionSet(
     void* shm_handle, size_t offset, size_t byte_size, const void* data);
 int SharedMemoryRegionDestroy(void* shm_handle);
+int SharedMemoryRegionSlice(
+    void* shm_handle, size_t offset, size_t byte_size, void** slice_handle);
+int SharedMemoryRegionSliceRelease(void* slice_handle);
+int SharedMemoryRegionAddress(
+    void* shm_handle, void** shm_addr, size_t* byte_size);
 
 //==============================================================================
 
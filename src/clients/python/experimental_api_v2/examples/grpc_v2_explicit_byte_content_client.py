@@ -29,10 +29,7 @@ import argparse
 import sys
 import numpy as np
 
-import grpc
-from tritongrpcclient import grpc_service_v2_pb2
-from tritongrpcclient import grpc_service_v2_pb2_grpc
-from tritongrpcclient import utils
+import tritongrpcclient.core as grpcclient
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
@@ -51,60 +48,32 @@ if __name__ == '__main__':
 
     FLAGS = parser.parse_args()
 
-    # We use a simple model that takes 2 input tensors of 16 integers
-    # each and returns 2 output tensors of 16 integers each. One
-    # output tensor is the element-wise sum of the inputs and one
-    # output is the element-wise difference.
+    # We use a simple model that takes 2 input tensors of 16 strings
+    # each and returns 2 output tensors of 16 strings each. The strings
+    # hold integers. One output tensor is the element-wise sum of the
+    # inputs and one output is the element-wise difference.
     model_name = "simple_string"
     model_version = ""
     batch_size = 1
 
-    # Create gRPC stub for communicating with the server
-    channel = grpc.insecure_channel(FLAGS.url)
-    grpc_stub = grpc_service_v2_pb2_grpc.GRPCInferenceServiceStub(channel)
+    TRTISClient = grpcclient.InferenceServerClient(FLAGS.url)
 
-    # Generate the request
-    request = grpc_service_v2_pb2.ModelInferRequest()
-    request.model_name = model_name
-    request.model_version = model_version
+    # Input data
+    input0_data = np.array([str(i) for i in range(16)],
+                           dtype=np.object).reshape(1, 16)
+    input1_data = np.array(['1'] * 16, dtype=np.object).reshape(1, 16)
 
-    # Populate the inputs in inference request
-    input0 = grpc_service_v2_pb2.ModelInferRequest().InferInputTensor()
-    input0.name = "INPUT0"
-    input0.datatype = "BYTES"
-    input0.shape.extend([1, 16])
-    for i in range(16):
-        input0.contents.byte_contents.append(('{}'.format(i)).encode('utf-8'))
-
-    input1 = grpc_service_v2_pb2.ModelInferRequest().InferInputTensor()
-    input1.name = "INPUT1"
-    input1.datatype = "BYTES"
-    input1.shape.extend([1, 16])
-    for i in range(16):
-        input1.contents.byte_contents.append('1'.encode('utf-8'))
-
-    request.inputs.extend([input0, input1])
+    # Send the inputs in the byte_contents field of the request rather
+    # than as raw contents
+    inputs = [grpcclient.InferInput("INPUT0"), grpcclient.InferInput("INPUT1")]
+    inputs[0].set_data_from_numpy(input0_data, binary_data=False)
+    inputs[1].set_data_from_numpy(input1_data, binary_data=False)
 
-    # Populate the outputs in the inference request
-    output0 = grpc_service_v2_pb2.ModelInferRequest().InferRequestedOutputTensor()
-    output0.name = "OUTPUT0"
+    outputs = [grpcclient.InferOutput("OUTPUT0"), grpcclient.InferOutput("OUTPUT1")]
+    results = TRTISClient.infer(inputs, outputs, model_name, model_version)
 
-    output1 = grpc_service_v2_pb2.ModelInferRequest().InferRequestedOutputTensor()
-    output1.name = "OUTPUT1"
-    request.outputs.extend([output0, output1])
-
-    response = grpc_stub.ModelInfer(request)
-
-    # Deserialize the output raw tensor to numpy array for proper comparison
-    output_results = []
-    for output in response.outputs:
-        shape = []
-        for value in output.shape:
-            shape.append(value)
-        output_results.append(utils.deserialize_bytes_tensor(output.contents.raw_contents))
-        output_results[-1] = np.resize(output_results[-1], shape)
-
-    if len(output_results) != 2:
+    output_results = [results.as_numpy("OUTPUT0"), results.as_numpy("OUTPUT1")]
+    if any(output is None for output in output_results):
         print("expected two output results")
         sys.exit(1)
 
@@ -119,3 +88,5 @@ if __name__ == '__main__':
             print("explicit string infer error: incorrect difference")
             sys.exit(1)
     print('PASS: explicit string')
+
+    TRTISClient.close()
@@ -26,11 +26,11 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import argparse
+import sys
 import numpy as np
 
-import grpc
-from tritongrpcclient import grpc_service_v2_pb2
-from tritongrpcclient import grpc_service_v2_pb2_grpc
+import tritongrpcclient.core as grpcclient
+from tritongrpcclient.utils import InferenceServerException
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
@@ -57,73 +57,44 @@ if __name__ == '__main__':
     model_version = ""
     batch_size = 1
 
-    # Create gRPC stub for communicating with the server
-    channel = grpc.insecure_channel(FLAGS.url)
-    grpc_stub = grpc_service_v2_pb2_grpc.GRPCInferenceServiceStub(channel)
-
-    # Generate the request
-    request = grpc_service_v2_pb2.ModelInferRequest()
-    request.model_name = model_name
-    request.model_version = model_version
+    TRTISClient = grpcclient.InferenceServerClient(FLAGS.url)
 
     # Input data
-    input0_data = [i for i in range(16)]
-    input1_data = [1 for i in range(16)]
-
-    # Populate the inputs in inference request
-    input0 = grpc_service_v2_pb2.ModelInferRequest().InferInputTensor()
-    input0.name = "INPUT0"
-    input0.datatype = "INT8"
-    input0.shape.extend([1, 16])
-    input0.contents.int_contents[:] = input0_data
-
-    input1 = grpc_service_v2_pb2.ModelInferRequest().InferInputTensor()
-    input1.name = "INPUT1"
-    input1.datatype = "INT8"
-    input1.shape.extend([1, 16])
-    input1.contents.int_contents[:] = input1_data
-    request.inputs.extend([input0, input1])
+    input0_data = np.arange(16, dtype=np.int8).reshape(1, 16)
+    input1_data = np.ones((1, 16), dtype=np.int8)
 
-    # Populate the outputs in the inference request
-    output0 = grpc_service_v2_pb2.ModelInferRequest().InferRequestedOutputTensor()
-    output0.name = "OUTPUT0"
+    # Send the inputs in the int_contents field of the request rather
+    # than as raw contents
+    inputs = [grpcclient.InferInput("INPUT0"), grpcclient.InferInput("INPUT1")]
+    inputs[0].set_data_from_numpy(input0_data, binary_data=False)
+    inputs[1].set_data_from_numpy(input1_data, binary_data=False)
 
-    output1 = grpc_service_v2_pb2.ModelInferRequest().InferRequestedOutputTensor()
-    output1.name = "OUTPUT1"
-    request.outputs.extend([output0, output1])
+    outputs = [grpcclient.InferOutput("OUTPUT0"), grpcclient.InferOutput("OUTPUT1")]
+    results = TRTISClient.infer(inputs, outputs, model_name, model_version)
 
-    response = grpc_stub.ModelInfer(request)
-
-    output_results = []
-    for output in response.outputs:
-        shape = []
-        for value in output.shape:
-            shape.append(value)
-        output_results.append(np.frombuffer(
-                        output.contents.raw_contents,
-                        dtype=np.int32))
-        output_results[-1] = np.resize(output_results[-1], shape)
-    
-    if len(output_results) != 2:
+    output_results = [results.as_numpy("OUTPUT0"), results.as_numpy("OUTPUT1")]
+    if any(output is None for output in output_results):
         print("expected two output results")
         sys.exit(1)
 
     for i in range(16):
-        print(str(input0_data[i]) + " + " + str(input1_data[i]) + " = " +
+        print(str(input0_data[0][i]) + " + " + str(input1_data[0][i]) + " = " +
             str(output_results[0][0][i]))
-        print(str(input0_data[i]) + " - " + str(input1_data[i]) + " = " +
+        print(str(input0_data[0][i]) + " - " + str(input1_data[0][i]) + " = " +
             str(output_results[1][0][i]))
-        if (input0_data[i] + input1_data[i]) != output_results[0][0][i]:
+        if (input0_data[0][i] + input1_data[0][i]) != output_results[0][0][i]:
             print("sync infer error: incorrect sum")
             sys.exit(1)
-        if (input0_data[i] - input1_data[i]) != output_results[1][0][i]:
+        if (input0_data[0][i] - input1_data[0][i]) != output_results[1][0][i]:
             print("sync infer error: incorrect difference")
             sys.exit(1)
 
     # Server should catch wrong model version specification
-    request.model_version = "wrong_specification"
     try:
-        response = grpc_stub.ModelInfer(request)
-    except Exception as e:
-        if "failed to get model version from specified version string 'wrong_specification'" in e.__str__():
+        results = TRTISClient.infer(inputs, outputs, model_name,
+                                    "wrong_specification")
+    except InferenceServerException as e:
+        if "failed to get model version from specified version string 'wrong_specification'" in e.message():
             print('PASS: explicit int8')
+
+    TRTISClient.close()
@@ -26,9 +26,11 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import argparse
+import sys
 import numpy as np
 
 import grpc
+import tritongrpcclient.core as grpcclient
 from tritongrpcclient import grpc_service_v2_pb2
 from tritongrpcclient import grpc_service_v2_pb2_grpc
 
@@ -57,72 +59,59 @@ if __name__ == '__main__':
     model_version = ""
     batch_size = 1
 
-    # Create gRPC stub for communicating with the server
-    channel = grpc.insecure_channel(FLAGS.url)
-    grpc_stub = grpc_service_v2_pb2_grpc.GRPCInferenceServiceStub(channel)
-
-    # Generate the request
-    request = grpc_service_v2_pb2.ModelInferRequest()
-    request.model_name = model_name
-    request.model_version = model_version
+    TRTISClient = grpcclient.InferenceServerClient(FLAGS.url)
 
     # Input data
-    input0_data = [i for i in range(16)]
-    input1_data = [1 for i in range(16)]
-
-    # Populate the inputs in inference request
-    input0 = grpc_service_v2_pb2.ModelInferRequest().InferInputTensor()
-    input0.name = "INPUT0"
-    input0.datatype = "INT32"
-    input0.shape.extend([1, 16])
-    input0.contents.int_contents[:] = input0_data
-
-    input1 = grpc_service_v2_pb2.ModelInferRequest().InferInputTensor()
-    input1.name = "INPUT1"
-    input1.datatype = "INT32"
-    input1.shape.extend([1, 16])
-    input1.contents.int_contents[:] = input1_data
-    request.inputs.extend([input0, input1])
-
-    # Populate the outputs in the inference request
-    output0 = grpc_service_v2_pb2.ModelInferRequest().InferRequestedOutputTensor()
-    output0.name = "OUTPUT0"
-
-    output1 = grpc_service_v2_pb2.ModelInferRequest().InferRequestedOutputTensor()
-    output1.name = "OUTPUT1"
-    request.outputs.extend([output0, output1])
-
-    response = grpc_stub.ModelInfer(request)
-
-    output_results = []
-    for output in response.outputs:
-        shape = []
-        for value in output.shape:
-            shape.append(value)
-        output_results.append(np.frombuffer(
-                        output.contents.raw_contents,
-                        dtype=np.int32))
-        output_results[-1] = np.resize(output_results[-1], shape)
-    
-    if len(output_results) != 2:
+    input0_data = np.arange(16, dtype=np.int32).reshape(1, 16)
+    input1_data = np.ones((1, 16), dtype=np.int32)
+
+    # Send the inputs in the int_contents field of the request rather
+    # than as raw contents
+    inputs = [grpcclient.InferInput("INPUT0"), grpcclient.InferInput("INPUT1")]
+    inputs[0].set_data_from_numpy(input0_data, binary_data=False)
+    inputs[1].set_data_from_numpy(input1_data, binary_data=False)
+
+    outputs = [grpcclient.InferOutput("OUTPUT0"), grpcclient.InferOutput("OUTPUT1")]
+    results = TRTISClient.infer(inputs, outputs, model_name, model_version)
+
+    output_results = [results.as_numpy("OUTPUT0"), results.as_numpy("OUTPUT1")]
+    if any(output is None for output in output_results):
         print("expected two output results")
         sys.exit(1)
 
     for i in range(16):
-        print(str(input0_data[i]) + " + " + str(input1_data[i]) + " = " +
+        print(str(input0_data[0][i]) + " + " + str(input1_data[0][i]) + " = " +
             str(output_results[0][0][i]))
-        print(str(input0_data[i]) + " - " + str(input1_data[i]) + " = " +
+        print(str(input0_data[0][i]) + " - " + str(input1_data[0][i]) + " = " +
             str(output_results[1][0][i]))
-        if (input0_data[i] + input1_data[i]) != output_results[0][0][i]:
+        if (input0_data[0][i] + input1_data[0][i]) != output_results[0][0][i]:
             print("sync infer error: incorrect sum")
             sys.exit(1)
-        if (input0_data[i] - input1_data[i]) != output_results[1][0][i]:
+        if (input0_data[0][i] - input1_data[0][i]) != output_results[1][0][i]:
             print("sync infer error: incorrect difference")
             sys.exit(1)
-    
-    # Populating additional content field should generate an error
-    request.inputs[0].contents.raw_contents = np.array(input0_data[0:8]).tobytes()
-    request.inputs[0].contents.int_contents[:] = input0_data[8:]
+
+    TRTISClient.close()
+
+    # Populating additional content field should generate an error. The
+    # client does not produce such a request, so build it directly.
+    channel = grpc.insecure_channel(FLAGS.url)
+    grpc_stub = grpc_service_v2_pb2_grpc.GRPCInferenceServiceStub(channel)
+
+    request = grpc_service_v2_pb2.ModelInferRequest()
+    request.model_name = model_name
+    request.model_version = model_version
+    for name, input_data in (("INPUT0", input0_data), ("INPUT1", input1_data)):
+        input_tensor = request.inputs.add()
+        input_tensor.name = name
+        input_tensor.datatype = "INT32"
+        input_tensor.shape.extend(input_data.shape)
+        input_tensor.contents.int_contents[:] = input_data.flatten().tolist()
+    request.outputs.add().name = "OUTPUT0"
+    request.outputs.add().name = "OUTPUT1"
+
+    request.inputs[0].contents.raw_contents = input0_data[0][0:8].tobytes()
+    request.inputs[0].contents.int_contents[:] = input0_data[0][8:].tolist()
 
     try:
         response = grpc_stub.ModelInfer(request)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import argparse
+import asyncio
+import numpy as np
+import sys
+
+import tritongrpcclient.aio as grpcclient
+
+
+async def run_infer(client, model_name, index):
+    # Create the data for the two input tensors. Initialize the first
+    # to unique integers and the second to all ones, offset by the
+    # index of the request so every response can be validated.
+    input0_data = np.arange(start=index, stop=index + 16, dtype=np.int32)
+    input0_data = np.expand_dims(input0_data, axis=0)
+    input1_data = np.ones(shape=(1, 16), dtype=np.int32)
+
+    inputs = []
+    inputs.append(grpcclient.InferInput('INPUT0'))
+    inputs.append(grpcclient.InferInput('INPUT1'))
+    inputs[0].set_data_from_numpy(input0_data)
+    inputs[1].set_data_from_numpy(input1_data)
+
+    outputs = []
+    outputs.append(grpcclient.InferOutput('OUTPUT0'))
+    outputs.append(grpcclient.InferOutput('OUTPUT1'))
+
+    result = await client.infer(inputs, outputs, model_name)
+
+    output0_data = result.as_numpy('OUTPUT0')
+    output1_data = result.as_numpy('OUTPUT1')
+    if not np.array_equal(input0_data + input1_data, output0_data):
+        print("aio infer error: incorrect sum for request " + str(index))
+        sys.exit(1)
+    if not np.array_equal(input0_data - input1_data, output1_data):
+        print("aio infer error: incorrect difference for request " +
+              str(index))
+        sys.exit(1)
+
+
+async def main(FLAGS):
+    model_name = 'simple'
+
+    async with grpcclient.AsyncInferenceServerClient(FLAGS.url) as client:
+        if not await client.is_server_live():
+            print("FAILED : is_server_live")
+            sys.exit(1)
+        if not await client.is_model_ready(model_name):
+            print("FAILED : is_model_ready")
+            sys.exit(1)
+
+        metadata = await client.get_model_metadata(model_name)
+        if metadata.name != model_name:
+            print("FAILED : get_model_metadata")
+            sys.exit(1)
+
+        # All the requests are in flight on the same client at the
+        # same time.
+        await asyncio.gather(*[
+            run_infer(client, model_name, i)
+            for i in range(FLAGS.concurrency)
+        ])
+
+    print("PASS: aio infer")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-v',
+                        '--verbose',
+                        action="store_true",
+                        required=False,
+                        default=False,
+                        help='Enable verbose output')
+    parser.add_argument('-u',
+                        '--url',
+                        type=str,
+                        required=False,
+                        default='localhost:8001',
+                        help='Inference server URL. Default is localhost:8001.')
+    parser.add_argument('-c',
+                        '--concurrency',
+                        type=int,
+                        required=False,
+                        default=32,
+                        help='Number of concurrent requests. Default is 32.')
+
+    FLAGS = parser.parse_args()
+    asyncio.get_event_loop().run_until_complete(main(FLAGS))
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from functools import partial
+import argparse
+import numpy as np
+import queue
+import sys
+
+import tritongrpcclient.core as grpcclient
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-v',
+                        '--verbose',
+                        action="store_true",
+                        required=False,
+                        default=False,
+                        help='Enable verbose output')
+    parser.add_argument('-u',
+                        '--url',
+                        type=str,
+                        required=False,
+                        default='localhost:8001',
+                        help='Inference server URL. Default is localhost:8001.')
+
+    FLAGS = parser.parse_args()
+    try:
+        TRTISClient = grpcclient.InferenceServerClient(FLAGS.url)
+    except Exception as e:
+        print("context creation failed: " + str(e))
+        sys.exit()
+
+    model_name = 'simple'
+    request_count = 10
+
+    # Define the callback function. The stream delivers the response
+    # for each request in the same order as the requests were sent.
+    def callback(user_data, result, error):
+        if error:
+            user_data.put(error)
+        else:
+            user_data.put(result)
+
+    # Queue to hold the results of inference.
+    user_data = queue.Queue()
+
+    # Start the stream. All the requests below are sent on it.
+    TRTISClient.start_stream(partial(callback, user_data))
+
+    input0_data = []
+    input1_data = np.ones(shape=(1, 16), dtype=np.int32)
+    for i in range(request_count):
+        inputs = []
+        outputs = []
+        inputs.append(grpcclient.InferInput('INPUT0'))
+        inputs.append(grpcclient.InferInput('INPUT1'))
+
+        # Create the data for the two input tensors. Initialize the
+        # first to unique integers for each request and the second to
+        # all ones.
+        input0_data.append(
+            np.arange(start=i, stop=i + 16, dtype=np.int32).reshape(1, 16))
+        inputs[0].set_data_from_numpy(input0_data[i])
+        inputs[1].set_data_from_numpy(input1_data)
+
+        outputs.append(grpcclient.InferOutput('OUTPUT0'))
+        outputs.append(grpcclient.InferOutput('OUTPUT1'))
+
+        TRTISClient.async_stream_infer(inputs,
+                                       outputs,
+                                       model_name,
+                                       request_id=str(i))
+
+    # Stopping the stream waits for all the responses to be delivered
+    TRTISClient.stop_stream()
+
+    # Validate the results, which must be received in request order
+    if user_data.qsize() != request_count:
+        print("stream infer error: expected " + str(request_count) +
+              " responses, got " + str(user_data.qsize()))
+        sys.exit(1)
+    for i in range(request_count):
+        result = user_data.get()
+        if type(result) == grpcclient.InferenceServerException:
+            print("stream infer error: " + str(result))
+            sys.exit(1)
+        if result.get_response().id != str(i):
+            print("stream infer error: expected response for request '" +
+                  str(i) + "', got '" + result.get_response().id + "'")
+            sys.exit(1)
+        output0_data = result.as_numpy('OUTPUT0')
+        output1_data = result.as_numpy('OUTPUT1')
+        if FLAGS.verbose:
+            print("request " + str(i) + ": " + str(output0_data[0]) + ", " +
+                  str(output1_data[0]))
+        if not np.array_equal(input0_data[i] + input1_data, output0_data):
+            print("stream infer error: incorrect sum")
+            sys.exit(1)
+        if not np.array_equal(input0_data[i] - input1_data, output1_data):
+            print("stream infer error: incorrect difference")
+            sys.exit(1)
+
+    # An error on one request is reported to the callback and does not
+    # end the stream.
+    TRTISClient.start_stream(partial(callback, user_data))
+    inputs = [grpcclient.InferInput('INPUT0'), grpcclient.InferInput('INPUT1')]
+    inputs[0].set_data_from_numpy(input0_data[0])
+    inputs[1].set_data_from_numpy(input1_data)
+    TRTISClient.async_stream_infer(inputs, [], 'wrong_model_name')
+    TRTISClient.async_stream_infer(inputs, [], model_name, request_id='ok')
+    TRTISClient.stop_stream()
+
+    error = user_data.get()
+    if type(error) != grpcclient.InferenceServerException:
+        print("stream infer error: expected error for unknown model")
+        sys.exit(1)
+    result = user_data.get()
+    if ((type(result) == grpcclient.InferenceServerException) or
+        (result.get_response().id != 'ok')):
+        print("stream infer error: stream did not continue after an error")
+        sys.exit(1)
+
+    TRTISClient.close()
+    print("PASS: stream infer")
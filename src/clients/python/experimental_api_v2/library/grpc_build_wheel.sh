@@ -55,6 +55,9 @@ function main() {
   cp grpcclient.py \
     "${WHLDIR}/tritongrpcclient/core.py"
 
+  cp grpcclient_aio.py \
+    "${WHLDIR}/tritongrpcclient/aio.py"
+
   cp utils.py \
     "${WHLDIR}/tritongrpcclient/."
 
@@ -24,8 +24,16 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from collections import deque
+import functools
+import hashlib
+import itertools
 import numpy as np
 import grpc
+import queue
+import random
+import threading
+import time
 import rapidjson as json
 from google.protobuf.json_format import MessageToJson
 
@@ -40,18 +48,156 @@ def raise_error_grpc(rpc_error):
         debug_details=rpc_error.debug_error_string()) from None
 
 
+class _InflightTracker:
+    """Tracks the inference requests in flight on a client and blocks
+    new requests while 'max_outstanding' requests are in flight. A
+    'max_outstanding' of 0 places no limit on the number of requests.
+    """
+
+    def __init__(self, max_outstanding):
+        self._max_outstanding = max_outstanding
+        self._count = 0
+        self._cv = threading.Condition()
+
+    def acquire(self, block=True):
+        """Returns False if 'block' is False and the limit is reached."""
+        with self._cv:
+            if self._max_outstanding > 0:
+                while self._count >= self._max_outstanding:
+                    if not block:
+                        return False
+                    self._cv.wait()
+            self._count += 1
+            return True
+
+    def release(self):
+        with self._cv:
+            self._count -= 1
+            self._cv.notify()
+
+    def count(self):
+        return self._count
+
+
+class KeepAliveOptions:
+    """A KeepAliveOptions object holds the keepalive settings of the gRPC
+    connection to the server, see
+    https://github.com/grpc/grpc/blob/master/doc/keepalive.md.
+
+    Parameters
+    ----------
+    keepalive_time_ms : int
+        The time, in milliseconds, after which a keepalive ping is sent
+        on the connection. Default value is 2**31 - 1, which disables
+        the pings.
+    keepalive_timeout_ms : int
+        The time, in milliseconds, to wait for the acknowledgement of a
+        keepalive ping before the connection is closed. Default value
+        is 20000.
+    keepalive_permit_without_calls : bool
+        If True keepalive pings are sent even when there are no calls
+        in flight. Default value is False.
+    http2_max_pings_without_data : int
+        The maximum number of pings that can be sent when there is no
+        data to send. Default value is 2, a value of 0 allows any
+        number of pings.
+
+    """
+
+    def __init__(self,
+                 keepalive_time_ms=2**31 - 1,
+                 keepalive_timeout_ms=20000,
+                 keepalive_permit_without_calls=False,
+                 http2_max_pings_without_data=2):
+        self.keepalive_time_ms = keepalive_time_ms
+        self.keepalive_timeout_ms = keepalive_timeout_ms
+        self.keepalive_permit_without_calls = keepalive_permit_without_calls
+        self.http2_max_pings_without_data = http2_max_pings_without_data
+
+
+def _get_channel_options(max_message_size, keepalive_options, channel_args):
+    options = []
+    if max_message_size is not None:
+        options.append(('grpc.max_send_message_length', max_message_size))
+        options.append(('grpc.max_receive_message_length', max_message_size))
+    if keepalive_options is not None:
+        options.append(
+            ('grpc.keepalive_time_ms', keepalive_options.keepalive_time_ms))
+        options.append(('grpc.keepalive_timeout_ms',
+                        keepalive_options.keepalive_timeout_ms))
+        options.append(
+            ('grpc.keepalive_permit_without_calls',
+             int(keepalive_options.keepalive_permit_without_calls)))
+        options.append(('grpc.http2.max_pings_without_data',
+                        keepalive_options.http2_max_pings_without_data))
+    if channel_args is not None:
+        options.extend(channel_args)
+    return options
+
+
+def _get_compression(compression_algorithm):
+    if compression_algorithm is None:
+        return None
+    elif compression_algorithm == 'gzip':
+        return grpc.Compression.Gzip
+    elif compression_algorithm == 'deflate':
+        return grpc.Compression.Deflate
+    raise_error("unsupported compression algorithm '" +
+                str(compression_algorithm) + "'")
+
+
 class InferenceServerClient:
     """An InferenceServerClient object is used to perform any kind of
-    communication with the InferenceServer using gRPC protocol.
+    communication with the InferenceServer using gRPC protocol. The
+    client can be shared by multiple threads as each inference call
+    creates and sends its own request.
 
     Parameters
     ----------
     url : str
-        The inference server URL, e.g. 'localhost:8001'.     
+        The inference server URL, e.g. 'localhost:8001'. A server on
+        the same host can also be reached through its unix domain
+        socket, e.g. 'unix:/tmp/trtserver.sock', which avoids the TCP
+        loopback stack.
 
     verbose : bool
         If True generate verbose output. Default value is False.
-    
+
+    max_outstanding_requests : int
+        The maximum number of inference requests that can be in flight
+        on the client at the same time. Once the limit is reached,
+        infer() and async_infer() block until an in-flight request
+        completes. Default value is 0, which places no limit.
+
+    response_cache : ResponseCache
+        The cache holding the responses of infer(). Repeating a request
+        returns the held InferResult without contacting the server.
+        Requests that are part of a sequence are never cached. Default
+        value is None, which disables caching.
+
+    max_message_size : int
+        The maximum size, in bytes, of the messages sent to and received
+        from the server, which bounds the size of the requests and
+        responses. Default value is None, which keeps the gRPC limits
+        of unlimited requests and 4 MB responses. A value of -1 removes
+        both limits.
+
+    keepalive_options : KeepAliveOptions
+        The keepalive settings of the connection. Default value is None,
+        which keeps the gRPC defaults.
+
+    channel_count : int
+        The number of gRPC channels, each with its own connection to the
+        server, that the inference requests are spread over. Requests on
+        a single connection share one TCP stream and HTTP/2 flow control
+        window, so multiple channels can increase the throughput of
+        large requests. Must be at least 1. Default value is 1.
+
+    channel_args : list
+        Additional (key, value) arguments of the gRPC channels, see
+        https://grpc.github.io/grpc/core/group__grpc__arg__keys.html.
+        Default value is None.
+
     Raises
     ------
     Exception
@@ -59,13 +205,47 @@ class InferenceServerClient:
 
     """
 
-    def __init__(self, url, verbose=False):
-        # FixMe: Are any of the channel options worth exposing?
-        # https://grpc.io/grpc/core/group__grpc__arg__keys.html
-        self._channel = grpc.insecure_channel(url, options=None)
-        self._client_stub = grpc_service_v2_pb2_grpc.GRPCInferenceServiceStub(
-            self._channel)
+    def __init__(self,
+                 url,
+                 verbose=False,
+                 max_outstanding_requests=0,
+                 response_cache=None,
+                 max_message_size=None,
+                 keepalive_options=None,
+                 channel_count=1,
+                 channel_args=None):
+        # Set first so that close() is safe if the client is not created
+        self._stream = None
+        self._channels = []
+        if channel_count < 1:
+            raise_error("channel_count must be at least 1")
+        options = _get_channel_options(max_message_size, keepalive_options,
+                                       channel_args)
+        if channel_count > 1:
+            # Without a subchannel pool of their own the channels would
+            # share a single connection.
+            options.append(('grpc.use_local_subchannel_pool', 1))
+        self._channels = [
+            grpc.insecure_channel(url, options=options)
+            for _ in range(channel_count)
+        ]
+        self._client_stubs = [
+            grpc_service_v2_pb2_grpc.GRPCInferenceServiceStub(channel)
+            for channel in self._channels
+        ]
+        self._client_stub = self._client_stubs[0]
+        # ModelInfer requests are encoded by the client, see
+        # _encode_inference_request().
+        self._infer_calls = itertools.cycle([
+            channel.unary_unary(
+                _MODEL_INFER_METHOD,
+                request_serializer=_EncodedInferRequest.SerializeToString,
+                response_deserializer=_EncodedInferResponse)
+            for channel in self._channels
+        ])
         self._verbose = verbose
+        self._inflight = _InflightTracker(max_outstanding_requests)
+        self._response_cache = response_cache
 
     def __enter__(self):
         return self
@@ -81,7 +261,22 @@ class InferenceServerClient:
         will result in an Error.
 
         """
-        self._channel.close()
+        self.stop_stream()
+        for channel in self._channels:
+            channel.close()
+
+    def get_outstanding_request_count(self):
+        """Get the number of inference requests currently in flight on
+        the client.
+
+        Returns
+        -------
+        int
+            The number of inference requests that have been issued
+            but have not yet completed.
+
+        """
+        return self._inflight.count()
 
     def is_server_live(self):
         """Contact the inference server and get liveness.
@@ -311,7 +506,8 @@ class InferenceServerClient:
               model_name,
               model_version="",
               request_id=None,
-              sequence_id=0):
+              sequence_id=0,
+              compression_algorithm=None):
         """Run synchronous inference using the supplied 'inputs' requesting
         the outputs specified by 'outputs'.
 
@@ -339,12 +535,16 @@ class InferenceServerClient:
             indicates that the request is not part of a sequence. The
             sequence ID is used to indicate that two or more inference
             requests are in the same sequence.
+        compression_algorithm : str
+            The compression applied to the request, 'gzip' or 'deflate'.
+            Default value is None, which sends the request uncompressed.
 
         Returns
         -------
         InferResult
             The object holding the result of the inference, including the
-            statistics.
+            statistics. When the response is served by the response cache
+            the result is shared with the request that populated it.
 
         Raises
         ------
@@ -352,15 +552,33 @@ class InferenceServerClient:
             If server fails to perform inference.
         """
 
-        self._get_inference_request(inputs, outputs, model_name, model_version,
-                                    request_id, sequence_id)
-
+        compression = _get_compression(compression_algorithm)
+        if (self._response_cache is None) or sequence_id:
+            request = _encode_inference_request(inputs, outputs, model_name,
+                                                model_version, request_id,
+                                                sequence_id)
+            return self._infer(request, compression)
+
+        # The request ID does not take part in the cache key
+        request = _encode_inference_request(inputs, outputs, model_name,
+                                            model_version, None, sequence_id)
+        key = request._digest()
+        request._set_id(request_id)
+        return self._response_cache._get_or_compute(
+            key, lambda: self._infer(request, compression),
+            lambda result: result._result.ByteSize())
+
+    def _infer(self, request, compression=None):
+        self._inflight.acquire()
         try:
-            response = self._client_stub.ModelInfer(self._request)
+            response = next(self._infer_calls)(request,
+                                               compression=compression)
             result = InferResult(response)
             return result
         except grpc.RpcError as rpc_error:
             raise_error_grpc(rpc_error)
+        finally:
+            self._inflight.release()
 
     def async_infer(self,
                     callback,
@@ -369,9 +587,12 @@ class InferenceServerClient:
                     model_name,
                     model_version="",
                     request_id=None,
-                    sequence_id=None):
+                    sequence_id=None,
+                    compression_algorithm=None):
         """Run asynchronous inference using the supplied 'inputs' requesting
-        the outputs specified by 'outputs'.
+        the outputs specified by 'outputs'. If the client already has
+        'max_outstanding_requests' requests in flight then the call blocks
+        until one of them completes.
 
         Parameters
         ----------
@@ -404,7 +625,10 @@ class InferenceServerClient:
             indicates that the request is not part of a sequence. The
             sequence ID is used to indicate that two or more inference
             requests are in the same sequence.
-    
+        compression_algorithm : str
+            The compression applied to the request, 'gzip' or 'deflate'.
+            Default value is None, which sends the request uncompressed.
+
         Raises
         ------
         InferenceServerException
@@ -418,19 +642,95 @@ class InferenceServerClient:
                 raise_error_grpc(rpc_error)
             callback(result=result)
 
-        self._get_inference_request(inputs, outputs, model_name, model_version,
-                                    request_id, sequence_id)
+        request = _encode_inference_request(inputs, outputs, model_name,
+                                            model_version, request_id,
+                                            sequence_id)
+        self._start_infer(request, _get_compression(
+            compression_algorithm)).add_done_callback(wrapped_callback)
+
+    def _start_infer(self, request, compression=None, block=True):
+        # Blocks while the client is at its limit of in-flight requests,
+        # unless 'block' is False
+        if not self._inflight.acquire(block):
+            raise_error("maximum number of outstanding requests reached")
+        try:
+            call_future = next(self._infer_calls).future(
+                request, compression=compression)
+        except grpc.RpcError as rpc_error:
+            self._inflight.release()
+            raise_error_grpc(rpc_error)
+        call_future.add_done_callback(lambda _: self._inflight.release())
+        return call_future
+
+    def start_stream(self, callback):
+        """Starts a bidirectional gRPC stream to the server. The requests
+        sent with async_stream_infer() share the stream, and so do not
+        pay the cost of setting up a new gRPC call each. Only one stream
+        can be active on a client at a time.
+
+        Parameters
+        ----------
+        callback : function
+            Python function that is invoked with the keyword arguments
+            'result' and 'error' once the response for a request on the
+            stream is received. 'result' is the InferResult object for
+            the request, or None if the request failed in which case
+            'error' holds the InferenceServerException describing the
+            failure. The responses are delivered in the same order as
+            the requests were sent, which preserves the order of the
+            requests within each sequence. The request_id of each
+            request is returned in the id of its response. An exception
+            raised by the callback does not stop the delivery of the
+            later responses, the first one is raised by stop_stream().
+
+        Raises
+        ------
+        InferenceServerException
+            If a stream is already active on the client or if unable
+            to start the stream.
+        """
+        if self._stream is not None:
+            raise_error(
+                "cannot start another stream while a stream is active")
 
+        stream = _InferStream(callback)
         try:
-            self._call_future = self._client_stub.ModelInfer.future(
-                self._request)
-            self._call_future.add_done_callback(wrapped_callback)
+            response_iterator = self._client_stub.ModelStreamInfer(
+                stream._request_iterator())
         except grpc.RpcError as rpc_error:
             raise_error_grpc(rpc_error)
+        stream._start(response_iterator)
+        self._stream = stream
+
+    def stop_stream(self):
+        """Stops the stream started by start_stream(), if any. The call
+        blocks until the responses for all the requests sent on the
+        stream have been delivered to the callback.
 
-    def _get_inference_request(self, inputs, outputs, model_name, model_version,
-                               request_id, sequence_id):
-        """Creates and initializes an inference request.
+        Raises
+        ------
+        Exception
+            The first exception raised by the callback of the stream,
+            if any.
+        """
+        if self._stream is not None:
+            stream = self._stream
+            self._stream = None
+            stream._close()
+            if stream._callback_error is not None:
+                raise stream._callback_error
+
+    def async_stream_infer(self,
+                           inputs,
+                           outputs,
+                           model_name,
+                           model_version="",
+                           request_id=None,
+                           sequence_id=0):
+        """Sends an inference request using the supplied 'inputs'
+        requesting the outputs specified by 'outputs' on the stream
+        started by start_stream(). The response is delivered to the
+        callback of the stream.
 
         Parameters
         ----------
@@ -456,19 +756,1196 @@ class InferenceServerClient:
             indicates that the request is not part of a sequence. The
             sequence ID is used to indicate that two or more inference
             requests are in the same sequence.
+
+        Raises
+        ------
+        InferenceServerException
+            If no stream is active on the client or if the stream has
+            failed.
+        """
+        if self._stream is None:
+            raise_error(
+                "stream not available, use start_stream() to start a stream")
+
+        request = _get_inference_request(inputs, outputs, model_name,
+                                         model_version, request_id,
+                                         sequence_id)
+        self._stream._enqueue_request(request)
+
+
+class _ModelHedgingState:
+    """The recent latencies, hedge budget and counters of the requests
+    for one model.
+    """
+
+    def __init__(self, window_size):
+        self.latencies_s = deque(maxlen=window_size)
+        self.pending_latency_count = 0
+        self.delay_s = None
+        self.budget = 0.0
+        self.request_count = 0
+        self.hedge_count = 0
+        self.hedge_win_count = 0
+
+
+class HedgingPolicy:
+    """A HedgingPolicy object decides when a LoadBalancedInferenceServerClient
+    sends a duplicate, or hedge, of a request to a second server. A hedge
+    is sent when a request has not completed after the given percentile
+    of the recent latencies of its model. The first response wins and the
+    other request is cancelled.
+
+    The hedges of each model are limited by a budget that grows by
+    'budget_ratio' for every request of the model, so that hedging adds
+    at most that fraction of requests on top of a burst of 'max_burst'
+    hedges. A policy can be shared by multiple clients.
+
+    Parameters
+    ----------
+    percentile : float
+        The percentile, between 0 and 100, of the recent latencies of a
+        model after which a request is hedged. Default value is 95.
+    budget_ratio : float
+        The maximum number of hedges for each request of a model.
+        Default value is 0.05.
+    max_burst : int
+        The maximum number of hedges of a model that can be sent in a
+        row after a period without hedges. Default value is 10.
+    window_size : int
+        The number of recent latencies of a model the percentile is
+        computed from. Default value is 1000.
+    min_sample_count : int
+        The number of latencies of a model that must be observed before
+        its requests are hedged. Default value is 20.
+
+    """
+
+    # The percentile of a model is recomputed after this many latencies
+    _UPDATE_INTERVAL = 10
+
+    def __init__(self,
+                 percentile=95,
+                 budget_ratio=0.05,
+                 max_burst=10,
+                 window_size=1000,
+                 min_sample_count=20):
+        self._percentile = percentile
+        self._budget_ratio = budget_ratio
+        self._max_burst = max_burst
+        self._window_size = window_size
+        self._min_sample_count = min_sample_count
+        self._lock = threading.Lock()
+        self._models = {}
+
+    def get_stats(self):
+        """Get the hedging statistics of each model.
+
+        Returns
+        -------
+        dict
+            Maps each model name to a dict holding the 'request_count'
+            of its requests, the 'hedge_count' of the hedges sent, the
+            'hedge_win_count' of the hedges that completed first and
+            the current hedging 'delay_s', which is None until enough
+            latencies have been observed.
+
+        """
+        with self._lock:
+            return {
+                model_name: {
+                    'request_count': state.request_count,
+                    'hedge_count': state.hedge_count,
+                    'hedge_win_count': state.hedge_win_count,
+                    'delay_s': state.delay_s
+                } for model_name, state in self._models.items()
+            }
+
+    def _start_request(self, model_name):
+        """Returns the time after which a new request for the model is
+        hedged, or None if it must not be hedged.
+        """
+        with self._lock:
+            state = self._models.get(model_name)
+            if state is None:
+                state = _ModelHedgingState(self._window_size)
+                self._models[model_name] = state
+            state.request_count += 1
+            state.budget = min(self._max_burst,
+                               state.budget + self._budget_ratio)
+            return state.delay_s
+
+    def _acquire_hedge(self, model_name):
+        with self._lock:
+            state = self._models[model_name]
+            if state.budget < 1:
+                return False
+            state.budget -= 1
+            state.hedge_count += 1
+            return True
+
+    def _release_hedge(self, model_name):
+        # Returns the budget of a hedge that could not be sent
+        with self._lock:
+            state = self._models[model_name]
+            state.budget += 1
+            state.hedge_count -= 1
+
+    def _record(self, model_name, latency_s, hedge_won):
+        with self._lock:
+            state = self._models[model_name]
+            state.latencies_s.append(latency_s)
+            if hedge_won:
+                state.hedge_win_count += 1
+            state.pending_latency_count += 1
+            if (len(state.latencies_s) >= self._min_sample_count) and \
+               ((state.delay_s is None) or
+                (state.pending_latency_count >= self._UPDATE_INTERVAL)):
+                state.delay_s = float(
+                    np.percentile(state.latencies_s, self._percentile))
+                state.pending_latency_count = 0
+
+
+class _HedgedCall:
+    """The attempts of a hedged inference request. The first attempt to
+    succeed provides the response.
+    """
+
+    def __init__(self, request, compression):
+        self._request = request
+        self._compression = compression
+        self._cv = threading.Condition()
+        # (endpoint, call future, start time) of each attempt
+        self._attempts = []
+        # (attempt index, response, latency) of the first success
+        self._success = None
+        # (attempt index, RpcError) of each failure
+        self._failures = []
+
+    def start(self, endpoint, block=True):
+        start = time.monotonic()
+        call_future = endpoint.client._start_infer(self._request,
+                                                   self._compression, block)
+        with self._cv:
+            index = len(self._attempts)
+            self._attempts.append((endpoint, call_future, start))
+        call_future.add_done_callback(
+            lambda call_future: self._complete(index, call_future))
+
+    def wait(self, timeout=None):
+        """Returns False if no attempt has succeeded and some attempts
+        are still running after 'timeout'.
+        """
+        with self._cv:
+            return self._cv.wait_for(
+                lambda: (self._success is not None) or
+                (len(self._failures) == len(self._attempts)), timeout)
+
+    def _complete(self, index, call_future):
+        if call_future.cancelled():
+            return
+        try:
+            response = call_future.result()
+        except grpc.RpcError as rpc_error:
+            with self._cv:
+                self._failures.append((index, rpc_error))
+                self._cv.notify_all()
+            return
+        with self._cv:
+            if self._success is None:
+                self._success = (index, response,
+                                 time.monotonic() - self._attempts[index][2])
+                self._cv.notify_all()
+
+
+# The weight of the latest request in the latency estimate of an endpoint
+_LATENCY_WEIGHT = 0.2
+
+# The latency estimate of an endpoint halves for every this many seconds
+# without a completed request, so that an endpoint that was slow gets
+# tried again.
+_LATENCY_HALF_LIFE_S = 5.0
+
+
+class _Endpoint:
+    """An inference server of a LoadBalancedInferenceServerClient, with
+    the client connected to it and the latency observed on its requests.
+    """
+
+    def __init__(self, url, client):
+        self.url = url
+        self.client = client
+        self.ready = True
+        self._lock = threading.Lock()
+        self._latency_s = None
+        self._latency_time = None
+        self._request_count = 0
+
+    def latency(self):
+        with self._lock:
+            if self._latency_s is None:
+                return 0.0
+            idle_s = time.monotonic() - self._latency_time
+            return self._latency_s * 0.5**(idle_s / _LATENCY_HALF_LIFE_S)
+
+    def cost(self):
+        # The expected time for a new request to complete behind the
+        # requests in flight
+        return (self.client.get_outstanding_request_count() +
+                1) * self.latency()
+
+    def record_latency(self, latency_s):
+        with self._lock:
+            if self._latency_s is None:
+                self._latency_s = latency_s
+            else:
+                self._latency_s += _LATENCY_WEIGHT * (latency_s -
+                                                      self._latency_s)
+            self._latency_time = time.monotonic()
+            self._request_count += 1
+
+    def get_stats(self):
+        with self._lock:
+            request_count = self._request_count
+        return {
+            'ready': self.ready,
+            'outstanding_request_count':
+                self.client.get_outstanding_request_count(),
+            'latency_s': self.latency(),
+            'request_count': request_count
+        }
+
+
+class LoadBalancedInferenceServerClient:
+    """A LoadBalancedInferenceServerClient object distributes inference
+    requests over multiple inference servers, keeping a connection to
+    each of them. Each request goes to the better of two servers picked
+    at random, the one with the lower number of requests in flight
+    weighted by the latency observed on its recent requests. Requests
+    that are part of a sequence always go to the same server.
+
+    Servers that are not ready are not sent requests. The readiness of
+    each server is checked periodically by a background thread, and a
+    server that fails a request with an UNAVAILABLE status is taken out
+    until the next check finds it ready. The client can be shared by
+    multiple threads and must be closed with close(), which stops the
+    checks.
+
+    Parameters
+    ----------
+    urls : list
+        The inference server URLs, e.g. ['host0:8001', 'host1:8001'].
+        Unix domain socket URLs, e.g. 'unix:/tmp/trtserver.sock', are
+        accepted as well.
+
+    verbose : bool
+        If True generate verbose output. Default value is False.
+
+    max_outstanding_requests : int
+        The maximum number of inference requests that can be in flight
+        on each server at the same time. Default value is 0, which
+        places no limit.
+
+    health_check_interval_s : float
+        The time, in seconds, between checks of the readiness of the
+        servers. Default value is 1.0. A value of None disables the
+        checks, so that a server taken out is never used again.
+
+    hedging_policy : HedgingPolicy
+        The policy deciding when infer() sends a duplicate of a request
+        to a second server, see HedgingPolicy. Requests sent with
+        async_infer() and requests that are part of a sequence are never
+        hedged. Default value is None, which disables hedging.
+
+    max_message_size : int
+        The maximum size, in bytes, of the messages exchanged with each
+        server, see InferenceServerClient. Default value is None.
+
+    keepalive_options : KeepAliveOptions
+        The keepalive settings of the connection to each server. Default
+        value is None, which keeps the gRPC defaults.
+
+    channel_args : list
+        Additional (key, value) arguments of the gRPC channels. Default
+        value is None.
+
+    Raises
+    ------
+    Exception
+        If unable to create a client.
+
+    """
+
+    def __init__(self,
+                 urls,
+                 verbose=False,
+                 max_outstanding_requests=0,
+                 health_check_interval_s=1.0,
+                 hedging_policy=None,
+                 max_message_size=None,
+                 keepalive_options=None,
+                 channel_args=None):
+        self._closed = threading.Event()
+        self._health_check_thread = None
+        self._endpoints = []
+        if len(urls) == 0:
+            raise_error("at least one inference server URL is required")
+        self._endpoints = [
+            _Endpoint(
+                url,
+                InferenceServerClient(
+                    url,
+                    verbose=verbose,
+                    max_outstanding_requests=max_outstanding_requests,
+                    max_message_size=max_message_size,
+                    keepalive_options=keepalive_options,
+                    channel_args=channel_args))
+            for url in urls
+        ]
+        self._random = random.Random()
+        self._hedging_policy = hedging_policy
+        self._health_check_interval_s = health_check_interval_s
+        if health_check_interval_s is not None:
+            self._health_check_thread = threading.Thread(
+                target=self._check_health, daemon=True)
+            self._health_check_thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """Close the client and its connections to all the servers. Any
+        future calls to server will result in an Error.
+
+        """
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        if (self._health_check_thread is not None) and \
+           (self._health_check_thread is not threading.current_thread()):
+            self._health_check_thread.join()
+        for endpoint in self._endpoints:
+            endpoint.client.close()
+
+    def get_outstanding_request_count(self):
+        """Get the number of inference requests currently in flight on
+        all the servers.
+
+        Returns
+        -------
+        int
+            The number of inference requests that have been issued
+            but have not yet completed.
+
+        """
+        return sum(endpoint.client.get_outstanding_request_count()
+                   for endpoint in self._endpoints)
+
+    def get_endpoint_stats(self):
+        """Get the state of each of the servers as seen by the client.
+
+        Returns
+        -------
+        dict
+            Maps the URL of each server to a dict holding whether the
+            server is 'ready' to be sent requests, the
+            'outstanding_request_count' of the requests in flight on
+            the server, the 'latency_s' estimated from its recent
+            requests and the 'request_count' of its completed requests.
+
+        """
+        return {
+            endpoint.url: endpoint.get_stats() for endpoint in self._endpoints
+        }
+
+    def is_server_ready(self):
+        """Contact the inference servers and get readiness.
+
+        Returns
+        -------
+        bool
+            True if any of the servers is ready, False otherwise.
+
+        """
+        self._update_readiness()
+        return any(endpoint.ready for endpoint in self._endpoints)
+
+    def is_model_ready(self, model_name, model_version=""):
+        """Contact a ready inference server and get the readiness of
+        specified model. The servers are expected to serve the same
+        models.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model to check for readiness.
+
+        model_version: str
+            The version of the model to check for readiness. The default value
+            is an empty string which means then the server will choose a version
+            based on the model and internal policy.
+
+        Returns
+        -------
+        bool
+            True if the model is ready, False if not ready.
+
+        Raises
+        ------
+        InferenceServerException
+            If no server is ready or if unable to get model readiness.
+
+        """
+        return self._call(lambda client: client.is_model_ready(
+            model_name, model_version))
+
+    def get_model_metadata(self, model_name, model_version="", as_json=False):
+        """Contact a ready inference server and get the metadata for
+        specified model, see InferenceServerClient.get_model_metadata().
+
+        Raises
+        ------
+        InferenceServerException
+            If no server is ready or if unable to get model metadata.
+
+        """
+        return self._call(lambda client: client.get_model_metadata(
+            model_name, model_version, as_json))
+
+    def get_model_config(self, model_name, model_version="", as_json=False):
+        """Contact a ready inference server and get the configuration
+        for specified model, see InferenceServerClient.get_model_config().
+
+        Raises
+        ------
+        InferenceServerException
+            If no server is ready or if unable to get model configuration.
+
+        """
+        return self._call(lambda client: client.get_model_config(
+            model_name, model_version, as_json))
+
+    def infer(self,
+              inputs,
+              outputs,
+              model_name,
+              model_version="",
+              request_id=None,
+              sequence_id=0,
+              compression_algorithm=None):
+        """Run synchronous inference on one of the inference servers,
+        see InferenceServerClient.infer().
+
+        Returns
+        -------
+        InferResult
+            The object holding the result of the inference, including the
+            statistics.
+
+        Raises
+        ------
+        InferenceServerException
+            If no server is ready or if server fails to perform inference.
+        """
+        if (self._hedging_policy is not None) and (not sequence_id) and \
+           (len(self._endpoints) > 1):
+            compression = _get_compression(compression_algorithm)
+            request = _encode_inference_request(inputs, outputs, model_name,
+                                                model_version, request_id,
+                                                sequence_id)
+            return self._hedged_infer(request, compression, model_name)
+
+        endpoint = self._choose(sequence_id)
+        start = time.monotonic()
+        try:
+            result = endpoint.client.infer(inputs, outputs, model_name,
+                                           model_version, request_id,
+                                           sequence_id, compression_algorithm)
+        except InferenceServerException as ex:
+            self._handle_error(endpoint, ex.status())
+            raise
+        endpoint.record_latency(time.monotonic() - start)
+        return result
+
+    def async_infer(self,
+                    callback,
+                    inputs,
+                    outputs,
+                    model_name,
+                    model_version="",
+                    request_id=None,
+                    sequence_id=0,
+                    compression_algorithm=None):
+        """Run asynchronous inference on one of the inference servers,
+        see InferenceServerClient.async_infer().
+
+        Raises
+        ------
+        InferenceServerException
+            If no server is ready or if server fails to issue inference.
         """
+        compression = _get_compression(compression_algorithm)
+        request = _encode_inference_request(inputs, outputs, model_name,
+                                            model_version, request_id,
+                                            sequence_id)
+        endpoint = self._choose(sequence_id)
+        start = time.monotonic()
+
+        def wrapped_callback(call_future):
+            # A failed call takes its server out in the same way as a
+            # failed infer()
+            try:
+                response = call_future.result()
+            except grpc.RpcError as rpc_error:
+                self._handle_error(endpoint, str(rpc_error.code()))
+                raise_error_grpc(rpc_error)
+            endpoint.record_latency(time.monotonic() - start)
+            callback(result=InferResult(response))
+
+        try:
+            call_future = endpoint.client._start_infer(request, compression)
+        except InferenceServerException as ex:
+            self._handle_error(endpoint, ex.status())
+            raise
+        call_future.add_done_callback(wrapped_callback)
+
+    def _hedged_infer(self, request, compression, model_name):
+        policy = self._hedging_policy
+        delay_s = policy._start_request(model_name)
+
+        call = _HedgedCall(request, compression)
+        primary = self._choose()
+        call.start(primary)
+        if (delay_s is not None) and (not call.wait(delay_s)) and \
+           any(endpoint.ready and (endpoint is not primary)
+               for endpoint in self._endpoints) and \
+           policy._acquire_hedge(model_name):
+            # The readiness of the servers may have changed since the
+            # check and the hedge does not wait for a full client, in
+            # either case the primary attempt is left to complete.
+            try:
+                call.start(self._choose(exclude=primary), block=False)
+            except InferenceServerException:
+                policy._release_hedge(model_name)
+        call.wait()
+
+        with call._cv:
+            attempts = list(call._attempts)
+            success = call._success
+            failures = list(call._failures)
+
+        # The attempts that are still running lost and are cancelled, a
+        # loser is known to be at least as slow as the time it has taken.
+        now = time.monotonic()
+        for endpoint, call_future, start in attempts:
+            if not call_future.done():
+                call_future.cancel()
+                endpoint.record_latency(now - start)
+        for index, rpc_error in failures:
+            self._handle_error(attempts[index][0], str(rpc_error.code()))
+
+        if success is None:
+            raise_error_grpc(failures[0][1])
+        index, response, latency_s = success
+        attempts[index][0].record_latency(latency_s)
+        policy._record(model_name, latency_s, index > 0)
+        return InferResult(response)
+
+    def _choose(self, sequence_id=0, exclude=None):
+        if sequence_id:
+            # The state of a sequence is held by the server that runs it
+            return self._endpoints[sequence_id % len(self._endpoints)]
+
+        ready = [
+            endpoint for endpoint in self._endpoints
+            if endpoint.ready and (endpoint is not exclude)
+        ]
+        if len(ready) == 0:
+            raise_error("no inference server is ready")
+        if len(ready) == 1:
+            return ready[0]
+        first, second = self._random.sample(ready, 2)
+        return first if first.cost() <= second.cost() else second
+
+    def _call(self, fn):
+        endpoint = self._choose()
+        try:
+            return fn(endpoint.client)
+        except InferenceServerException as ex:
+            self._handle_error(endpoint, ex.status())
+            raise
+
+    def _handle_error(self, endpoint, status):
+        if status == str(grpc.StatusCode.UNAVAILABLE):
+            endpoint.ready = False
+
+    def _update_readiness(self):
+        for endpoint in self._endpoints:
+            try:
+                endpoint.ready = endpoint.client.is_server_ready()
+            except InferenceServerException:
+                endpoint.ready = False
+
+    def _check_health(self):
+        while not self._closed.is_set():
+            self._update_readiness()
+            self._closed.wait(self._health_check_interval_s)
+
+
+class _InferStream:
+    """Sends the requests of a ModelStreamInfer call from a queue and
+    delivers each of the responses to 'callback' from a handler thread.
+    """
+
+    def __init__(self, callback):
+        self._callback = callback
+        self._request_queue = queue.Queue()
+        self._handler = None
+        self._error = None
+        # The first exception raised by the callback
+        self._callback_error = None
+
+    def _request_iterator(self):
+        # Feeds the stream until the sentinel enqueued by _close().
+        while True:
+            request = self._request_queue.get()
+            if request is None:
+                return
+            yield request
+
+    def _start(self, response_iterator):
+        self._response_iterator = response_iterator
+        self._handler = threading.Thread(target=self._process_responses,
+                                         daemon=True)
+        self._handler.start()
+
+    def _enqueue_request(self, request):
+        if self._error is not None:
+            raise self._error
+        self._request_queue.put(request)
+
+    def _close(self):
+        self._request_queue.put(None)
+        if self._handler is not None:
+            self._handler.join()
+            self._handler = None
+
+    def _deliver(self, result, error):
+        # A failing callback must not stop the handler, which would
+        # leave the later responses undelivered.
+        try:
+            self._callback(result=result, error=error)
+        except Exception as ex:
+            if self._callback_error is None:
+                self._callback_error = ex
+
+    def _process_responses(self):
+        try:
+            for response in self._response_iterator:
+                if response.error_message != "":
+                    error = InferenceServerException(
+                        msg=response.error_message)
+                    self._deliver(None, error)
+                else:
+                    result = InferResult(response.infer_response)
+                    self._deliver(result, None)
+        except grpc.RpcError as rpc_error:
+            # The stream is broken so no further responses can be
+            # received, report the failure once and reject any further
+            # requests on the stream.
+            self._error = InferenceServerException(
+                msg=rpc_error.details(),
+                status=str(rpc_error.code()),
+                debug_details=rpc_error.debug_error_string())
+            self._deliver(None, self._error)
+
+
+# The method that _EncodedInferRequest messages are sent to
+_MODEL_INFER_METHOD = '/nvidia.inferenceserver.GRPCInferenceService/ModelInfer'
+
+
+def _encode_varint(value):
+    """Returns the protobuf varint encoding of 'value'. Negative values
+    are encoded as their 64-bit two's complement, as for int64 fields.
+    """
+    value &= 0xFFFFFFFFFFFFFFFF
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _encode_field_prefix(field_number, length):
+    """Returns the tag and length that precede a length-delimited field
+    of 'length' bytes. Only field numbers below 16, which have a single
+    byte tag, are supported.
+    """
+    return bytes(((field_number << 3) | 2,)) + _encode_varint(length)
+
+
+def _encode_string_field(field_number, value):
+    """Returns the encoding of a string field, or an empty bytes object
+    for an empty string, which protobuf leaves out.
+    """
+    if not value:
+        return b''
+    value = value.encode('utf-8')
+    return _encode_field_prefix(field_number, len(value)) + value
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_model_header(model_name, model_version):
+    """Returns the encoding of the model_name and model_version fields of
+    a ModelInferRequest.
+    """
+    return _encode_string_field(1, model_name) + _encode_string_field(
+        2, model_version)
+
+
+@functools.lru_cache(maxsize=1024)
+def _encode_input_header(name, datatype, shape):
+    """Returns the encoding of the name, datatype and shape fields of an
+    InferInputTensor, where 'shape' is a tuple.
+    """
+    header = _encode_string_field(1, name) + _encode_string_field(2, datatype)
+    if len(shape) != 0:
+        packed_shape = b''.join(_encode_varint(dim) for dim in shape)
+        header += _encode_field_prefix(3, len(packed_shape)) + packed_shape
+    return header
+
+
+class _EncodedInferRequest:
+    """A ModelInferRequest in the protobuf wire format, held as a list of
+    encoded fields and the tensor buffers that follow their prefixes. The
+    buffers are only copied when the request is serialized, and then
+    directly into the message sent by gRPC.
+    """
+
+    def __init__(self, parts):
+        self._parts = parts
 
-        self._request = grpc_service_v2_pb2.ModelInferRequest()
-        self._request.model_name = model_name
-        self._request.model_version = model_version
+    def SerializeToString(self):
+        return b''.join(self._parts)
+
+    def ByteSize(self):
+        return sum(memoryview(part).nbytes for part in self._parts)
+
+    def _digest(self):
+        """Returns a digest of the request, for use as a cache key."""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in self._parts:
+            digest.update(part)
+        return digest.digest()
+
+    def _set_id(self, request_id):
+        # The order of the fields in a message does not matter, so the
+        # ID can follow the tensors.
         if request_id != None:
-            self._request.id = request_id
-        if sequence_id != None:
-            self._request.sequence_id = sequence_id
-        for infer_input in inputs:
-            self._request.inputs.extend([infer_input._get_tensor()])
-        for infer_output in outputs:
-            self._request.outputs.extend([infer_output._get_tensor()])
+            self._parts.append(_encode_string_field(3, request_id))
+
+
+def _encode_inference_request(inputs, outputs, model_name, model_version,
+                              request_id, sequence_id):
+    """Creates an inference request in the wire format. The arguments are
+    those of _get_inference_request(), the request is equivalent to the
+    ModelInferRequest message returned by it.
+
+    Returns
+    -------
+    _EncodedInferRequest
+        The encoded request. It references the data of the inputs
+        rather than holding a copy of it.
+    """
+    parts = [_encode_model_header(model_name, model_version)]
+    for infer_input in inputs:
+        parts.extend(infer_input._get_encoded())
+    for infer_output in outputs:
+        parts.append(infer_output._get_encoded())
+    if sequence_id:
+        parts.append(b'\x38' + _encode_varint(sequence_id))
+    request = _EncodedInferRequest(parts)
+    request._set_id(request_id)
+    return request
+
+
+def _decode_varint(buffer, pos, end):
+    """Returns the varint at 'pos' in 'buffer', which must end before
+    'end', and the position after it.
+    """
+    value = 0
+    shift = 0
+    while pos < end:
+        byte = buffer[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+    raise_error("truncated inference response")
+
+
+def _decode_fields(buffer, start, end):
+    """Yields the (field number, wire type, value) of each field of the
+    message in buffer[start:end]. The value of a varint field is its
+    integer value, that of any other field is the (start, end) of its
+    payload.
+    """
+    pos = start
+    while pos < end:
+        key, pos = _decode_varint(buffer, pos, end)
+        wire_type = key & 0x7
+        if wire_type == 0:
+            value, pos = _decode_varint(buffer, pos, end)
+            yield key >> 3, wire_type, value
+            continue
+
+        if wire_type == 2:
+            length, pos = _decode_varint(buffer, pos, end)
+        elif wire_type == 1:
+            length = 8
+        elif wire_type == 5:
+            length = 4
+        else:
+            raise_error("unsupported wire type " + str(wire_type) +
+                        " in inference response")
+        if pos + length > end:
+            raise_error("truncated inference response")
+        yield key >> 3, wire_type, (pos, pos + length)
+        pos += length
+
+
+def _to_int64(value):
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def _encode_varints(values, value_bits=64):
+    """Returns the concatenated varint encodings of the uint64 array
+    'values', as an array of type uint8, and the length of each encoding.
+    The values are the 64-bit two's complement of signed values of
+    'value_bits' bits.
+    """
+    lengths = np.searchsorted(_VARINT_LIMITS, values, side='right') + 1
+    max_length = int(lengths.max()) if values.size else 1
+
+    # One row of 7-bit groups per position, every group but the last of
+    # a value has the continuation bit set and the groups past the
+    # length of a value are dropped.
+    groups = np.empty((max_length, values.size), dtype=np.uint8)
+    remaining = values.copy()
+    for k in range(max_length):
+        if 7 * k >= value_bits:
+            # Only negative values are this long and the rest of their
+            # groups are all ones.
+            groups[k:-1] = 0xFF
+            groups[-1] = 0x01
+            break
+        np.bitwise_and(remaining,
+                       np.uint64(0x7F),
+                       out=groups[k],
+                       casting='unsafe')
+        if k + 1 < max_length:
+            groups[k] |= (lengths > k + 1).view(np.uint8) << np.uint8(7)
+            remaining >>= np.uint64(7)
+    if max_length == 1:
+        return groups.reshape(-1), lengths
+    return groups.T[np.arange(max_length) < lengths[:, None]], lengths
+
+
+# The smallest value that needs each varint length past one byte
+_VARINT_LIMITS = np.left_shift(np.uint64(1),
+                               np.arange(7, 64, 7, dtype=np.uint64))
+
+
+# The InferTensorContents field that holds the typed contents of each
+# datatype. FP16 has no typed field.
+_TYPED_CONTENTS_FIELDS = {
+    'BOOL': 2,
+    'INT8': 3,
+    'INT16': 3,
+    'INT32': 3,
+    'INT64': 4,
+    'UINT8': 5,
+    'UINT16': 5,
+    'UINT32': 5,
+    'UINT64': 6,
+    'FP32': 7,
+    'FP64': 8,
+    'BYTES': 9
+}
+
+# The wire representation of the fixed-size typed fields, every other
+# numeric field holds varints.
+_FIXED_CONTENTS_DTYPES = {7: np.dtype('<f4'), 8: np.dtype('<f8')}
+
+_CONTENTS_FIELD_NAMES = {
+    field.number: field.name for field in
+    grpc_service_v2_pb2.InferTensorContents.DESCRIPTOR.fields
+}
+
+
+def _ranges(starts, lengths):
+    """Returns the concatenated indices of the ranges of 'lengths' indices
+    beginning at 'starts'.
+    """
+    total = int(lengths.sum())
+    return np.arange(total) + np.repeat(starts - (np.cumsum(lengths) - lengths),
+                                        lengths)
+
+
+def _encode_byte_contents(serialized):
+    """Returns the byte_contents fields holding the elements of the
+    serialized bytes tensor 'serialized', see serialize_byte_tensor(),
+    as an array of type uint8.
+    """
+    data, offsets = deserialize_bytes_tensor_offsets(serialized)
+    element_starts = offsets[:-1]
+    lengths = offsets[1:] - element_starts - 4
+    varints, varint_lengths = _encode_varints(lengths.astype(np.uint64))
+
+    # Each element is preceded by the tag and varint length of its field
+    # instead of its 4-byte length.
+    header_lengths = 1 + varint_lengths
+    field_lengths = header_lengths + lengths
+    field_starts = np.cumsum(field_lengths) - field_lengths
+    encoded = np.empty(int(field_lengths.sum()), dtype=np.uint8)
+    encoded[field_starts] = (9 << 3) | 2
+    encoded[_ranges(field_starts + 1, varint_lengths)] = varints
+    is_data = np.ones(encoded.size, dtype=np.bool_)
+    is_data[_ranges(field_starts, header_lengths)] = False
+    is_element = np.ones(data.size, dtype=np.bool_)
+    is_element[_ranges(element_starts, np.full(lengths.size, 4))] = False
+    encoded[is_data] = data[is_element]
+    return encoded
+
+
+def _encode_typed_contents(input_tensor, datatype):
+    """Returns the InferTensorContents that holds 'input_tensor' in the
+    typed field for 'datatype'.
+    """
+    field_number = _TYPED_CONTENTS_FIELDS.get(datatype)
+    if field_number is None:
+        raise_error("datatype " + str(datatype) +
+                    " has no typed contents, it must be sent as binary data")
+    if field_number == 9:
+        return _encode_byte_contents(
+            serialize_byte_tensor(input_tensor)).tobytes()
+
+    values = input_tensor.ravel()
+    if field_number in _FIXED_CONTENTS_DTYPES:
+        packed = values.astype(_FIXED_CONTENTS_DTYPES[field_number]).view(
+            np.uint8)
+    elif values.dtype.kind == 'i':
+        # Negative values are encoded as their 64-bit two's complement
+        packed, _ = _encode_varints(values.astype(np.int64).view(np.uint64),
+                                    8 * values.dtype.itemsize)
+    else:
+        packed, _ = _encode_varints(values.astype(np.uint64))
+    if packed.size == 0:
+        return b''
+    return _encode_field_prefix(field_number, packed.size) + packed.tobytes()
+
+
+def _decode_message_contents(buffer, ranges, datatype, field_number):
+    """Returns the 1-D array of the values of the InferTensorContents in
+    'buffer' at 'ranges' whose typed field is 'field_number', see
+    _decode_contents(). The message is parsed by protobuf.
+    """
+    contents = grpc_service_v2_pb2.InferTensorContents()
+    for start, end in ranges:
+        contents.MergeFromString(bytes(buffer[start:end]))
+    if len(contents.raw_contents) != 0:
+        if datatype == 'BYTES':
+            return deserialize_bytes_tensor(contents.raw_contents)
+        return np.frombuffer(contents.raw_contents,
+                             dtype=triton_to_np_dtype(datatype))
+
+    values = getattr(contents, _CONTENTS_FIELD_NAMES[field_number])
+    if field_number == 9:
+        np_array = np.empty(len(values), dtype=np.object_)
+        np_array[:] = values
+        return np_array
+    return np.array(values, dtype=triton_to_np_dtype(datatype))
+
+
+def _decode_contents(buffer, ranges, datatype):
+    """Returns the 1-D array of the values of the InferTensorContents in
+    'buffer' at each of the (start, end) 'ranges', which protobuf would
+    merge into one message. Raw contents are returned as a view of
+    'buffer' and the fixed-size typed contents are read in place.
+    """
+    np_dtype = triton_to_np_dtype(datatype)
+    field_number = _TYPED_CONTENTS_FIELDS.get(datatype)
+    raw_contents = None
+    chunks = []
+    for start, end in ranges:
+        for number, wire_type, value in _decode_fields(buffer, start, end):
+            if number == 1:
+                raw_contents = value
+            elif number == field_number:
+                if field_number not in _FIXED_CONTENTS_DTYPES:
+                    # Varints and bytes are located one element at a
+                    # time, which protobuf's parser does much faster.
+                    return _decode_message_contents(buffer, ranges,
+                                                    datatype, field_number)
+                chunks.append((wire_type, value))
+
+    if (raw_contents is not None) and (raw_contents[1] > raw_contents[0]):
+        raw_contents = buffer[raw_contents[0]:raw_contents[1]]
+        if datatype == 'BYTES':
+            # String results contain a 4-byte string length
+            # followed by the actual string characters. Hence,
+            # need to decode the raw bytes to convert into
+            # array elements.
+            return deserialize_bytes_tensor(raw_contents)
+        return np.frombuffer(raw_contents, dtype=np_dtype)
+
+    # Packed or not, the payload of each chunk is a run of fixed-size
+    # values.
+    arrays = [
+        np.frombuffer(buffer,
+                      dtype=_FIXED_CONTENTS_DTYPES[field_number],
+                      count=(end - start) //
+                      _FIXED_CONTENTS_DTYPES[field_number].itemsize,
+                      offset=start) for _, (start, end) in chunks
+    ]
+    if len(arrays) == 0:
+        return np.empty(0, dtype=np_dtype)
+    values = np.concatenate(arrays) if len(arrays) > 1 else arrays[0]
+    return values.astype(np_dtype, copy=False)
+
+
+class _EncodedOutput:
+    """The location of an InferOutputTensor in the buffer of an
+    _EncodedInferResponse.
+    """
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        self.name = ''
+        self.datatype = ''
+        self.shape = []
+        # The (start, end) of each contents field, there is normally
+        # only one.
+        self.contents = []
+
+
+class _EncodedInferResponse:
+    """A ModelInferResponse in the protobuf wire format, as received from
+    the server. The outputs are located with a single scan over the
+    message and their contents are left in place, the message is only
+    parsed by protobuf when it is asked for.
+
+    Parameters
+    ----------
+    buffer : bytes
+        The serialized ModelInferResponse.
+    """
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        self._message = None
+
+    def ByteSize(self):
+        return len(self._buffer)
+
+    def _get_message(self):
+        """Returns the ModelInferResponse message."""
+        if self._message is None:
+            self._message = grpc_service_v2_pb2.ModelInferResponse.FromString(
+                self._buffer)
+        return self._message
+
+    def _get_outputs(self):
+        """Returns a dict from the name of each output to its
+        _EncodedOutput.
+        """
+        buffer = memoryview(self._buffer)
+        outputs = {}
+        for field_number, wire_type, value in _decode_fields(
+                buffer, 0, len(buffer)):
+            if (field_number == 7) and (wire_type == 2):
+                output = self._decode_output(buffer, *value)
+                outputs[output.name] = output
+        return outputs
+
+    def _decode_output(self, buffer, start, end):
+        output = _EncodedOutput(buffer)
+        for field_number, wire_type, value in _decode_fields(
+                buffer, start, end):
+            if wire_type == 2:
+                field_start, field_end = value
+                if field_number == 1:
+                    output.name = str(buffer[field_start:field_end], 'utf-8')
+                elif field_number == 2:
+                    output.datatype = str(buffer[field_start:field_end],
+                                          'utf-8')
+                elif field_number == 3:
+                    # Packed shape
+                    pos = field_start
+                    while pos < field_end:
+                        dim, pos = _decode_varint(buffer, pos, field_end)
+                        output.shape.append(_to_int64(dim))
+                elif field_number == 4:
+                    output.contents.append(value)
+            elif (field_number == 3) and (wire_type == 0):
+                output.shape.append(_to_int64(value))
+        return output
+
+
+def _get_inference_request(inputs, outputs, model_name, model_version,
+                           request_id, sequence_id):
+    """Creates and initializes an inference request.
+
+    Parameters
+    ----------
+    inputs : list
+        A list of InferInput objects, each describing data for a input
+        tensor required by the model.
+    outputs : list
+        A list of InferOutput objects, each describing how the output
+        data must be returned. Only the output tensors present in the
+        list will be requested from the server.
+    model_name: str
+        The name of the model to run inference.
+    model_version: str
+        The version of the model to run inference. The default value
+        is an empty string which means then the server will choose
+        a version based on the model and internal policy.
+    request_id: str
+        Optional identifier for the request. If specified will be returned
+        in the response. Default value is 'None' which means no request_id
+        will be used.
+    sequence_id : int
+        The sequence ID of the inference request. Default is 0, which
+        indicates that the request is not part of a sequence. The
+        sequence ID is used to indicate that two or more inference
+        requests are in the same sequence.
+
+    Returns
+    -------
+    protobuf message
+        The new ModelInferRequest message.
+    """
+
+    request = grpc_service_v2_pb2.ModelInferRequest()
+    request.model_name = model_name
+    request.model_version = model_version
+    if request_id != None:
+        request.id = request_id
+    if sequence_id != None:
+        request.sequence_id = sequence_id
+    for infer_input in inputs:
+        request.inputs.extend([infer_input._get_tensor()])
+    for infer_output in outputs:
+        request.outputs.extend([infer_output._get_tensor()])
+    return request
 
 
 class InferInput:
@@ -485,6 +1962,10 @@ class InferInput:
     def __init__(self, name):
         self._input = grpc_service_v2_pb2.ModelInferRequest().InferInputTensor()
         self._input.name = name
+        # The serialized InferTensorContents as a list of buffers, the
+        # contents of '_input' are only set when a protobuf message is
+        # needed.
+        self._contents = None
 
     def name(self):
         """Get the name of input associated with this object.
@@ -516,25 +1997,41 @@ class InferInput:
         """
         return self._input.shape
 
-    def set_data_from_numpy(self, input_tensor):
+    def set_data_from_numpy(self, input_tensor, binary_data=True):
         """Set the tensor data (datatype, shape, contents) from the
         specified numpy array for input associated with this object.
+        For binary data a C-contiguous array is not copied but
+        referenced until the request is sent, so it must not be
+        modified before then.
 
         Parameters
         ----------
         input_tensor : numpy array
             The tensor data in numpy array format
+        binary_data : bool
+            If True the tensor data is sent as raw_contents, otherwise
+            it is sent in the typed contents field for its datatype,
+            e.g. int_contents for INT32. FP16 data can only be sent as
+            binary data. Default value is True.
         """
         if not isinstance(input_tensor, (np.ndarray,)):
             raise_error("input_tensor must be a numpy array")
         self._input.datatype = np_to_triton_dtype(input_tensor.dtype)
         self._input.ClearField('shape')
         self._input.shape.extend(input_tensor.shape)
+        self._input.ClearField('contents')
+        if not binary_data:
+            self._contents = [
+                _encode_typed_contents(input_tensor, self._input.datatype)
+            ]
+            return
+
         if self._input.datatype == "BYTES":
-            self._input.contents.raw_contents = serialize_byte_tensor(
-                input_tensor).tobytes()
+            data = serialize_byte_tensor(input_tensor)
         else:
-            self._input.contents.raw_contents = input_tensor.tobytes()
+            data = np.ascontiguousarray(input_tensor).reshape(-1).view(
+                np.uint8)
+        self._contents = [_encode_field_prefix(1, data.nbytes), data]
 
     # FIXMEPV2: Add parameter support
     def parameters(self):
@@ -547,8 +2044,32 @@ class InferInput:
         protobuf message 
             The underlying InferInputTensor protobuf message.
         """
+        if (self._contents is not None) and (not self._input.HasField('contents')):
+            self._input.contents.ParseFromString(b''.join(self._contents))
         return self._input
 
+    def _get_encoded(self):
+        """Retrieve the encoding of the input as the 'inputs' field of a
+        ModelInferRequest.
+        Returns
+        -------
+        list
+            The encoded fields followed by the contents. Binary data is
+            a view of the data rather than a copy.
+        """
+        header = _encode_input_header(self._input.name, self._input.datatype,
+                                      tuple(self._input.shape))
+        if self._contents is None:
+            return [_encode_field_prefix(5, len(header)) + header]
+
+        contents_size = sum(
+            memoryview(part).nbytes for part in self._contents)
+        contents_prefix = _encode_field_prefix(5, contents_size)
+        tensor_size = len(header) + len(contents_prefix) + contents_size
+        return [
+            _encode_field_prefix(5, tensor_size) + header + contents_prefix
+        ] + self._contents
+
 
 class InferOutput:
     """An object of InferOutput class is used to describe a
@@ -564,6 +2085,7 @@ class InferOutput:
         self._output = grpc_service_v2_pb2.ModelInferRequest(
         ).InferRequestedOutputTensor()
         self._output.name = name
+        self._encoded = None
 
     def name(self):
         """Get the name of output associated with this object.
@@ -590,6 +2112,7 @@ class InferOutput:
             raise_error(
                 "only string data type for key is supported in parameters")
 
+        self._encoded = None
         param = self._output.parameters[key]
         if type(value) is int:
             param.int64_param = value
@@ -609,6 +2132,19 @@ class InferOutput:
         """
         return self._output
 
+    def _get_encoded(self):
+        """Retrieve the encoding of the output as the 'outputs' field of
+        a ModelInferRequest.
+        Returns
+        -------
+        bytes
+            The encoded field.
+        """
+        if self._encoded is None:
+            output = self._output.SerializeToString(deterministic=True)
+            self._encoded = _encode_field_prefix(6, len(output)) + output
+        return self._encoded
+
 
 class InferResult:
     """An object of InferResult class holds the response of
@@ -618,15 +2154,30 @@ class InferResult:
     Parameters
     ----------
     result : protobuf message
-        The ModelInferResponse returned by the server
+        The ModelInferResponse returned by the server, either as a
+        protobuf message or as the _EncodedInferResponse received by
+        infer() and async_infer().
     """
 
     def __init__(self, result):
         self._result = result
+        self._output_index = None
+        self._output_arrays = {}
+
+    def _get_message(self):
+        if isinstance(self._result, _EncodedInferResponse):
+            return self._result._get_message()
+        return self._result
 
     def as_numpy(self, name):
         """Get the tensor data for output associated with this object
-        in numpy format
+        in numpy format. The output is decoded on the first call and
+        the same read-only array is returned by later calls. For raw
+        contents the array is a view of the contents, no further copy
+        is made to decode or reshape it. Typed contents are decoded
+        from their packed wire format. The outputs of a response
+        received by infer() or async_infer() are views of the received
+        message, and outputs that are never retrieved are not decoded.
 
         Parameters
         ----------
@@ -639,30 +2190,35 @@ class InferResult:
             The numpy array containing the response data for the tensor or
             None if the data for specified tensor name is not found.
         """
-        for output in self._result.outputs:
-            if output.name == name:
-                shape = []
-                for value in output.shape:
-                    shape.append(value)
-
-                datatype = output.datatype
-                if len(output.contents.raw_contents) != 0:
-                    if datatype == 'BYTES':
-                        # String results contain a 4-byte string length
-                        # followed by the actual string characters. Hence,
-                        # need to decode the raw bytes to convert into
-                        # array elements.
-                        np_array = deserialize_bytes_tensor(
-                            output.contents.raw_contents)
-                    else:
-                        np_array = np.frombuffer(
-                            output.contents.raw_contents,
-                            dtype=triton_to_np_dtype(datatype))
-                elif len(output.contents.byte_contents) != 0:
-                    np_array = np.array(output.contents.byte_contents)
-                np_array = np.resize(np_array, shape)
-                return np_array
-        return None
+        np_array = self._output_arrays.get(name)
+        if np_array is not None:
+            return np_array
+
+        if self._output_index is None:
+            if isinstance(self._result, _EncodedInferResponse):
+                self._output_index = self._result._get_outputs()
+            else:
+                self._output_index = {
+                    output.name: output for output in self._result.outputs
+                }
+        output = self._output_index.get(name)
+        if output is None:
+            return None
+
+        if isinstance(output, _EncodedOutput):
+            buffer = output._buffer
+            ranges = output.contents
+        else:
+            # The contents are decoded from their wire format, which
+            # needs a single copy for any of the content fields.
+            buffer = memoryview(output.contents.SerializeToString())
+            ranges = [(0, len(buffer))]
+        np_array = _decode_contents(buffer, ranges, output.datatype)
+        np_array = np_array.reshape(tuple(output.shape))
+        np_array.flags.writeable = False
+
+        self._output_arrays[name] = np_array
+        return np_array
 
     def get_request(self, as_json=False):
         """Retrieves the ModelInferRequest for the request associated
@@ -681,9 +2237,9 @@ class InferResult:
             associated  with this response.
         """
         if as_json:
-            return json.loads(MessageToJson(self._result.request))
+            return json.loads(MessageToJson(self._get_message().request))
         else:
-            return self._result.request
+            return self._get_message().request
 
     def get_statistics(self, as_json=False):
         """Retrieves the InferStatistics for this response as
@@ -701,9 +2257,9 @@ class InferResult:
             The InferStatistics protobuf message or dict for this response.
         """
         if as_json:
-            return json.loads(MessageToJson(self._result.statistics))
+            return json.loads(MessageToJson(self._get_message().statistics))
         else:
-            return self._result.statistics
+            return self._get_message().statistics
 
     def get_response(self, as_json=False):
         """Retrieves the complete ModelInferResponse as a
@@ -721,6 +2277,6 @@ class InferResult:
             The underlying ModelInferResponse as a protobuf message or dict.
         """
         if as_json:
-            return json.loads(MessageToJson(self._result))
+            return json.loads(MessageToJson(self._get_message()))
         else:
-            return self._result
+            return self._get_message()
@@ -0,0 +1,418 @@
+# Copyright (c) 2020, NVIDIA CORPORATION. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#  * Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+#  * Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+#  * Neither the name of NVIDIA CORPORATION nor the names of its
+#    contributors may be used to endorse or promote products derived
+#    from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS ``AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED.  IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import rapidjson as json
+from google.protobuf.json_format import MessageToJson
+
+try:
+    from grpc import aio
+except ImportError:
+    from grpc.experimental import aio
+
+from tritongrpcclient import grpc_service_v2_pb2
+from tritongrpcclient import grpc_service_v2_pb2_grpc
+from tritongrpcclient.core import InferInput, InferOutput, InferResult
+from tritongrpcclient.core import raise_error_grpc, _get_inference_request
+from tritongrpcclient.core import _encode_inference_request, _EncodedInferRequest
+from tritongrpcclient.core import _EncodedInferResponse
+from tritongrpcclient.core import _MODEL_INFER_METHOD
+from tritongrpcclient.core import _get_channel_options, _get_compression
+from tritongrpcclient.utils import *
+
+
+class AsyncInferenceServerClient:
+    """An AsyncInferenceServerClient object is used to perform any kind
+    of communication with the InferenceServer using gRPC protocol from
+    an asyncio event loop. All the calls to the server are coroutines,
+    and any number of them can be in flight at the same time on a
+    single client.
+
+    The client must be created and used from within the event loop
+    that runs its coroutines.
+
+    Parameters
+    ----------
+    url : str
+        The inference server URL, e.g. 'localhost:8001' or, for a
+        unix domain socket, 'unix:/tmp/trtserver.sock'.
+
+    verbose : bool
+        If True generate verbose output. Default value is False.
+
+    max_message_size : int
+        The maximum size, in bytes, of the messages sent to and received
+        from the server, see InferenceServerClient. Default value is
+        None, which keeps the gRPC limits.
+
+    keepalive_options : KeepAliveOptions
+        The keepalive settings of the connection. Default value is None,
+        which keeps the gRPC defaults.
+
+    channel_args : list
+        Additional (key, value) arguments of the gRPC channel. Default
+        value is None.
+
+    Raises
+    ------
+    Exception
+        If unable to create a client.
+
+    """
+
+    def __init__(self,
+                 url,
+                 verbose=False,
+                 max_message_size=None,
+                 keepalive_options=None,
+                 channel_args=None):
+        self._channel = aio.insecure_channel(
+            url,
+            options=_get_channel_options(max_message_size, keepalive_options,
+                                         channel_args))
+        self._client_stub = grpc_service_v2_pb2_grpc.GRPCInferenceServiceStub(
+            self._channel)
+        self._model_infer = self._channel.unary_unary(
+            _MODEL_INFER_METHOD,
+            request_serializer=_EncodedInferRequest.SerializeToString,
+            response_deserializer=_EncodedInferResponse)
+        self._verbose = verbose
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Close the client. Any in-flight calls are cancelled and any
+        future calls to server will result in an Error.
+
+        """
+        await self._channel.close()
+
+    async def is_server_live(self):
+        """Contact the inference server and get liveness.
+
+        Returns
+        -------
+        bool
+            True if server is live, False if server is not live.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get liveness.
+
+        """
+        try:
+            request = grpc_service_v2_pb2.ServerLiveRequest()
+            response = await self._client_stub.ServerLive(request)
+            return response.live
+        except aio.AioRpcError as rpc_error:
+            raise_error_grpc(rpc_error)
+
+    async def is_server_ready(self):
+        """Contact the inference server and get readiness.
+
+        Returns
+        -------
+        bool
+            True if server is ready, False if server is not ready.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get readiness.
+
+        """
+        try:
+            request = grpc_service_v2_pb2.ServerReadyRequest()
+            response = await self._client_stub.ServerReady(request)
+            return response.ready
+        except aio.AioRpcError as rpc_error:
+            raise_error_grpc(rpc_error)
+
+    async def is_model_ready(self, model_name, model_version=""):
+        """Contact the inference server and get the readiness of specified model.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model to check for readiness.
+
+        model_version: str
+            The version of the model to check for readiness. The default value
+            is an empty string which means then the server will choose a version
+            based on the model and internal policy.
+
+        Returns
+        -------
+        bool
+            True if the model is ready, False if not ready.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get model readiness.
+
+        """
+        try:
+            request = grpc_service_v2_pb2.ModelReadyRequest(
+                name=model_name,
+                version=model_version)
+            response = await self._client_stub.ModelReady(request)
+            return response.ready
+        except aio.AioRpcError as rpc_error:
+            raise_error_grpc(rpc_error)
+
+    async def get_server_metadata(self, as_json=False):
+        """Contact the inference server and get its metadata.
+
+        Parameters
+        ----------
+        as_json : bool
+            If True then returns server metadata as a json dict,
+            otherwise as a protobuf message. Default value is False.
+
+        Returns
+        -------
+        dict or protobuf message
+            The JSON dict or ServerMetadataResponse message
+            holding the metadata.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get server metadata.
+
+        """
+        try:
+            request = grpc_service_v2_pb2.ServerMetadataRequest()
+            response = await self._client_stub.ServerMetadata(request)
+            if as_json:
+                return json.loads(MessageToJson(response))
+            else:
+                return response
+        except aio.AioRpcError as rpc_error:
+            raise_error_grpc(rpc_error)
+
+    async def get_model_metadata(self,
+                                 model_name,
+                                 model_version="",
+                                 as_json=False):
+        """Contact the inference server and get the metadata for specified model.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model
+        model_version: str
+            The version of the model to get metadata. The default value
+            is an empty string which means then the server will choose
+            a version based on the model and internal policy.
+        as_json : bool
+            If True then returns model metadata as a json dict, otherwise
+            as a protobuf message. Default value is False.
+
+        Returns
+        -------
+        dict or protobuf message 
+            The JSON dict or ModelMetadataResponse message holding
+            the metadata.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get model metadata.
+
+        """
+        try:
+            request = grpc_service_v2_pb2.ModelMetadataRequest(
+                name=model_name,
+                version=model_version)
+            response = await self._client_stub.ModelMetadata(request)
+            if as_json:
+                return json.loads(MessageToJson(response))
+            else:
+                return response
+        except aio.AioRpcError as rpc_error:
+            raise_error_grpc(rpc_error)
+
+    async def get_model_config(self,
+                               model_name,
+                               model_version="",
+                               as_json=False):
+        """Contact the inference server and get the configuration for specified model.
+
+        Parameters
+        ----------
+        model_name: str
+            The name of the model
+        model_version: str
+            The version of the model to get configuration. The default value
+            is an empty string which means then the server will choose
+            a version based on the model and internal policy.
+        as_json : bool
+            If True then returns configuration as a json dict, otherwise
+            as a protobuf message. Default value is False.
+
+        Returns
+        -------
+        dict or protobuf message 
+            The JSON dict or ModelConfigResponse message holding
+            the metadata.
+
+        Raises
+        ------
+        InferenceServerException
+            If unable to get model configuration.
+
+        """
+        try:
+            request = grpc_service_v2_pb2.ModelConfigRequest(
+                name=model_name,
+                version=model_version)
+            response = await self._client_stub.ModelConfig(request)
+            if as_json:
+                return json.loads(MessageToJson(response))
+            else:
+                return response
+        except aio.AioRpcError as rpc_error:
+            raise_error_grpc(rpc_error)
+
+    async def infer(self,
+                    inputs,
+                    outputs,
+                    model_name,
+                    model_version="",
+                    request_id=None,
+                    sequence_id=0,
+                    compression_algorithm=None):
+        """Run inference using the supplied 'inputs' requesting the
+        outputs specified by 'outputs'. Each call sends its own request,
+        so calls can be issued concurrently, e.g. with asyncio.gather().
+
+        Parameters
+        ----------
+        inputs : list
+            A list of InferInput objects, each describing data for a input
+            tensor required by the model.
+        outputs : list
+            A list of InferOutput objects, each describing how the output
+            data must be returned. Only the output tensors present in the
+            list will be requested from the server.
+        model_name: str
+            The name of the model to run inference.
+        model_version: str
+            The version of the model to run inference. The default value
+            is an empty string which means then the server will choose
+            a version based on the model and internal policy.
+        request_id: str
+            Optional identifier for the request. If specified will be returned
+            in the response. Default value is 'None' which means no request_id
+            will be used.
+        sequence_id : int
+            The sequence ID of the inference request. Default is 0, which
+            indicates that the request is not part of a sequence. The
+            sequence ID is used to indicate that two or more inference
+            requests are in the same sequence.
+        compression_algorithm : str
+            The compression applied to the request, 'gzip' or 'deflate'.
+            Default value is None, which sends the request uncompressed.
+
+        Returns
+        -------
+        InferResult
+            The object holding the result of the inference, including the
+            statistics.
+
+        Raises
+        ------
+        InferenceServerException
+            If server fails to perform inference.
+        """
+
+        compression = _get_compression(compression_algorithm)
+        request = _encode_inference_request(inputs, outputs, model_name,
+                                            model_version, request_id,
+                                            sequence_id)
+
+        try:
+            response = await self._model_infer(request,
+                                               compression=compression)
+            return InferResult(response)
+        except aio.AioRpcError as rpc_error:
+            raise_error_grpc(rpc_error)
+
+    async def stream_infer(self, requests_iterator):
+        """Run inference for each of the requests produced by
+        'requests_iterator' over a single bidirectional gRPC stream.
+
+        Parameters
+        ----------
+        requests_iterator : async iterator
+            An async iterator that yields one dict per request. Each
+            dict holds the keyword arguments of infer(): 'inputs',
+            'outputs' and 'model_name', and optionally 'model_version',
+            'request_id' and 'sequence_id'. The stream is closed once
+            the iterator is exhausted.
+
+        Returns
+        -------
+        async iterator
+            An async iterator that yields a (result, error) tuple for
+            each request, in the same order as the requests were
+            produced. 'result' is the InferResult for the request, or
+            None if the request failed in which case 'error' holds the
+            InferenceServerException describing the failure. The
+            request_id of each request is returned in the id of its
+            response.
+
+        Raises
+        ------
+        InferenceServerException
+            If the stream fails.
+        """
+
+        async def _request_iterator():
+            async for request in requests_iterator:
+                yield _get_inference_request(
+                    request['inputs'], request['outputs'],
+                    request['model_name'], request.get('model_version', ""),
+                    request.get('request_id'), request.get('sequence_id', 0))
+
+        try:
+            call = self._client_stub.ModelStreamInfer(_request_iterator())
+            async for response in call:
+                if response.error_message != "":
+                    error = InferenceServerException(
+                        msg=response.error_message)
+                    yield None, error
+                else:
+                    yield InferResult(response.infer_response), None
+        except aio.AioRpcError as rpc_error:
+            raise_error_grpc(rpc_error)
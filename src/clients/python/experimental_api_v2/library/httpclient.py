@@ -26,11 +26,34 @@
 
 from geventhttpclient import HTTPClient
 from geventhttpclient.url import URL
+import gevent.pool
+import numpy as np
 import rapidjson as json
 from google.protobuf import text_format
 
 import tensorrtserver.api.request_status_pb2 as request_status
-from tensorrtserverV2.common import *
+from tritonhttpclient.utils import *
+
+
+# The header holding the size of the JSON inference header at the
+# start of a request or response body that also carries binary tensor
+# data.
+_HEADER_CONTENT_LENGTH = 'Inference-Header-Content-Length'
+
+
+def _raise_if_infer_error(response):
+    """
+    Raise InferenceServerException if the inference 'response' is
+    not successful.
+    """
+    if response.status_code != 200:
+        body = response.read()
+        try:
+            msg = json.loads(body)['error']
+        except Exception:
+            msg = body.decode('utf-8', errors='replace')
+        raise InferenceServerException(msg=msg,
+                                       status=str(response.status_code))
 
 
 def raise_if_error(nv_status):
@@ -55,8 +78,9 @@ class InferenceServerClient:
         The inference server URL, e.g. 'localhost:8000'.
 
     connection_count : int
-        The number of connections to create for this client.
-        Default value is 1.
+        The number of connections to create for this client. This is
+        also the number of async_infer() requests that can be in flight
+        at the same time. Default value is 1.
 
     connection_timeout : float
         The timeout value for the connection. Default value
@@ -89,6 +113,7 @@ class InferenceServerClient:
             concurrency=connection_count,
             connection_timeout=connection_timeout,
             network_timeout=network_timeout)
+        self._pool = gevent.pool.Pool(connection_count)
         self.verbose = verbose
 
     def __enter__(self):
@@ -105,6 +130,7 @@ class InferenceServerClient:
         will result in an Error.
 
         """
+        self._pool.join()
         self._client_stub.close()
 
     def get_last_request_id(self):
@@ -271,34 +297,485 @@ class InferenceServerClient:
         return None
 
 
-#def infer(self, inputs, outputs, model_name, model_version=-1, batch_size=1, flags=0, correlation_id=0):
-#    """Run inference using the supplied 'inputs' to calculate the outputs
-#    specified by 'outputs'.
-#       Parameters
-#    ----------
-#    inputs : list
-#        A list of InferInput objects, each describing data for a input
-#        tensor required by the model.
-#       outputs : list
-#        A list of InferOutput objects, each describing how the output
-#        data must be returned. Only the output tensors present in the
-#        list will be requested from the server.
-#       batch_size : int
-#        The batch size of the inference. Each input must provide
-#        an appropriately sized batch of inputs.
-#       flags : int
-#        The flags to use for the inference. The bitwise-or of
-#        InferRequestHeader.Flag values.
-#       corr_id : int
-#        The correlation id of the inference. Used to differentiate
-#        sequences.
-#       Returns
-#    -------
-#    InferResult
-#        The object holding the result of the inference, including the
-#        statistics.
-#       Raises
-#    ------
-#    InferenceServerException
-#        If server fails to perform inference.
-#       """
+    def infer(self,
+              inputs,
+              outputs,
+              model_name,
+              model_version="",
+              request_id=None,
+              sequence_id=0):
+        """Run synchronous inference using the supplied 'inputs' requesting
+        the outputs specified by 'outputs'.
+
+        Parameters
+        ----------
+        inputs : list
+            A list of InferInput objects, each describing data for a input
+            tensor required by the model.
+        outputs : list
+            A list of InferOutput objects, each describing how the output
+            data must be returned. Only the output tensors present in the
+            list will be requested from the server.
+        model_name: str
+            The name of the model to run inference.
+        model_version: str
+            The version of the model to run inference. The default value
+            is an empty string which means then the server will choose
+            a version based on the model and internal policy.
+        request_id: str
+            Optional identifier for the request. If specified will be returned
+            in the response. Default value is 'None' which means no request_id
+            will be used.
+        sequence_id : int
+            The sequence ID of the inference request. Default is 0, which
+            indicates that the request is not part of a sequence. The
+            sequence ID is used to indicate that two or more inference
+            requests are in the same sequence.
+
+        Returns
+        -------
+        InferResult
+            The object holding the result of the inference.
+
+        Raises
+        ------
+        InferenceServerException
+            If server fails to perform inference.
+        """
+        request_uri, request_body, headers = _get_inference_request(
+            inputs, outputs, model_name, model_version, request_id,
+            sequence_id)
+        return self._infer(request_uri, request_body, headers)
+
+    def async_infer(self,
+                    inputs,
+                    outputs,
+                    model_name,
+                    model_version="",
+                    request_id=None,
+                    sequence_id=0):
+        """Run asynchronous inference using the supplied 'inputs' requesting
+        the outputs specified by 'outputs'. The requests are sent on the
+        connections of the client, so up to 'connection_count' requests
+        are in flight at the same time and any further requests wait for
+        a connection to become available.
+
+        Parameters
+        ----------
+        inputs : list
+            A list of InferInput objects, each describing data for a input
+            tensor required by the model.
+        outputs : list
+            A list of InferOutput objects, each describing how the output
+            data must be returned. Only the output tensors present in the
+            list will be requested from the server.
+        model_name: str
+            The name of the model to run inference.
+        model_version: str
+            The version of the model to run inference. The default value
+            is an empty string which means then the server will choose
+            a version based on the model and internal policy.
+        request_id: str
+            Optional identifier for the request. If specified will be returned
+            in the response. Default value is 'None' which means no request_id
+            will be used.
+        sequence_id : int
+            The sequence ID of the inference request. Default is 0, which
+            indicates that the request is not part of a sequence. The
+            sequence ID is used to indicate that two or more inference
+            requests are in the same sequence.
+
+        Returns
+        -------
+        InferAsyncRequest
+            The handle to the request, used to retrieve its InferResult.
+
+        Raises
+        ------
+        InferenceServerException
+            If server fails to issue inference.
+        """
+        request_uri, request_body, headers = _get_inference_request(
+            inputs, outputs, model_name, model_version, request_id,
+            sequence_id)
+
+        def wrapped_infer():
+            # Return rather than raise the error so that gevent does not
+            # report it as an unhandled greenlet failure.
+            try:
+                return self._infer(request_uri, request_body, headers), None
+            except InferenceServerException as error:
+                return None, error
+
+        greenlet = self._pool.apply_async(wrapped_infer)
+        return InferAsyncRequest(greenlet)
+
+    def _infer(self, request_uri, request_body, headers):
+        """Sends the inference request and returns its InferResult.
+        """
+        if self.verbose:
+            print("POST {}, headers {}".format(request_uri, headers))
+        response = self._client_stub.post(request_uri, request_body, headers)
+        _raise_if_infer_error(response)
+        result = InferResult(response)
+        if self.verbose:
+            print(result.get_response())
+        return result
+
+
+def _get_inference_request(inputs, outputs, model_name, model_version,
+                           request_id, sequence_id):
+    """Creates an inference request. The JSON inference header is
+    followed in the body by the binary data of the inputs, in the order
+    of 'inputs', so tensors are never JSON encoded.
+
+    Parameters
+    ----------
+    inputs : list
+        A list of InferInput objects, each describing data for a input
+        tensor required by the model.
+    outputs : list
+        A list of InferOutput objects, each describing how the output
+        data must be returned. Only the output tensors present in the
+        list will be requested from the server.
+    model_name: str
+        The name of the model to run inference.
+    model_version: str
+        The version of the model to run inference.
+    request_id: str
+        Optional identifier for the request.
+    sequence_id : int
+        The sequence ID of the inference request.
+
+    Returns
+    -------
+    (str, bytes, dict)
+        The URI, the body and the headers of the request.
+    """
+    if model_version != "":
+        request_uri = "/v2/models/{}/versions/{}/infer".format(
+            model_name, model_version)
+    else:
+        request_uri = "/v2/models/{}/infer".format(model_name)
+
+    infer_request = {}
+    if request_id != None:
+        infer_request['id'] = request_id
+    if sequence_id:
+        infer_request['parameters'] = {'sequence_id': sequence_id}
+    infer_request['inputs'] = [
+        infer_input._get_tensor() for infer_input in inputs
+    ]
+    if outputs:
+        infer_request['outputs'] = [
+            infer_output._get_tensor() for infer_output in outputs
+        ]
+
+    request_json = json.dumps(infer_request).encode('utf-8')
+    binary_data = [infer_input._get_binary_data() for infer_input in inputs]
+    binary_data = [data for data in binary_data if data is not None]
+    if not binary_data:
+        return request_uri, request_json, {}
+
+    headers = {_HEADER_CONTENT_LENGTH: str(len(request_json))}
+    return request_uri, b''.join([request_json] + binary_data), headers
+
+
+class InferInput:
+    """An object of InferInput class is used to describe
+    input tensor for an inference request.
+
+    Parameters
+    ----------
+    name : str
+        The name of input whose data will be described by this object
+
+    """
+
+    def __init__(self, name):
+        self._input = {'name': name}
+        self._raw_data = None
+
+    def name(self):
+        """Get the name of input associated with this object.
+
+        Returns
+        -------
+        str
+            The name of input
+        """
+        return self._input['name']
+
+    def datatype(self):
+        """Get the datatype of input associated with this object.
+
+        Returns
+        -------
+        str
+            The datatype of input
+        """
+        return self._input.get('datatype')
+
+    def shape(self):
+        """Get the shape of input associated with this object.
+
+        Returns
+        -------
+        list
+            The shape of input
+        """
+        return self._input.get('shape')
+
+    def set_data_from_numpy(self, input_tensor, binary_data=True):
+        """Set the tensor data (datatype, shape, contents) from the
+        specified numpy array for input associated with this object.
+        For binary data a C-contiguous array is not copied but
+        referenced until the request is sent, so it must not be
+        modified before then.
+
+        Parameters
+        ----------
+        input_tensor : numpy array
+            The tensor data in numpy array format
+        binary_data : bool
+            If True the tensor data is sent as binary data following the
+            JSON inference header in the request body, otherwise it is
+            sent as a JSON list. Default value is True.
+        """
+        if not isinstance(input_tensor, (np.ndarray,)):
+            raise_error("input_tensor must be a numpy array")
+        self._input['datatype'] = np_to_triton_dtype(input_tensor.dtype)
+        self._input['shape'] = list(input_tensor.shape)
+        self._input.pop('data', None)
+        self._input.pop('parameters', None)
+        self._raw_data = None
+
+        if binary_data:
+            if self._input['datatype'] == "BYTES":
+                self._raw_data = serialize_byte_tensor(input_tensor)
+            else:
+                self._raw_data = np.ascontiguousarray(input_tensor)
+            self._raw_data = self._raw_data.reshape(-1).view(np.uint8)
+            self._input['parameters'] = {
+                'binary_data_size': self._raw_data.nbytes
+            }
+        else:
+            if self._input['datatype'] == "BYTES":
+                self._input['data'] = [
+                    obj.decode('utf-8') if isinstance(obj, bytes) else str(obj)
+                    for obj in input_tensor.flat
+                ]
+            else:
+                self._input['data'] = input_tensor.flatten().tolist()
+
+    def _get_tensor(self):
+        """Retrieve the JSON description of the input tensor.
+        Returns
+        -------
+        dict
+            The input tensor as it appears in the JSON inference header.
+        """
+        return self._input
+
+    def _get_binary_data(self):
+        """Retrieve the binary data of the input tensor.
+        Returns
+        -------
+        numpy array
+            The binary data of the input tensor as a 1-D array of type
+            uint8, or None if the data is included in the JSON
+            inference header.
+        """
+        return self._raw_data
+
+
+class InferOutput:
+    """An object of InferOutput class is used to describe a
+    requested output tensor for an inference request.
+
+    Parameters
+    ----------
+    name : str
+        The name of output tensor to associate with this object
+    binary_data : bool
+        If True the server returns the tensor data as binary data
+        following the JSON inference header in the response body,
+        otherwise as a JSON list. Default value is True.
+    """
+
+    def __init__(self, name, binary_data=True):
+        self._output = {'name': name}
+        if binary_data:
+            self._output['parameters'] = {'binary_data': True}
+
+    def name(self):
+        """Get the name of output associated with this object.
+
+        Returns
+        -------
+        str
+            The name of output
+        """
+        return self._output['name']
+
+    def set_parameter(self, key, value):
+        """Adds the specified key-value pair in the requested output parameters
+
+        Parameters
+        ----------
+        key : str
+            The name of the parameter to be included in the request.
+        value : str/int/bool
+            The value of the parameter
+
+        """
+        if not type(key) is str:
+            raise_error(
+                "only string data type for key is supported in parameters")
+        if not type(value) in (str, int, bool):
+            raise_error("unsupported value type for the parameter")
+        self._output.setdefault('parameters', {})[key] = value
+
+    def _get_tensor(self):
+        """Retrieve the JSON description of the requested output.
+        Returns
+        -------
+        dict
+            The requested output as it appears in the JSON inference
+            header.
+        """
+        return self._output
+
+
+class InferAsyncRequest:
+    """An object of InferAsyncRequest class is used to describe
+    a handle to an ongoing asynchronous inference request.
+
+    Parameters
+    ----------
+    greenlet : gevent.Greenlet
+        The greenlet that sends the request and returns the InferResult
+        and the error, if any, of its response.
+    """
+
+    def __init__(self, greenlet):
+        self._greenlet = greenlet
+
+    def get_result(self, block=True, timeout=None):
+        """Get the results of the associated asynchronous inference.
+
+        Parameters
+        ----------
+        block : bool
+            If block is True, the function will wait till the
+            corresponding response is received from the server.
+            Default value is True.
+        timeout : float
+            The maximum wait time in seconds for the response when
+            'block' is True. Default value is None, which waits
+            without limit.
+
+        Returns
+        -------
+        InferResult
+            The object holding the result of the async inference, or
+            None if 'block' is False and the response is not yet
+            available.
+
+        Raises
+        ------
+        InferenceServerException
+            If server fails to perform inference, or if 'timeout'
+            expires before the response is received.
+        """
+        if not block and not self._greenlet.ready():
+            return None
+        try:
+            result, error = self._greenlet.get(block=block, timeout=timeout)
+        except gevent.Timeout:
+            raise_error("timed out waiting for the inference response")
+        if error is not None:
+            raise error
+        return result
+
+
+class InferResult:
+    """An object of InferResult class holds the response of
+    an inference request and provide methods to retrieve
+    inference results.
+
+    Parameters
+    ----------
+    response : geventhttpclient response
+        The response of the inference request
+    """
+
+    def __init__(self, response):
+        body = response.read()
+        header_length = response.get(_HEADER_CONTENT_LENGTH)
+        if header_length is None:
+            self._result = json.loads(body)
+            self._buffer = None
+        else:
+            header_length = int(header_length)
+            self._result = json.loads(body[:header_length])
+            self._buffer = memoryview(body)[header_length:]
+
+        # Locate the binary data of each output. The binary data of the
+        # outputs follows the JSON inference header in the order the
+        # outputs appear in the header.
+        self._output_data = {}
+        offset = 0
+        for output in self._result.get('outputs', []):
+            parameters = output.get('parameters', {})
+            if 'binary_data_size' in parameters:
+                if self._buffer is None:
+                    raise_error("missing binary data for output '" +
+                                output['name'] + "'")
+                end = offset + parameters['binary_data_size']
+                self._output_data[output['name']] = self._buffer[offset:end]
+                offset = end
+
+    def as_numpy(self, name):
+        """Get the tensor data for output associated with this object
+        in numpy format
+
+        Parameters
+        ----------
+        name : str
+            The name of the output tensor whose result is to be retrieved.
+
+        Returns
+        -------
+        numpy array
+            The numpy array containing the response data for the tensor or
+            None if the data for specified tensor name is not found.
+        """
+        for output in self._result.get('outputs', []):
+            if output['name'] == name:
+                datatype = output['datatype']
+                shape = output['shape']
+                if name in self._output_data:
+                    if datatype == 'BYTES':
+                        np_array = deserialize_bytes_tensor(
+                            self._output_data[name])
+                    else:
+                        np_array = np.frombuffer(
+                            self._output_data[name],
+                            dtype=triton_to_np_dtype(datatype))
+                else:
+                    np_array = np.array(output['data'],
+                                        dtype=triton_to_np_dtype(datatype))
+                return np_array.reshape(shape)
+        return None
+
+    def get_response(self):
+        """Retrieves the JSON inference header of the response.
+
+        Returns
+        -------
+        dict
+            The JSON inference header of the response, describing the
+            model and the outputs of the inference.
+        """
+        return self._result
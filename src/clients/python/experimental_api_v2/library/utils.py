@@ -24,13 +24,17 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from collections import OrderedDict
 import numpy as np
 import struct
+import threading
+import time
 
 __all__ = [
     'raise_error', 'np_to_triton_dtype', 'triton_to_np_dtype',
     'InferenceServerException', 'serialize_byte_tensor',
-    'deserialize_bytes_tensor'
+    'deserialize_bytes_tensor', 'deserialize_bytes_tensor_offsets',
+    'ResponseCache'
 ]
 
 
@@ -164,6 +168,59 @@ def triton_to_np_dtype(dtype):
     return None
 
 
+# Inputs with fewer elements than this are serialized without the
+# vectorized fast paths.
+_MIN_VECTORIZED_ELEMENTS = 64
+
+
+def _serialize_fixed_width_bytes(input_tensor):
+    # Each np.bytes_ element occupies 'itemsize' bytes padded with trailing
+    # nulls, which are not part of the element value. Lay every element out
+    # as a row of [4-byte length | padded value] and then keep only the
+    # significant bytes of each row, all without a per-element loop.
+    count = input_tensor.size
+    width = input_tensor.dtype.itemsize
+    values = np.ascontiguousarray(input_tensor).view(np.uint8).reshape(
+        count, width)
+
+    nonzero = values != 0
+    lengths = np.where(nonzero.any(axis=1),
+                       width - np.argmax(nonzero[:, ::-1], axis=1), 0)
+
+    rows = np.empty((count, 4 + width), dtype=np.uint8)
+    rows[:, :4] = lengths.astype('<u4').view(np.uint8).reshape(count, 4)
+    rows[:, 4:] = values
+    return rows[np.arange(4 + width) < (lengths[:, None] + 4)]
+
+
+def _serialize_variable_width_bytes(elements):
+    # Compute all lengths up front, then scatter the lengths and the
+    # concatenated element bytes into a single preallocated buffer. The
+    # setup cost of the vectorized scatter dominates for few elements so
+    # those are simply joined.
+    count = len(elements)
+    if count < _MIN_VECTORIZED_ELEMENTS:
+        pieces = list()
+        for s in elements:
+            pieces.append(struct.pack("<I", len(s)))
+            pieces.append(s)
+        return np.frombuffer(b''.join(pieces), dtype=np.uint8)
+
+    lengths = np.fromiter(map(len, elements), dtype='<u4', count=count)
+    data = np.frombuffer(b''.join(elements), dtype=np.uint8)
+
+    flattened = np.empty(4 * count + data.size, dtype=np.uint8)
+    prefix_offsets = np.arange(count, dtype=np.int64) * 4
+    prefix_offsets[1:] += np.cumsum(lengths[:-1], dtype=np.int64)
+    prefix_positions = (prefix_offsets[:, None] + np.arange(4)).ravel()
+
+    is_prefix = np.zeros(flattened.size, dtype=np.bool_)
+    is_prefix[prefix_positions] = True
+    flattened[prefix_positions] = lengths.view(np.uint8)
+    flattened[~is_prefix] = data
+    return flattened
+
+
 def serialize_byte_tensor(input_tensor):
     """
         Serializes a bytes tensor into a flat numpy array of length prepend bytes.
@@ -193,31 +250,87 @@ def serialize_byte_tensor(input_tensor):
     # a 1-dimensional array containing the 4-byte byte size followed by the
     # actual element bytes. All elements are concatenated together in "C"
     # order.
-    if (input_tensor.dtype == np.object) or (
-            input_tensor.dtype.type == np.bytes_):
-        flattened = bytes()
-        for obj in np.nditer(input_tensor, flags=["refs_ok"], order='C'):
-            # If directly passing bytes to BYTES type,
-            # don't convert it to str as Python will encode the
-            # bytes which may distort the meaning
-            if obj.dtype.type == np.bytes_:
-                if type(obj.item()) == bytes:
-                    s = obj.item()
-                else:
-                    s = bytes(obj)
-            else:
-                s = str(obj).encode('utf-8')
-            flattened += struct.pack("<I", len(s))
-            flattened += s
-        flattened_array = np.asarray(flattened)
-        if not flattened_array.flags['C_CONTIGUOUS']:
-            flattened_array = np.ascontiguousarray(flattened_array)
-        return flattened_array
+    if input_tensor.dtype.type == np.str_:
+        input_tensor = np.char.encode(input_tensor, 'utf-8')
+
+    if input_tensor.dtype.type == np.bytes_:
+        # Fixed-width bytes are handled entirely with vectorized operations.
+        # Small inputs go through tolist(), which drops the trailing null
+        # padding in the same way.
+        if input_tensor.size >= _MIN_VECTORIZED_ELEMENTS:
+            return _serialize_fixed_width_bytes(input_tensor)
+        return _serialize_variable_width_bytes(input_tensor.ravel().tolist())
+    elif input_tensor.dtype == np.object:
+        # Python objects are converted with str(), so bytes objects are
+        # serialized using their string representation.
+        return _serialize_variable_width_bytes(
+            [str(obj).encode('utf-8') for obj in input_tensor.flat])
     else:
         raise_error("cannot serialize bytes tensor: invalid datatype")
     return None
 
 
+def _bytes_tensor_offsets(data, start=0, count=None):
+    # Elements of uniform length, e.g. fixed size tokens, can be located
+    # and validated without visiting each element.
+    end = data.size
+    if end - start >= 4:
+        stride = 4 + int(data[start:start + 4].view('<u4')[0])
+        uniform_count = (end - start) // stride if count is None else count
+        uniform_end = start + uniform_count * stride
+        if (uniform_end <= end) and ((count is not None) or
+                                     (uniform_end == end)):
+            prefixes = data[start:uniform_end].reshape(uniform_count,
+                                                       stride)[:, :4]
+            if np.all(prefixes == data[start:start + 4]):
+                return start + np.arange(uniform_count + 1,
+                                         dtype=np.int64) * stride
+
+    # Otherwise walk the length prefixes, one unpack per element.
+    unpack_from = struct.Struct("<I").unpack_from
+    buf = memoryview(data)
+    offsets = [start]
+    offset = start
+    while (offset < end) if count is None else (len(offsets) <= count):
+        if offset + 4 > end:
+            raise_error("invalid BYTES tensor: truncated length prefix")
+        offset += 4 + unpack_from(buf, offset)[0]
+        offsets.append(offset)
+    if offset > end:
+        raise_error("invalid BYTES tensor: element exceeds buffer")
+    return np.array(offsets, dtype=np.int64)
+
+
+def deserialize_bytes_tensor_offsets(encoded_tensor):
+    """
+    Locates the elements of an encoded bytes tensor without copying
+    or decoding them.
+
+    Parameters
+    ----------
+    encoded_tensor : bytes
+        The encoded bytes tensor where each element
+        has its length in first 4 bytes followed by
+        the content
+
+    Returns
+    -------
+    (data, offsets) : (np.array, np.array)
+        'data' is a 1-D numpy array of type uint8 that is a view of
+        'encoded_tensor'. 'offsets' is a 1-D numpy array of type int64
+        with one more entry than the number of elements, such that the
+        content of element i is data[offsets[i] + 4:offsets[i + 1]].
+
+    Raises
+    ------
+    InferenceServerException
+        If 'encoded_tensor' is not a valid encoded bytes tensor.
+
+    """
+    data = np.frombuffer(encoded_tensor, dtype=np.uint8)
+    return data, _bytes_tensor_offsets(data)
+
+
 def deserialize_bytes_tensor(encoded_tensor):
     """
     Deserializes an encoded bytes tensor into an
@@ -236,13 +349,154 @@ def deserialize_bytes_tensor(encoded_tensor):
         deserialized bytes in 'C' order.
    
     """
-    strs = list()
-    offset = 0
-    val_buf = encoded_tensor
-    while offset < len(val_buf):
-        l = struct.unpack_from("<I", val_buf, offset)[0]
-        offset += 4
-        sb = struct.unpack_from("<{}s".format(l), val_buf, offset)[0]
-        offset += l
-        strs.append(sb)
-    return (np.array(strs, dtype=str))
+    data, offsets = deserialize_bytes_tensor_offsets(encoded_tensor)
+    if not isinstance(encoded_tensor, bytes):
+        encoded_tensor = data.tobytes()
+    string_tensor = np.empty(offsets.size - 1, dtype=np.object)
+    string_tensor[:] = [
+        encoded_tensor[begin:end]
+        for begin, end in zip((offsets[:-1] + 4).tolist(), offsets[1:].tolist())
+    ]
+    return string_tensor
+
+
+class _InflightResponse:
+    """The response of a request in flight, shared with the identical
+    requests issued before it completes.
+    """
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class ResponseCache:
+    """A ResponseCache object holds the responses of inference requests
+    so that repeating a request returns the held response without
+    contacting the server. Responses are evicted in least recently used
+    order to stay within the byte budget of the cache and expire once
+    they are older than the time to live. Identical requests issued
+    while the first one is in flight wait for its response instead of
+    being sent to the server.
+
+    The cache must only be used with deterministic models, i.e. models
+    that always produce the same outputs for the same inputs. A cache
+    can be shared by multiple clients and threads.
+
+    Parameters
+    ----------
+    max_byte_size : int
+        The maximum total size, in bytes, of the responses held by
+        the cache.
+    ttl_s : float
+        The time, in seconds, after which a held response expires.
+        Default value is None, which means responses never expire.
+
+    """
+
+    def __init__(self, max_byte_size, ttl_s=None):
+        self._max_byte_size = max_byte_size
+        self._ttl_s = ttl_s
+        self._lock = threading.Lock()
+        # key -> (value, byte size, expiry time) in LRU order
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._byte_size = 0
+        self._hit_count = 0
+        self._miss_count = 0
+        self._collapsed_count = 0
+        self._eviction_count = 0
+
+    def get_stats(self):
+        """Get the statistics of the cache.
+
+        Returns
+        -------
+        dict
+            The 'hit_count' and 'miss_count' of the lookups, the
+            'collapsed_count' of the requests that waited for an
+            identical request in flight, the 'eviction_count' of the
+            responses evicted to stay within the byte budget, and the
+            'entry_count' and 'byte_size' of the held responses.
+
+        """
+        with self._lock:
+            return {
+                'hit_count': self._hit_count,
+                'miss_count': self._miss_count,
+                'collapsed_count': self._collapsed_count,
+                'eviction_count': self._eviction_count,
+                'entry_count': len(self._entries),
+                'byte_size': self._byte_size
+            }
+
+    def clear(self):
+        """Remove all the responses held by the cache.
+
+        """
+        with self._lock:
+            self._entries.clear()
+            self._byte_size = 0
+
+    def _get_or_compute(self, key, compute, byte_size_fn):
+        """Returns the response held for 'key'. On a miss the response
+        is produced by 'compute', which runs once for all the identical
+        requests in flight, and is held if it fits the byte budget.
+        Errors are raised to every waiting request and not held.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if (entry[2] is None) or (time.monotonic() < entry[2]):
+                    self._entries.move_to_end(key)
+                    self._hit_count += 1
+                    return entry[0]
+                self._remove(key)
+
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                self._collapsed_count += 1
+                leader = False
+            else:
+                self._miss_count += 1
+                inflight = _InflightResponse()
+                self._inflight[key] = inflight
+                leader = True
+
+        if not leader:
+            inflight.event.wait()
+            if inflight.error is not None:
+                raise inflight.error
+            return inflight.value
+
+        try:
+            inflight.value = compute()
+        except BaseException as e:
+            inflight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+                if inflight.error is None:
+                    self._insert(key, inflight.value,
+                                 byte_size_fn(inflight.value))
+            inflight.event.set()
+        return inflight.value
+
+    def _insert(self, key, value, byte_size):
+        if byte_size > self._max_byte_size:
+            return
+        if key in self._entries:
+            self._remove(key)
+        expiry = None if self._ttl_s is None else time.monotonic(
+        ) + self._ttl_s
+        self._entries[key] = (value, byte_size, expiry)
+        self._byte_size += byte_size
+        while self._byte_size > self._max_byte_size:
+            self._remove(next(iter(self._entries)))
+            self._eviction_count += 1
+
+    def _remove(self, key):
+        _, byte_size, _ = self._entries.pop(key)
+        self._byte_size -= byte_size
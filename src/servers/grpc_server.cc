@@ -1831,7 +1831,8 @@ TRTSERVER_Error*
 GRPCServer::Create(
     const std::shared_ptr<TRTSERVER_Server>& server,
     const std::shared_ptr<nvidia::inferenceserver::TraceManager>& trace_manager,
-    const std::shared_ptr<SharedMemoryManager>& shm_manager, int32_t port,
+    const std::shared_ptr<SharedMemoryManager>& shm_manager,
+    const std::string& address, int32_t port,
     int infer_thread_cnt, int stream_infer_thread_cnt,
     int infer_allocation_pool_size, std::unique_ptr<GRPCServer>* grpc_server)
 {
@@ -1842,7 +1843,11 @@ GRPCServer::Create(
     TRTSERVER_ErrorDelete(err);
   }
 
-  const std::string addr = "0.0.0.0:" + std::to_string(port);
+  // A unix domain socket address ("unix:<path>") is used as is, any
+  // other address is combined with the port.
+  const std::string addr = (address.compare(0, 5, "unix:") == 0)
+                               ? address
+                               : address + ":" + std::to_string(port);
   grpc_server->reset(new GRPCServer(
       server, trace_manager, shm_manager, server_id, addr, infer_thread_cnt,
       stream_infer_thread_cnt, infer_allocation_pool_size));
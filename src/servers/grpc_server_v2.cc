@@ -1540,6 +1540,94 @@ InferGRPCToInput(
   return nullptr;  // success
 }
 
+TRTSERVER_Error*
+InferResponseToGRPC(
+    TRTSERVER_InferenceResponse* trtserver_response,
+    ModelInferResponse& response)
+{
+  InferResponseHeader response_header;
+
+  TRTSERVER_Error* err = TRTSERVER_InferenceResponseStatus(trtserver_response);
+  if (err == nullptr) {
+    TRTSERVER_Protobuf* response_protobuf = nullptr;
+    err = TRTSERVER_InferenceResponseHeader(
+        trtserver_response, &response_protobuf);
+    if (err == nullptr) {
+      const char* buffer;
+      size_t byte_size;
+      err = TRTSERVER_ProtobufSerialize(response_protobuf, &buffer, &byte_size);
+      if (err == nullptr) {
+        if (!response_header.ParseFromArray(buffer, byte_size)) {
+          err = TRTSERVER_ErrorNew(
+              TRTSERVER_ERROR_INTERNAL, "failed to parse response header");
+        }
+      }
+
+      TRTSERVER_ProtobufDelete(response_protobuf);
+    }
+  }
+
+  const char* id;
+  if (err == nullptr) {
+    err = TRTSERVER_InferenceResponseIdStr(trtserver_response, &id);
+  }
+
+  // Convert the InferResponseHeader to the V2 response
+  if (err == nullptr) {
+    response.set_model_name(response_header.model_name());
+    response.set_model_version(std::to_string(response_header.model_version()));
+    response.set_id(id);
+    for (const auto& io : response_header.output()) {
+      // Find the tensor in the response and set its shape.
+      for (auto& output : *(response.mutable_outputs())) {
+        if (output.name() == io.name()) {
+          if (io.batch_classes().size() == 0) {
+            for (const auto d : io.raw().dims()) {
+              output.add_shape(d);
+            }
+            output.set_datatype(GetDataTypeProtocolString(io.data_type()));
+          } else {
+            int cls_count = 0;
+            for (const auto& classes : io.batch_classes()) {
+              cls_count = classes.cls().size();
+              for (const auto& cls : classes.cls()) {
+                if (!cls.label().empty()) {
+                  output.mutable_contents()->add_byte_contents(std::string(
+                      std::to_string(cls.idx()) + ":" +
+                      std::to_string(cls.value()) + ":" + cls.label()));
+                } else {
+                  output.mutable_contents()->add_byte_contents(std::string(
+                      std::to_string(cls.idx()) + ":" +
+                      std::to_string(cls.value())));
+                }
+              }
+            }
+            output.add_shape(io.batch_classes().size());
+            output.add_shape(cls_count);
+
+            output.set_datatype("BYTES");
+          }
+          break;
+        }
+      }
+    }
+  }
+
+  // Make sure response doesn't exceed GRPC limits.
+  if ((err == nullptr) && (response.ByteSizeLong() > INT_MAX)) {
+    err = TRTSERVER_ErrorNew(
+        TRTSERVER_ERROR_INVALID_ARG,
+        std::string(
+            "Response has byte size " +
+            std::to_string(response.ByteSizeLong()) +
+            " which exceeds gRPC's byte size limit " + std::to_string(INT_MAX) +
+            ".")
+            .c_str());
+  }
+
+  return err;
+}
+
 //
 // ModelInferHandler
 //
@@ -1759,85 +1847,7 @@ ModelInferHandler::InferComplete(
                  << " step " << state->step_;
 
   ModelInferResponse& response = state->response_;
-  InferResponseHeader response_header;
-
-  TRTSERVER_Error* err = TRTSERVER_InferenceResponseStatus(trtserver_response);
-  if (err == nullptr) {
-    TRTSERVER_Protobuf* response_protobuf = nullptr;
-    err = TRTSERVER_InferenceResponseHeader(
-        trtserver_response, &response_protobuf);
-    if (err == nullptr) {
-      const char* buffer;
-      size_t byte_size;
-      err = TRTSERVER_ProtobufSerialize(response_protobuf, &buffer, &byte_size);
-      if (err == nullptr) {
-        if (!response_header.ParseFromArray(buffer, byte_size)) {
-          err = TRTSERVER_ErrorNew(
-              TRTSERVER_ERROR_INTERNAL, "failed to parse response header");
-        }
-      }
-
-      TRTSERVER_ProtobufDelete(response_protobuf);
-    }
-  }
-
-  const char* id;
-  if (err == nullptr) {
-    err = TRTSERVER_InferenceResponseIdStr(trtserver_response, &id);
-  }
-
-  // Convert the InferResponseHeader to the V2 response
-  if (err == nullptr) {
-    response.set_model_name(response_header.model_name());
-    response.set_model_version(std::to_string(response_header.model_version()));
-    response.set_id(id);
-    for (const auto& io : response_header.output()) {
-      // Find the tensor in the response and set its shape.
-      for (auto& output : *(response.mutable_outputs())) {
-        if (output.name() == io.name()) {
-          if (io.batch_classes().size() == 0) {
-            for (const auto d : io.raw().dims()) {
-              output.add_shape(d);
-            }
-            output.set_datatype(GetDataTypeProtocolString(io.data_type()));
-          } else {
-            int cls_count = 0;
-            for (const auto& classes : io.batch_classes()) {
-              cls_count = classes.cls().size();
-              for (const auto& cls : classes.cls()) {
-                if (!cls.label().empty()) {
-                  output.mutable_contents()->add_byte_contents(std::string(
-                      std::to_string(cls.idx()) + ":" +
-                      std::to_string(cls.value()) + ":" + cls.label()));
-                } else {
-                  output.mutable_contents()->add_byte_contents(std::string(
-                      std::to_string(cls.idx()) + ":" +
-                      std::to_string(cls.value())));
-                }
-              }
-            }
-            output.add_shape(io.batch_classes().size());
-            output.add_shape(cls_count);
-
-            output.set_datatype("BYTES");
-          }
-          break;
-        }
-      }
-    }
-  }
-
-  // Make sure response doesn't exceed GRPC limits.
-  if ((err == nullptr) && (response.ByteSizeLong() > INT_MAX)) {
-    err = TRTSERVER_ErrorNew(
-        TRTSERVER_ERROR_INVALID_ARG,
-        std::string(
-            "Response has byte size " +
-            std::to_string(response.ByteSizeLong()) +
-            " which exceeds gRPC's byte size limit " + std::to_string(INT_MAX) +
-            ".")
-            .c_str());
-  }
+  TRTSERVER_Error* err = InferResponseToGRPC(trtserver_response, response);
 
   if (err != nullptr) {
     response.Clear();
@@ -1864,17 +1874,17 @@ ModelInferHandler::InferComplete(
   state->context_->responder_->Finish(response, status, state);
 }
 
-#if 0
 //
-// StreamInferHandler
+// ModelStreamInferHandler
 //
-class StreamInferHandler
+class ModelStreamInferHandler
     : public Handler<
           GRPCInferenceService::AsyncService,
-          grpc::ServerAsyncReaderWriter<InferResponse, InferRequest>,
-          InferRequest, InferResponse> {
+          grpc::ServerAsyncReaderWriter<
+              ModelStreamInferResponse, ModelInferRequest>,
+          ModelInferRequest, ModelStreamInferResponse> {
  public:
-  StreamInferHandler(
+  ModelStreamInferHandler(
       const std::string& name,
       const std::shared_ptr<TRTSERVER_Server>& trtserver, const char* server_id,
       const std::shared_ptr<TraceManager>& trace_manager,
@@ -1908,7 +1918,7 @@ class StreamInferHandler
 };
 
 void
-StreamInferHandler::StartNewRequest()
+ModelStreamInferHandler::StartNewRequest()
 {
   const uint64_t unique_id = RequestStatusUtil::NextUniqueRequestId();
   auto context = std::make_shared<State::Context>(server_id_, unique_id);
@@ -1924,7 +1934,7 @@ StreamInferHandler::StartNewRequest()
   }
 #endif  // TRTIS_ENABLE_TRACING
 
-  service_->RequestStreamInfer(
+  service_->RequestModelStreamInfer(
       state->context_->ctx_.get(), state->context_->responder_.get(), cq_, cq_,
       state);
 
@@ -1933,7 +1943,7 @@ StreamInferHandler::StartNewRequest()
 }
 
 bool
-StreamInferHandler::Process(Handler::State* state, bool rpc_ok)
+ModelStreamInferHandler::Process(Handler::State* state, bool rpc_ok)
 {
   LOG_VERBOSE(1) << "Process for " << Name() << ", rpc_ok=" << rpc_ok
                  << ", context " << state->context_->unique_id_ << ", "
@@ -1962,26 +1972,6 @@ StreamInferHandler::Process(Handler::State* state, bool rpc_ok)
     state->context_->responder_->Read(&state->request_, state);
 
   } else if (state->step_ == Steps::READ) {
-    int64_t requested_model_version;
-    TRTSERVER_Error* err = GetModelVersionFromString(
-        request.model_version(), &requested_model_version);
-#ifdef TRTIS_ENABLE_TRACING
-    if (state->trace_meta_data_ != nullptr) {
-      if (err == nullptr) {
-        state->trace_meta_data_->tracer_->SetModel(
-            state->request_.model_name(), requested_model_version);
-      } else {
-        // If failed to retrieve the requested_model_version
-        // then use the default model version just to record
-        // the timestamps in the tracer
-        state->trace_meta_data_->tracer_->SetModel(
-            state->request_.model_name(), -1);
-      }
-      state->trace_meta_data_->tracer_->CaptureTimestamp(
-          TRTSERVER_TRACE_LEVEL_MIN, "grpc wait/read end");
-    }
-#endif  // TRTIS_ENABLE_TRACING
-
     // If done reading and no in-flight requests then can finish the
     // entire stream. Otherwise just finish this state.
     if (!rpc_ok) {
@@ -2001,6 +1991,28 @@ StreamInferHandler::Process(Handler::State* state, bool rpc_ok)
       return !finished;
     }
 
+    const ModelInferRequest& request = state->request_;
+    ModelInferResponse& response = *(state->response_.mutable_infer_response());
+
+    int64_t requested_model_version;
+    TRTSERVER_Error* err = GetModelVersionFromString(
+        request.model_version(), &requested_model_version);
+#ifdef TRTIS_ENABLE_TRACING
+    if (state->trace_meta_data_ != nullptr) {
+      if (err == nullptr) {
+        state->trace_meta_data_->tracer_->SetModel(
+            request.model_name(), requested_model_version);
+      } else {
+        // If failed to retrieve the requested_model_version
+        // then use the default model version just to record
+        // the timestamps in the tracer
+        state->trace_meta_data_->tracer_->SetModel(request.model_name(), -1);
+      }
+      state->trace_meta_data_->tracer_->CaptureTimestamp(
+          TRTSERVER_TRACE_LEVEL_MIN, "grpc wait/read end");
+    }
+#endif  // TRTIS_ENABLE_TRACING
+
     // Request has been successfully read so put it in the context
     // queue so that it's response is sent in the same order as the
     // request was received.
@@ -2012,10 +2024,6 @@ StreamInferHandler::Process(Handler::State* state, bool rpc_ok)
     // hold onto context here while we know it is good.
     std::shared_ptr<StateContext> context = state->context_;
 
-    // Issue the inference request into server...
-    const InferRequest& request = state->request_;
-    InferResponse& response = state->response_;
-
     // Create the inference request provider which provides all the
     // input information needed for an inference.
     TRTSERVER_InferenceRequestOptions* request_options = nullptr;
@@ -2025,8 +2033,7 @@ StreamInferHandler::Process(Handler::State* state, bool rpc_ok)
           requested_model_version);
     }
     if (err == nullptr) {
-      err = SetTRTSERVER_InferenceRequestOptions(
-          request_options, request.meta_data());
+      err = SetInferenceRequestOptions(request_options, request);
     }
 
     TRTSERVER_InferenceRequestProvider* request_provider = nullptr;
@@ -2035,19 +2042,20 @@ StreamInferHandler::Process(Handler::State* state, bool rpc_ok)
           &request_provider, trtserver_.get(), request_options);
     }
 
-    // Will be used when GRPC request contains explicit bytes tensors
+    // Will be used to hold the serialized data in case explicit string
+    // tensors are present in the request.
     AllocPayload::TensorSerializedDataMap* serialized_data_map =
         new AllocPayload::TensorSerializedDataMap();
 
     if (err == nullptr) {
       err = InferGRPCToInput(
-          trtserver_, shm_manager_, request.meta_data(), request,
-          serialized_data_map, request_provider);
+          trtserver_, shm_manager_, request, serialized_data_map,
+          request_provider);
     }
     if (err == nullptr) {
       err = InferAllocatorPayload(
-          trtserver_, shm_manager_, request.meta_data(), serialized_data_map,
-          response, &state->alloc_payload_);
+          trtserver_, shm_manager_, request, serialized_data_map, response,
+          &state->alloc_payload_);
     }
     if (err == nullptr) {
       // Provide the trace manager object to use for this request, if
@@ -2077,21 +2085,17 @@ StreamInferHandler::Process(Handler::State* state, bool rpc_ok)
     // state->step_ == ISSUED and inference request has
     // initiated... the completion callback will transition to
     // WRITEREADY or WRITTEN. If there was an error then enqueue the
-    // error response and show it to be ready for writing.
+    // error response and show it to be ready for writing. The error
+    // is reported in the response so that the stream can continue
+    // with the next request.
     if (err != nullptr) {
-      RequestStatusUtil::Create(
-          response.mutable_request_status(), err, state->unique_id_,
-          server_id_);
-
       LOG_VERBOSE(1) << "Infer failed: " << TRTSERVER_ErrorMessage(err);
-      TRTSERVER_ErrorDelete(err);
 
-      // Clear the meta-data and raw output as they may be partially
-      // initialized or uninitialized.
-      response.mutable_meta_data()->Clear();
-      response.mutable_raw_output()->Clear();
-
-      response.mutable_meta_data()->set_id(request.meta_data().id());
+      // Clear the response as it may be partially initialized.
+      response.Clear();
+      response.set_id(request.id());
+      state->response_.set_error_message(TRTSERVER_ErrorMessage(err));
+      TRTSERVER_ErrorDelete(err);
 
       state->step_ = Steps::WRITEREADY;
       state->context_->WriteResponseIfReady(state);
@@ -2174,76 +2178,40 @@ StreamInferHandler::Process(Handler::State* state, bool rpc_ok)
 }
 
 void
-StreamInferHandler::StreamInferComplete(
+ModelStreamInferHandler::StreamInferComplete(
     TRTSERVER_Server* server, TRTSERVER_TraceManager* trace_manager,
     TRTSERVER_InferenceResponse* trtserver_response, void* userp)
 {
   State* state = reinterpret_cast<State*>(userp);
 
-  LOG_VERBOSE(1) << "StreamInferHandler::StreamInferComplete, context "
+  LOG_VERBOSE(1) << "ModelStreamInferHandler::StreamInferComplete, context "
                  << state->context_->unique_id_ << ", " << state->unique_id_
                  << " step " << state->step_;
 
-  const InferRequest& request = state->request_;
-  InferResponse& response = state->response_;
-
-  TRTSERVER_Error* response_status =
-      TRTSERVER_InferenceResponseStatus(trtserver_response);
-  if ((response_status == nullptr) && (response.ByteSizeLong() > INT_MAX)) {
-    response_status = TRTSERVER_ErrorNew(
-        TRTSERVER_ERROR_INVALID_ARG,
-        std::string(
-            "Response has byte size " +
-            std::to_string(response.ByteSizeLong()) +
-            " which exceeds gRPC's byte size limit " + std::to_string(INT_MAX) +
-            ".")
-            .c_str());
-  }
-
-  if (response_status == nullptr) {
-    TRTSERVER_Protobuf* response_protobuf = nullptr;
-    response_status = TRTSERVER_InferenceResponseHeader(
-        trtserver_response, &response_protobuf);
-    if (response_status == nullptr) {
-      const char* buffer;
-      size_t byte_size;
-      response_status =
-          TRTSERVER_ProtobufSerialize(response_protobuf, &buffer, &byte_size);
-      if (response_status == nullptr) {
-        if (!response.mutable_meta_data()->ParseFromArray(buffer, byte_size)) {
-          response_status = TRTSERVER_ErrorNew(
-              TRTSERVER_ERROR_INTERNAL, "failed to parse response header");
-        }
-      }
-
-      TRTSERVER_ProtobufDelete(response_protobuf);
-    }
-  }
+  const ModelInferRequest& request = state->request_;
+  ModelInferResponse& response = *(state->response_.mutable_infer_response());
+  TRTSERVER_Error* err = InferResponseToGRPC(trtserver_response, response);
 
-  // If the response is an error then clear the meta-data and raw
-  // output as they may be partially initialized or uninitialized.
-  if (response_status != nullptr) {
-    response.mutable_meta_data()->Clear();
-    response.mutable_raw_output()->Clear();
+  // If the response is an error then clear it as it may be partially
+  // initialized and report the error without closing the stream.
+  if (err != nullptr) {
+    response.Clear();
+    response.set_id(request.id());
+    state->response_.set_error_message(TRTSERVER_ErrorMessage(err));
   }
 
-  RequestStatusUtil::Create(
-      response.mutable_request_status(), response_status, state->unique_id_,
-      state->context_->server_id_);
-
   // Don't need to explicitly delete 'trace_manager'. It will be deleted by
   // the TraceMetaData object in 'state'.
   LOG_TRTSERVER_ERROR(
       TRTSERVER_InferenceResponseDelete(trtserver_response),
       "deleting GRPC response");
-  TRTSERVER_ErrorDelete(response_status);
-
-  response.mutable_meta_data()->set_id(request.meta_data().id());
+  TRTSERVER_ErrorDelete(err);
 
   state->step_ = Steps::WRITEREADY;
   state->context_->WriteResponseIfReady(state);
 }
 
+#if 0
 //
 // RepositoryHandler
 //
@@ -2603,7 +2571,8 @@ TRTSERVER_Error*
 GRPCServerV2::Create(
     const std::shared_ptr<TRTSERVER_Server>& server,
     const std::shared_ptr<nvidia::inferenceserver::TraceManager>& trace_manager,
-    const std::shared_ptr<SharedMemoryManager>& shm_manager, int32_t port,
+    const std::shared_ptr<SharedMemoryManager>& shm_manager,
+    const std::string& address, int32_t port,
     int infer_allocation_pool_size, std::unique_ptr<GRPCServerV2>* grpc_server)
 {
   const char* server_id = nullptr;
@@ -2613,7 +2582,11 @@ GRPCServerV2::Create(
     TRTSERVER_ErrorDelete(err);
   }
 
-  const std::string addr = "0.0.0.0:" + std::to_string(port);
+  // A unix domain socket address ("unix:<path>") is used as is, any
+  // other address is combined with the port.
+  const std::string addr = (address.compare(0, 5, "unix:") == 0)
+                               ? address
+                               : address + ":" + std::to_string(port);
   grpc_server->reset(new GRPCServerV2(
       server, trace_manager, shm_manager, server_id, addr,
       infer_allocation_pool_size));
@@ -2640,8 +2613,8 @@ GRPCServerV2::Start()
   model_metadata_cq_ = grpc_builder_.AddCompletionQueue();
   model_config_cq_ = grpc_builder_.AddCompletionQueue();
   model_infer_cq_ = grpc_builder_.AddCompletionQueue();
-#if 0
   stream_infer_cq_ = grpc_builder_.AddCompletionQueue();
+#if 0
   repository_cq_ = grpc_builder_.AddCompletionQueue();
   modelcontrol_cq_ = grpc_builder_.AddCompletionQueue();
   shmcontrol_cq_ = grpc_builder_.AddCompletionQueue();
@@ -2698,15 +2671,15 @@ GRPCServerV2::Start()
   hmodelinfer->Start();
   model_infer_handler_.reset(hmodelinfer);
 
-#if 0
   // Handler for streaming inference requests.
-  StreamInferHandler* hstreaminfer = new StreamInferHandler(
-      "StreamInferHandler", server_, server_id_, trace_manager_, shm_manager_,
-      &service_, stream_infer_cq_.get(),
+  ModelStreamInferHandler* hstreaminfer = new ModelStreamInferHandler(
+      "ModelStreamInferHandler", server_, server_id_, trace_manager_,
+      shm_manager_, &service_, stream_infer_cq_.get(),
       infer_allocation_pool_size_ /* max_state_bucket_count */);
   hstreaminfer->Start();
   stream_infer_handler_.reset(hstreaminfer);
 
+#if 0
   // Handler for status requests.
   RepositoryHandler* hrepository = new RepositoryHandler(
       "RepositoryHandler", server_, server_id_, &service_, repository_cq_.get(),
@@ -2752,9 +2725,9 @@ GRPCServerV2::Stop()
   model_metadata_cq_->Shutdown();
   model_config_cq_->Shutdown();
   model_infer_cq_->Shutdown();
+  stream_infer_cq_->Shutdown();
 #if 0
   repository_cq_->Shutdown();
-  stream_infer_cq_->Shutdown();
   modelcontrol_cq_->Shutdown();
   shmcontrol_cq_->Shutdown();
 #endif
@@ -2768,8 +2741,8 @@ GRPCServerV2::Stop()
   dynamic_cast<ModelMetadataHandler*>(model_metadata_handler_.get())->Stop();
   dynamic_cast<ModelConfigHandler*>(model_config_handler_.get())->Stop();
   dynamic_cast<ModelInferHandler*>(model_infer_handler_.get())->Stop();
+  dynamic_cast<ModelStreamInferHandler*>(stream_infer_handler_.get())->Stop();
 #if 0
-  dynamic_cast<StreamInferHandler*>(stream_infer_handler_.get())->Stop();
   dynamic_cast<RepositoryHandler*>(repository_handler_.get())->Stop();
   dynamic_cast<ModelControlHandler*>(modelcontrol_handler_.get())->Stop();
   dynamic_cast<SharedMemoryControlHandler*>(shmcontrol_handler_.get())->Stop();
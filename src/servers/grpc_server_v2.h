@@ -39,7 +39,8 @@ class GRPCServerV2 {
       const std::shared_ptr<TRTSERVER_Server>& server,
       const std::shared_ptr<nvidia::inferenceserver::TraceManager>&
           trace_manager,
-      const std::shared_ptr<SharedMemoryManager>& shm_manager, int32_t port,
+      const std::shared_ptr<SharedMemoryManager>& shm_manager,
+      const std::string& address, int32_t port,
       int infer_allocation_pool_size,
       std::unique_ptr<GRPCServerV2>* grpc_server);
 
@@ -104,6 +104,7 @@ std::unique_ptr<nvidia::inferenceserver::GRPCServerV2> grpc_service_v2_;
 #if defined(TRTIS_ENABLE_GRPC) || defined(TRTIS_ENABLE_GRPC_V2)
 bool allow_grpc_ = true;
 int32_t api_version_ = 1;
+std::string grpc_address_ = "0.0.0.0";
 int32_t grpc_port_ = 8001;
 #endif  // TRTIS_ENABLE_GRPC || TRTIS_ENABLE_GRPC_V2
 
@@ -163,6 +164,7 @@ enum OptionId {
 #if defined(TRTIS_ENABLE_GRPC) || defined(TRTIS_ENABLE_GRPC_V2)
   OPTION_ALLOW_GRPC,
   OPTION_API_VERSION,
+  OPTION_GRPC_ADDRESS,
   OPTION_GRPC_PORT,
   OPTION_GRPC_INFER_THREAD_COUNT,
   OPTION_GRPC_STREAM_INFER_THREAD_COUNT,
@@ -263,6 +265,10 @@ std::vector<Option> options_
       {OPTION_API_VERSION, "api-version",
        "Version of the GRPC/HTTP API to use. Default is version 1. Allowed "
        "versions are 1 and 2."},
+      {OPTION_GRPC_ADDRESS, "grpc-address",
+       "The address for the server to listen on for GRPC requests. Default "
+       "is 0.0.0.0. Use unix:<path> to listen on a unix domain socket, in "
+       "which case --grpc-port is ignored."},
       {OPTION_GRPC_PORT, "grpc-port",
        "The port for the server to listen on for GRPC requests."},
       {OPTION_GRPC_INFER_THREAD_COUNT, "grpc-infer-thread-count",
@@ -376,6 +382,14 @@ SignalHandler(int signum)
   exit_cv_.notify_all();
 }
 
+#if defined(TRTIS_ENABLE_GRPC) || defined(TRTIS_ENABLE_GRPC_V2)
+bool
+IsUnixAddress(const std::string& address)
+{
+  return address.compare(0, 5, "unix:") == 0;
+}
+#endif  // TRTIS_ENABLE_GRPC || TRTIS_ENABLE_GRPC_V2
+
 bool
 CheckPortCollision()
 {
@@ -384,7 +398,8 @@ CheckPortCollision()
   // Check if HTTP and GRPC have shared ports
   if ((std::find(http_ports_.begin(), http_ports_.end(), grpc_port_) !=
        http_ports_.end()) &&
-      (grpc_port_ != -1) && allow_http_ && allow_grpc_) {
+      (grpc_port_ != -1) && !IsUnixAddress(grpc_address_) && allow_http_ &&
+      allow_grpc_) {
     std::cerr << "The server cannot listen to HTTP requests "
               << "and GRPC requests at the same port" << std::endl;
     return true;
@@ -394,8 +409,8 @@ CheckPortCollision()
 #if (defined(TRTIS_ENABLE_GRPC) || defined(TRTIS_ENABLE_GRPC_V2)) && \
     defined(TRTIS_ENABLE_METRICS)
   // Check if Metric and GRPC have shared ports
-  if ((grpc_port_ == metrics_port_) && (metrics_port_ != -1) && allow_grpc_ &&
-      allow_metrics_) {
+  if ((grpc_port_ == metrics_port_) && (metrics_port_ != -1) &&
+      !IsUnixAddress(grpc_address_) && allow_grpc_ && allow_metrics_) {
     std::cerr << "The server cannot provide metrics on same port used for "
               << "GRPC requests" << std::endl;
     return true;
@@ -426,8 +441,9 @@ StartGrpcService(
         shm_manager)
 {
   TRTSERVER_Error* err = nvidia::inferenceserver::GRPCServer::Create(
-      server, trace_manager, shm_manager, grpc_port_, grpc_infer_thread_cnt_,
-      grpc_stream_infer_thread_cnt_, grpc_infer_allocation_pool_size_, service);
+      server, trace_manager, shm_manager, grpc_address_, grpc_port_,
+      grpc_infer_thread_cnt_, grpc_stream_infer_thread_cnt_,
+      grpc_infer_allocation_pool_size_, service);
   if (err == nullptr) {
     err = (*service)->Start();
   }
@@ -450,7 +466,7 @@ StartGrpcServiceV2(
         shm_manager)
 {
   TRTSERVER_Error* err = nvidia::inferenceserver::GRPCServerV2::Create(
-      server, trace_manager, shm_manager, grpc_port_,
+      server, trace_manager, shm_manager, grpc_address_, grpc_port_,
       grpc_infer_allocation_pool_size_, service);
   if (err == nullptr) {
     err = (*service)->Start();
@@ -529,7 +545,8 @@ StartEndpoints(
 
 #ifdef TRTIS_ENABLE_GRPC
   // Enable GRPC endpoints if requested...
-  if (allow_grpc_ && (api_version_ == 1) && (grpc_port_ != -1)) {
+  if (allow_grpc_ && (api_version_ == 1) &&
+      ((grpc_port_ != -1) || IsUnixAddress(grpc_address_))) {
     TRTSERVER_Error* err =
         StartGrpcService(&grpc_service_, server, trace_manager, shm_manager);
     if (err != nullptr) {
@@ -541,7 +558,8 @@ StartEndpoints(
 
 #ifdef TRTIS_ENABLE_GRPC_V2
   // Enable GRPC V2 endpoints if requested...
-  if (allow_grpc_ && (api_version_ == 2) && (grpc_port_ != -1)) {
+  if (allow_grpc_ && (api_version_ == 2) &&
+      ((grpc_port_ != -1) || IsUnixAddress(grpc_address_))) {
     TRTSERVER_Error* err = StartGrpcServiceV2(
         &grpc_service_v2_, server, trace_manager, shm_manager);
     if (err != nullptr) {
@@ -881,6 +899,7 @@ Parse(TRTSERVER_ServerOptions* server_options, int argc, char** argv)
 #else
   int32_t api_version = 2;
 #endif  // TRTIS_ENABLE_GRPC
+  std::string grpc_address = grpc_address_;
   int32_t grpc_port = grpc_port_;
   int32_t grpc_infer_thread_cnt = grpc_infer_thread_cnt_;
   int32_t grpc_stream_infer_thread_cnt = grpc_stream_infer_thread_cnt_;
@@ -981,6 +1000,9 @@ Parse(TRTSERVER_ServerOptions* server_options, int argc, char** argv)
       case OPTION_API_VERSION:
         api_version = ParseIntOption(optarg);
         break;
+      case OPTION_GRPC_ADDRESS:
+        grpc_address = optarg;
+        break;
       case OPTION_GRPC_PORT:
         grpc_port = ParseIntOption(optarg);
         break;
@@ -1141,6 +1163,7 @@ Parse(TRTSERVER_ServerOptions* server_options, int argc, char** argv)
 
 #if defined(TRTIS_ENABLE_GRPC) || defined(TRTIS_ENABLE_GRPC_V2)
   api_version_ = api_version;
+  grpc_address_ = grpc_address;
   grpc_port_ = grpc_port;
   grpc_infer_thread_cnt_ = grpc_infer_thread_cnt;
   grpc_stream_infer_thread_cnt_ = grpc_stream_infer_thread_cnt;